@@ -0,0 +1 @@
+"""Benchmarks for the verifier (run with ``make benchmark``)."""
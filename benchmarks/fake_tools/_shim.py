@@ -0,0 +1,91 @@
+"""
+Shared implementation of the fake cosign/gh/osv-scanner executables.
+
+Each executable in this directory calls :func:`main` with its tool name. The
+first rule in ``responses.json`` whose ``args`` are a prefix of the command
+line decides the output and exit code. Latency, jitter and injected failures
+are configured through the environment, globally or per tool:
+
+    PROVENANCE_FAKE_LATENCY_MS          base latency per call (default 0)
+    PROVENANCE_FAKE_JITTER_MS           uniform jitter, +/- this much (default 0)
+    PROVENANCE_FAKE_FAILURE_RATE        probability of the tool's failure response (0-1)
+    PROVENANCE_FAKE_SEED                seed for jitter and failures (default 0)
+    PROVENANCE_FAKE_<TOOL>_LATENCY_MS   per-tool override (TOOL = COSIGN, GH, OSV_SCANNER)
+    PROVENANCE_FAKE_RESPONSES           alternative responses file
+    PROVENANCE_FAKE_LOG                 append one JSON line per call
+
+Randomness is derived from the seed, the tool and its arguments, so the same
+command always gets the same latency and outcome and runs are reproducible.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+RESPONSES = Path(__file__).resolve().parent / "responses.json"
+
+
+def _setting(tool: str, name: str, default: float) -> float:
+    prefix = "PROVENANCE_FAKE_"
+    specific = f"{prefix}{tool.upper().replace('-', '_')}_{name}"
+    value = os.environ.get(specific, os.environ.get(prefix + name))
+    if value is None or not value.strip():
+        return default
+    return float(value)
+
+
+def _load_responses() -> Dict:
+    path = os.environ.get("PROVENANCE_FAKE_RESPONSES") or RESPONSES
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _match(rules: List[Dict], argv: List[str]) -> Optional[Dict]:
+    for rule in rules:
+        prefix = rule.get("args", [])
+        if argv[:len(prefix)] == prefix:
+            return rule
+    return None
+
+
+def main(tool: str, argv: Optional[List[str]] = None) -> int:
+    """Answer one invocation of tool; returns the exit code."""
+    argv = sys.argv[1:] if argv is None else argv
+    started = time.perf_counter()
+    spec = _load_responses().get(tool, {})
+
+    seed = os.environ.get("PROVENANCE_FAKE_SEED", "0")
+    rng = random.Random(f"{seed}:{tool}:{json.dumps(argv)}")
+    latency_ms = _setting(tool, "LATENCY_MS", 0.0)
+    jitter_ms = _setting(tool, "JITTER_MS", 0.0)
+    delay_ms = max(latency_ms + rng.uniform(-jitter_ms, jitter_ms), 0.0)
+    failed = rng.random() < _setting(tool, "FAILURE_RATE", 0.0)
+
+    response = spec.get("failure") if failed else _match(spec.get("rules", []), argv)
+    if response is None:
+        response = spec.get("default", {"exit": 1, "stderr": f"{tool}: unsupported arguments: {' '.join(argv)}\n"})
+
+    if delay_ms:
+        time.sleep(delay_ms / 1000)
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    exit_code = int(response.get("exit", 0))
+
+    log = os.environ.get("PROVENANCE_FAKE_LOG")
+    if log:
+        record = {
+            "tool": tool,
+            "args": argv,
+            "pid": os.getpid(),
+            "start": time.time() - (time.perf_counter() - started),
+            "delay_ms": round(delay_ms, 3),
+            "failed": failed,
+            "exit": exit_code,
+        }
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    return exit_code
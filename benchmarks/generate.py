@@ -0,0 +1,231 @@
+"""
+Synthetic release directories for benchmarking the verifier.
+
+A generated directory looks like a downloaded release: the binary,
+checksums.txt, attestation.jsonl (one SLSA statement), SPDX and CycloneDX
+SBOMs, a Sigstore bundle and build-metadata.json. Every file is derived from a seed, so the same
+parameters always produce the same bytes, and large files are written
+incrementally so generating a 500k-component SBOM needs little memory.
+
+Usage:
+    python -m benchmarks.generate DIR --binary-size 64M --subjects 1000 \\
+        --components 10000 --manifest-lines 100000
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+BINARY_NAME = "provenance-demo.pyz"
+EPOCH = 1700000000
+BLOCK_SIZE = 1024 * 1024
+LICENSES = ("MIT", "Apache-2.0", "BSD-3-Clause", "ISC", "MPL-2.0")
+
+_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    """Parse a size such as "512K", "64M" or "4G" into bytes."""
+    text = text.strip().upper().rstrip("B")
+    unit = text[-1] if text and text[-1] in _UNITS else ""
+    number = text[:-1] if unit else text
+    try:
+        return int(float(number) * _UNITS[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+
+
+def write_binary(path: Path, size: int, seed: int) -> str:
+    """Write size pseudo-random bytes and return their sha256."""
+    rng = random.Random(seed)
+    block = rng.randbytes(BLOCK_SIZE)
+    digest = hashlib.sha256()
+    remaining = size
+    counter = 0
+    with open(path, "wb") as f:
+        while remaining > 0:
+            # Vary each block so the file does not compress to nothing
+            chunk = counter.to_bytes(8, "big") + block[8:]
+            chunk = chunk[:remaining]
+            f.write(chunk)
+            digest.update(chunk)
+            remaining -= len(chunk)
+            counter += 1
+    return digest.hexdigest()
+
+
+def _fake_digest(rng: random.Random) -> str:
+    return rng.getrandbits(256).to_bytes(32, "big").hex()
+
+
+def write_checksums(path: Path, binary_sha256: str, lines: int, seed: int):
+    """checksums.txt in GNU format: the binary plus lines - 1 other artifacts."""
+    rng = random.Random(seed + 1)
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(max(lines - 1, 0)):
+            f.write(f"{_fake_digest(rng)}  artifact-{index:06d}.tar.gz\n")
+        f.write(f"{binary_sha256}  {BINARY_NAME}\n")
+
+
+def write_attestation(path: Path, binary_sha256: str, subjects: int, seed: int):
+    """attestation.jsonl with one DSSE-wrapped SLSA v1 statement."""
+    rng = random.Random(seed + 2)
+    subject = [{"name": BINARY_NAME, "digest": {"sha256": binary_sha256}}]
+    subject += [
+        {"name": f"artifact-{index:06d}.tar.gz", "digest": {"sha256": _fake_digest(rng)}}
+        for index in range(max(subjects - 1, 0))
+    ]
+    statement = {
+        "_type": "https://in-toto.io/Statement/v1",
+        "subject": subject,
+        "predicateType": "https://slsa.dev/provenance/v1",
+        "predicate": {
+            "buildDefinition": {
+                "buildType": "https://actions.github.io/buildtypes/workflow/v1",
+                "externalParameters": {"workflow": {"ref": "refs/tags/v1.0.0", "path": ".github/workflows/release.yml"}},
+                "internalParameters": {"SOURCE_DATE_EPOCH": str(EPOCH)},
+            },
+            "runDetails": {"builder": {"id": "https://github.com/actions/runner/github-hosted"}},
+            "builder": {"id": "https://github.com/actions/runner/github-hosted"},
+            "buildType": "https://actions.github.io/buildtypes/workflow/v1",
+        },
+    }
+    payload = base64.b64encode(json.dumps(statement).encode()).decode()
+    envelope = {"dsseEnvelope": {"payloadType": "application/vnd.in-toto+json", "payload": payload, "signatures": []}}
+    path.write_text(json.dumps(envelope) + "\n", encoding="utf-8")
+
+
+def write_bundle(path: Path, seed: int):
+    """Sigstore bundle with one (unsigned, synthetic) Rekor entry."""
+    rng = random.Random(seed + 5)
+    bundle = {
+        "mediaType": "application/vnd.dev.sigstore.bundle.v0.3+json",
+        "verificationMaterial": {
+            "tlogEntries": [{
+                "logIndex": str(rng.randrange(10 ** 8)),
+                "logId": {"keyId": base64.b64encode(rng.randbytes(32)).decode()},
+                "kindVersion": {"kind": "hashedrekord", "version": "0.0.1"},
+                "integratedTime": str(EPOCH),
+            }],
+        },
+        "messageSignature": {"signature": base64.b64encode(rng.randbytes(64)).decode()},
+    }
+    path.write_text(json.dumps(bundle) + "\n", encoding="utf-8")
+
+
+def _write_array(f, items):
+    first = True
+    for item in items:
+        f.write(("" if first else ",\n") + json.dumps(item))
+        first = False
+
+
+def write_spdx(path: Path, components: int, seed: int):
+    """SPDX 2.3 JSON document with components packages."""
+    rng = random.Random(seed + 3)
+    packages = (
+        {
+            "SPDXID": f"SPDXRef-Package-{index}",
+            "name": f"package-{index}",
+            "versionInfo": f"{rng.randrange(10)}.{rng.randrange(50)}.{rng.randrange(100)}",
+            "licenseConcluded": rng.choice(LICENSES),
+            "downloadLocation": "NOASSERTION",
+        }
+        for index in range(components)
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"spdxVersion": "SPDX-2.3", "dataLicense": "CC0-1.0", "SPDXID": "SPDXRef-DOCUMENT", '
+                '"name": "provenance-demo", "packages": [\n')
+        _write_array(f, packages)
+        f.write("\n]}\n")
+
+
+def write_cyclonedx(path: Path, components: int, seed: int):
+    """CycloneDX 1.5 JSON document with components components."""
+    rng = random.Random(seed + 4)
+    items = (
+        {
+            "type": "library",
+            "name": f"package-{index}",
+            "version": f"{rng.randrange(10)}.{rng.randrange(50)}.{rng.randrange(100)}",
+            "purl": f"pkg:pypi/package-{index}",
+            "licenses": [{"license": {"id": rng.choice(LICENSES)}}],
+        }
+        for index in range(components)
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"bomFormat": "CycloneDX", "specVersion": "1.5", "version": 1, "components": [\n')
+        _write_array(f, items)
+        f.write("\n]}\n")
+
+
+def generate_release(
+    directory: Path,
+    binary_size: int = 1024 * 1024,
+    subjects: int = 1,
+    components: int = 10,
+    manifest_lines: int = 100,
+    seed: int = 0,
+) -> Dict:
+    """
+    Generate a synthetic release directory.
+
+    Args:
+        directory: Output directory (created if needed).
+        binary_size: Size of the binary in bytes.
+        subjects: Number of subjects in the SLSA statement.
+        components: Number of packages in each SBOM.
+        manifest_lines: Number of lines in checksums.txt.
+        seed: Seed for all generated content.
+
+    Returns:
+        The scenario parameters plus the binary path and sha256.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    binary = directory / BINARY_NAME
+    sha256 = write_binary(binary, binary_size, seed)
+    write_checksums(directory / "checksums.txt", sha256, manifest_lines, seed)
+    write_attestation(directory / "attestation.jsonl", sha256, subjects, seed)
+    write_spdx(directory / "sbom.spdx.json", components, seed)
+    write_cyclonedx(directory / "sbom.cyclonedx.json", components, seed)
+    write_bundle(directory / f"{BINARY_NAME}.sigstore", seed)
+    (directory / "build-metadata.json").write_text(
+        json.dumps({"SOURCE_DATE_EPOCH": str(EPOCH), "git_tag": "v1.0.0", "git_commit": "0" * 40}) + "\n",
+        encoding="utf-8",
+    )
+    return {
+        "binary": str(binary),
+        "sha256": sha256,
+        "binary_size": binary_size,
+        "subjects": subjects,
+        "components": components,
+        "manifest_lines": manifest_lines,
+        "seed": seed,
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic release directory for benchmarks")
+    parser.add_argument("directory", help="Output directory")
+    parser.add_argument("--binary-size", type=parse_size, default=parse_size("1M"), help="Binary size, e.g. 1M, 4G")
+    parser.add_argument("--subjects", type=int, default=1, help="SLSA subjects in attestation.jsonl")
+    parser.add_argument("--components", type=int, default=10, help="Packages in each SBOM")
+    parser.add_argument("--manifest-lines", type=int, default=100, help="Lines in checksums.txt")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    scenario = generate_release(
+        Path(args.directory), args.binary_size, args.subjects, args.components, args.manifest_lines, args.seed
+    )
+    json.dump(scenario, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Performance regression gate for the verifier.
+
+Runs a fixed set of benchmarks on a synthetic release and compares them with
+the committed baseline (``benchmarks/baseline.json``):
+
+- ``hash_throughput``: ``digests.hash_file`` over the release binary
+- ``sbom_parse``: ``verify_sbom`` loading the SPDX and CycloneDX documents
+- ``attestation_index``: ``verify_slsa_provenance`` parsing attestation.jsonl
+  and looking the binary up among thousands of subjects
+- ``cli_startup``: ``provenance-demo --version`` in a fresh interpreter
+
+Every benchmark records ``median_ms`` and ``p95_ms``; ``hash_throughput`` also
+records ``mb_per_s``. A metric regresses when it is worse than the baseline by
+more than its tolerance (a fraction of the baseline value). Tolerances are set
+per metric in the baseline and can be overridden per benchmark; scale them all
+with PROVENANCE_PERF_TOLERANCE_SCALE on slow or noisy machines.
+
+Usage:
+    python -m benchmarks.perf                      # compare, exit 1 on regression
+    python -m benchmarks.perf --update-baseline    # re-record the baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import demo_cli
+from demo_cli.digests import file_digest, hash_file
+
+from .generate import generate_release
+from .run import Bench, summarize
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+SCHEMA_VERSION = 1
+
+# Release the benchmarks run against (generated once per run)
+PERF_RELEASE = {"binary_size": 32 * 1024 * 1024, "subjects": 5000, "components": 20_000, "manifest_lines": 1000}
+
+# Allowed relative regression per metric, unless the baseline says otherwise
+DEFAULT_TOLERANCE = {"median_ms": 0.75, "p95_ms": 1.5, "mb_per_s": 0.75}
+
+# Metrics where a larger value is better; all others are durations
+HIGHER_IS_BETTER = {"mb_per_s"}
+
+SRC_DIR = Path(demo_cli.__file__).resolve().parent.parent
+
+
+def _time_hash(bench: Bench) -> int:
+    started = time.perf_counter_ns()
+    hash_file(bench.binary)
+    return time.perf_counter_ns() - started
+
+
+def _time_sbom(bench: Bench) -> int:
+    verifier = bench.verifier()
+    started = time.perf_counter_ns()
+    verifier.verify_sbom()
+    return time.perf_counter_ns() - started
+
+
+def _time_attestations(bench: Bench) -> int:
+    # Hash the binary outside the timed region so only parsing and lookup count
+    verifier = bench.verifier()
+    file_digest(bench.binary, "sha256", verifier.cache)
+    started = time.perf_counter_ns()
+    verifier.verify_slsa_provenance()
+    return time.perf_counter_ns() - started
+
+
+def _time_startup(bench: Bench) -> int:
+    code = "import sys; from demo_cli.cli import main; sys.argv = ['provenance-demo', '--version']; sys.exit(main())"
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    started = time.perf_counter_ns()
+    subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, check=True)
+    return time.perf_counter_ns() - started
+
+
+BENCHMARKS: Dict[str, Callable[[Bench], int]] = {
+    "hash_throughput": _time_hash,
+    "sbom_parse": _time_sbom,
+    "attestation_index": _time_attestations,
+    "cli_startup": _time_startup,
+}
+
+
+def run_perf(release: Path, names: Optional[Sequence[str]] = None, repeat: int = 11) -> Dict[str, Dict]:
+    """
+    Run the perf benchmarks against a release from :data:`PERF_RELEASE`.
+
+    Args:
+        release: Directory generated with the PERF_RELEASE parameters.
+        names: Benchmarks to run (default: all).
+        repeat: Timed runs per benchmark, after one untimed warm-up run. The
+            garbage collector is disabled while a run is timed.
+
+    Returns:
+        Mapping of benchmark name to its metrics.
+    """
+    bench = Bench(release)
+    results = {}
+    for name in names or BENCHMARKS:
+        measure = BENCHMARKS[name]
+        measure(bench)
+        samples = []
+        for _ in range(repeat):
+            # Like timeit: collect first, then keep the collector out of the timings
+            gc.collect()
+            gc.disable()
+            try:
+                samples.append(measure(bench))
+            finally:
+                gc.enable()
+        stats = summarize(samples)
+        metrics = {"median_ms": stats["median_ms"], "p95_ms": stats["p95_ms"]}
+        if name == "hash_throughput":
+            metrics["mb_per_s"] = round(bench.binary.stat().st_size / 2 ** 20 / (stats["median_ms"] / 1000), 1)
+        results[name] = metrics
+    return results
+
+
+def tolerance_scale() -> float:
+    try:
+        return float(os.getenv("PROVENANCE_PERF_TOLERANCE_SCALE", "1"))
+    except ValueError:
+        return 1.0
+
+
+def compare(baseline: Dict, results: Dict[str, Dict], scale: float = 1.0) -> List[Dict]:
+    """
+    Compare benchmark results with a baseline document.
+
+    Args:
+        baseline: Parsed baseline.json.
+        results: Output of :func:`run_perf`.
+        scale: Multiplier applied to every tolerance.
+
+    Returns:
+        One row per benchmark metric with its status: "ok", "regressed" or
+        "improved" (beyond the tolerance either way), or "new" when the
+        baseline has no value.
+    """
+    tolerances = {**DEFAULT_TOLERANCE, **baseline.get("tolerance", {})}
+    rows = []
+    for name, metrics in results.items():
+        expected = baseline.get("benchmarks", {}).get(name, {})
+        overrides = expected.get("tolerance", {})
+        for metric, current in metrics.items():
+            reference = expected.get(metric)
+            tolerance = overrides.get(metric, tolerances.get(metric, 0.0)) * scale
+            row = {"benchmark": name, "metric": metric, "baseline": reference, "current": current,
+                   "change": None, "tolerance": tolerance, "status": "new"}
+            if reference:
+                row["change"] = (current - reference) / reference
+                ratio = current / reference if metric in HIGHER_IS_BETTER else reference / current
+                worse, better = ratio < 1 / (1 + tolerance), ratio > 1 + tolerance
+                row["status"] = "regressed" if worse else "improved" if better else "ok"
+            rows.append(row)
+    return rows
+
+
+def regressions(rows: List[Dict]) -> List[Dict]:
+    return [row for row in rows if row["status"] == "regressed"]
+
+
+def format_table(rows: List[Dict]) -> str:
+    """Render comparison rows as a fixed-width diff table."""
+    lines = [f"{'benchmark':<20} {'metric':<10} {'baseline':>10} {'current':>10} {'change':>8} {'tol':>6}  status"]
+    for row in rows:
+        baseline = f"{row['baseline']:.2f}" if row["baseline"] is not None else "-"
+        change = f"{row['change']:+.0%}" if row["change"] is not None else "-"
+        lines.append(
+            f"{row['benchmark']:<20} {row['metric']:<10} {baseline:>10} {row['current']:>10.2f} "
+            f"{change:>8} {row['tolerance']:>6.0%}  {row['status']}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path: Path = BASELINE) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_baseline(results: Dict[str, Dict], path: Path = BASELINE, previous: Optional[Dict] = None):
+    """
+    Write results as the new baseline.
+
+    Tolerances and benchmarks that were not re-run are kept from previous.
+    """
+    previous = previous or {}
+    benchmarks = dict(previous.get("benchmarks", {}))
+    for name, metrics in results.items():
+        entry = dict(metrics)
+        override = benchmarks.get(name, {}).get("tolerance")
+        if override:
+            entry["tolerance"] = override
+        benchmarks[name] = entry
+    document = {
+        "schema": SCHEMA_VERSION,
+        "recorded": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "release": PERF_RELEASE,
+        "tolerance": previous.get("tolerance", DEFAULT_TOLERANCE),
+        "benchmarks": benchmarks,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare verifier performance with the committed baseline")
+    parser.add_argument("--baseline", default=str(BASELINE), help="Baseline JSON (default: benchmarks/baseline.json)")
+    parser.add_argument("--only", help="Comma-separated benchmarks, e.g. hash_throughput,cli_startup")
+    parser.add_argument("--repeat", type=int, default=11, help="Timed runs per benchmark (default: 11)")
+    parser.add_argument("--update-baseline", action="store_true", help="Record the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    os.environ["PROVENANCE_GITHUB_API"] = "0"
+    names = [name.strip() for name in args.only.split(",")] if args.only else None
+    baseline_path = Path(args.baseline)
+
+    with tempfile.TemporaryDirectory(prefix="provenance-perf-") as scratch:
+        generate_release(Path(scratch), **PERF_RELEASE)
+        results = run_perf(Path(scratch), names, repeat=args.repeat)
+
+    if args.update_baseline:
+        previous = load_baseline(baseline_path) if baseline_path.exists() else None
+        write_baseline(results, baseline_path, previous)
+        print(f"Baseline written to {baseline_path}", file=sys.stderr)
+        return 0
+
+    rows = compare(load_baseline(baseline_path), results, tolerance_scale())
+    print(format_table(rows))
+    failed = regressions(rows)
+    if failed:
+        print(f"\n{len(failed)} metric(s) regressed beyond tolerance", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Benchmark the verifier's checks against a synthetic release.
+
+Each ``Verifier.verify_*`` method and the whole ``verify_all`` run is timed
+``--repeat`` times with a fresh cache (cold: every file is read and parsed
+again; ``--warm`` reuses one cache), then run once more under tracemalloc for
+its peak memory. External tools are resolved only from ``--tool-dir``
+(nothing by default), so checks that need cosign, gh or osv-scanner measure
+their "tool missing" path unless stand-ins are provided; ``--fake-tools`` uses
+the deterministic shims in ``benchmarks/fake_tools``.
+
+Usage:
+    python -m benchmarks.run --scenario medium --output results.json
+    python -m benchmarks.run --release DIR --only verify_checksum,verify_sbom
+    PROVENANCE_FAKE_LATENCY_MS=200 python -m benchmarks.run --fake-tools
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from demo_cli.cache import StatCache
+from demo_cli.reporters import Reporter
+from demo_cli.tools import ToolRegistry
+from demo_cli.verify import Verifier
+
+from .generate import BINARY_NAME, generate_release, parse_size
+
+# name: (binary size, SLSA subjects, SBOM components, checksums.txt lines)
+SCENARIOS = {
+    "small": ("1M", 1, 10, 100),
+    "medium": ("64M", 1000, 10_000, 100_000),
+    "large": ("1G", 10_000, 100_000, 100_000),
+    "xl": ("4G", 10_000, 500_000, 100_000),
+}
+
+SCHEMA_VERSION = 1
+
+FAKE_TOOLS = Path(__file__).resolve().parent / "fake_tools"
+
+
+def check_methods() -> List[str]:
+    """Names of the individual verify_* checks."""
+    return sorted(
+        name for name in dir(Verifier)
+        if name.startswith("verify_") and name != "verify_all" and callable(getattr(Verifier, name))
+    )
+
+
+def summarize(samples_ns: Sequence[int]) -> Dict:
+    """Min/median/p95/mean in milliseconds (p95 by nearest rank)."""
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+    median = ordered[count // 2] if count % 2 else (ordered[count // 2 - 1] + ordered[count // 2]) / 2
+    p95 = ordered[max(0, -(-95 * count // 100) - 1)]
+    return {
+        "runs": count,
+        "min_ms": round(ordered[0] / 1e6, 3),
+        "median_ms": round(median / 1e6, 3),
+        "p95_ms": round(p95 / 1e6, 3),
+        "mean_ms": round(sum(ordered) / count / 1e6, 3),
+    }
+
+
+class Bench:
+    """Builds verifiers for one release directory."""
+
+    def __init__(self, release: Path, tool_dir: Optional[Path] = None, warm: bool = False):
+        self.binary = release / BINARY_NAME
+        self.warm = warm
+        self.cache = StatCache()
+        # An empty scratch directory doubles as the search path when no tools are wanted
+        self._scratch = tempfile.TemporaryDirectory(prefix="provenance-bench-")
+        self.tools = ToolRegistry(
+            cache_file=Path(self._scratch.name) / "tools.json",
+            search_path=str(tool_dir) if tool_dir else self._scratch.name,
+        )
+
+    def verifier(self) -> Verifier:
+        cache = self.cache if self.warm else StatCache()
+        verifier = Verifier(self.binary, quiet=True, cache=cache, tools=self.tools, reporter=Reporter())
+        verifier.version = "1.0.0"
+        return verifier
+
+    def call(self, name: str):
+        verifier = self.verifier()
+        if name == "verify_all":
+            passed = verifier.verify_all()
+            return passed, f"{sum(r.passed for r in verifier.results)}/{len(verifier.results)} checks passed"
+        result = getattr(verifier, name)()
+        return result.passed, result.message
+
+    def run(self, name: str, repeat: int) -> Dict:
+        samples = []
+        passed, message = None, ""
+        for _ in range(repeat):
+            started = time.perf_counter_ns()
+            passed, message = self.call(name)
+            samples.append(time.perf_counter_ns() - started)
+
+        tracemalloc.start()
+        try:
+            self.call(name)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return {"name": name, **summarize(samples), "peak_memory_bytes": peak, "passed": passed, "message": message}
+
+
+def run_benchmarks(
+    release: Path,
+    names: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    warm: bool = False,
+    tool_dir: Optional[Path] = None,
+) -> List[Dict]:
+    """
+    Benchmark checks against a release directory.
+
+    Args:
+        release: Directory produced by benchmarks.generate.
+        names: Methods to run (default: every verify_* check, then verify_all).
+        repeat: Timed runs per benchmark.
+        warm: Reuse one digest/evidence cache across runs.
+        tool_dir: Directory to resolve external tools from.
+
+    Returns:
+        One result dict per benchmark.
+    """
+    bench = Bench(release, tool_dir=tool_dir, warm=warm)
+    names = list(names) if names else check_methods() + ["verify_all"]
+    return [bench.run(name, repeat) for name in names]
+
+
+def _print_table(results: List[Dict]):
+    print(f"{'benchmark':<34} {'median ms':>10} {'p95 ms':>10} {'peak MiB':>9}  result", file=sys.stderr)
+    for row in results:
+        print(
+            f"{row['name']:<34} {row['median_ms']:>10.2f} {row['p95_ms']:>10.2f} "
+            f"{row['peak_memory_bytes'] / 2 ** 20:>9.1f}  {'pass' if row['passed'] else 'fail'}",
+            file=sys.stderr,
+        )
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Verifier checks on a synthetic release")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--scenario", choices=sorted(SCENARIOS), default="small", help="Generate a release of this size")
+    source.add_argument("--release", help="Use an existing release directory (from benchmarks.generate)")
+    parser.add_argument("--only", help="Comma-separated benchmarks, e.g. verify_checksum,verify_all")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument("--warm", action="store_true", help="Reuse the digest/evidence cache between runs")
+    tools = parser.add_mutually_exclusive_group()
+    tools.add_argument("--tool-dir", help="Resolve cosign/gh/osv-scanner from this directory only")
+    tools.add_argument("--fake-tools", action="store_true", help=f"Use the fake tools in {FAKE_TOOLS.name}/")
+    parser.add_argument("--output", "-o", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    # Never talk to the GitHub API from a benchmark
+    os.environ["PROVENANCE_GITHUB_API"] = "0"
+
+    names = [name.strip() for name in args.only.split(",")] if args.only else None
+    tool_dir = FAKE_TOOLS if args.fake_tools else Path(args.tool_dir) if args.tool_dir else None
+
+    with tempfile.TemporaryDirectory(prefix="provenance-release-") as scratch:
+        if args.release:
+            release = Path(args.release)
+            scenario: Dict = {"release": str(release)}
+        else:
+            size, subjects, components, lines = SCENARIOS[args.scenario]
+            print(f"Generating {args.scenario} release...", file=sys.stderr)
+            release = Path(scratch)
+            scenario = {"name": args.scenario, **generate_release(release, parse_size(size), subjects, components, lines)}
+
+        results = run_benchmarks(release, names, repeat=args.repeat, warm=args.warm, tool_dir=tool_dir)
+
+    _print_table(results)
+    report = {
+        "schema": SCHEMA_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cache": "warm" if args.warm else "cold",
+        "tools": str(tool_dir) if tool_dir else None,
+        "scenario": scenario,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
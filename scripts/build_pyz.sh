@@ -13,42 +13,15 @@ umask 0022
 uv pip install --system --upgrade pip build
 rm -rf dist && uv run --no-project python -m build
 
-# Make a .pyz from the installed package sources
-rm -rf build/pyz && mkdir -p build/pyz/src
-rsync -a --delete src/ build/pyz/src/
-# Create zipapp (module entry: demo_cli.cli:main) with reproducible timestamps
-uv run --no-project python -c "
-import zipfile
-import os
-import time
-from pathlib import Path
-
-sde = int(os.environ.get('SOURCE_DATE_EPOCH', time.time()))
-date_time = time.gmtime(sde)[:6]
-
-with zipfile.ZipFile('dist/provenance-demo.pyz', 'w', zipfile.ZIP_DEFLATED) as zf:
-    # Add __main__.py with deterministic timestamp
-    main_content = 'from demo_cli.cli import main\nmain()\n'
-    zinfo = zipfile.ZipInfo('__main__.py', date_time=date_time)
-    zinfo.external_attr = 0o644 << 16
-    zf.writestr(zinfo, main_content, compress_type=zipfile.ZIP_DEFLATED)
-
-    # Add all source files in sorted order with deterministic timestamps
-    src_dir = Path('build/pyz/src')
-    for file_path in sorted(src_dir.rglob('*')):
-        if file_path.is_file():
-            arcname = str(file_path.relative_to(src_dir))
-            zinfo = zipfile.ZipInfo(arcname, date_time=date_time)
-            zinfo.external_attr = 0o644 << 16
-            with open(file_path, 'rb') as f:
-                zf.writestr(zinfo, f.read(), compress_type=zipfile.ZIP_DEFLATED)
-
-# Add shebang
-with open('dist/provenance-demo.pyz', 'rb') as f:
-    content = f.read()
-with open('dist/provenance-demo.pyz', 'wb') as f:
-    f.write(b'#!/usr/bin/env python3\n' + content)
-"
+# Make a .pyz from the package sources (module entry: demo_cli.cli:main).
+# The builder streams a deterministic archive with SOURCE_DATE_EPOCH timestamps
+# and checked-hash .pyc files, and reuses build/pyz/provenance-demo.pyz when
+# the source tree and build inputs are unchanged since the last build.
+PYZ_BYTECODE="$(uv run --no-project python -c 'import sys; print(sys.implementation.cache_tag)')"
+PYTHONPATH=src uv run --no-project python -m demo_cli.build_pyz \
+  --src src \
+  --output build/pyz/provenance-demo.pyz
+cp build/pyz/provenance-demo.pyz dist/provenance-demo.pyz
 chmod +x dist/provenance-demo.pyz
 
 # Create build metadata with SOURCE_DATE_EPOCH for reproducibility verification
@@ -57,6 +30,7 @@ cat > dist/build-metadata.json <<EOF
   "SOURCE_DATE_EPOCH": "${SOURCE_DATE_EPOCH}",
   "build_timestamp": "$(date -u -d @${SOURCE_DATE_EPOCH} '+%Y-%m-%dT%H:%M:%SZ' 2>/dev/null || date -u -r ${SOURCE_DATE_EPOCH} '+%Y-%m-%dT%H:%M:%SZ')",
   "git_commit": "$(git rev-parse HEAD 2>/dev/null || echo 'unknown')",
-  "git_tag": "$(git describe --tags --exact-match 2>/dev/null || echo 'none')"
+  "git_tag": "$(git describe --tags --exact-match 2>/dev/null || echo 'none')",
+  "bytecode": "${PYZ_BYTECODE}"
 }
 EOF
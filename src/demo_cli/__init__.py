@@ -1,12 +1,22 @@
 __all__ = ["__version__"]
 
-# Version is dynamically determined from git tags via hatch-vcs
-try:
-    from ._version import __version__
-except ImportError:
-    # Fallback for development/editable installs
+
+def __getattr__(name):
+    # The version is resolved on first access: the importlib.metadata fallback
+    # is slow to import and most commands never print the version.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Version is dynamically determined from git tags via hatch-vcs
     try:
-        from importlib.metadata import version, PackageNotFoundError
-        __version__ = version("provenance-demo")
-    except PackageNotFoundError:
-        __version__ = "0.0.0.dev0"
+        from ._version import __version__
+    except ImportError:
+        # Fallback for development/editable installs
+        try:
+            from importlib.metadata import version, PackageNotFoundError
+            __version__ = version("provenance-demo")
+        except PackageNotFoundError:
+            __version__ = "0.0.0.dev0"
+
+    globals()["__version__"] = __version__
+    return __version__
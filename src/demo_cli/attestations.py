@@ -0,0 +1,250 @@
+"""
+Attestation bundles (attestation.jsonl) and the subjects of SLSA statements.
+
+A bundle holds one record per line: a ``dsseEnvelope`` wrapper as written by
+``gh attestation download``, a bare DSSE envelope (``payload`` and
+``payloadType``) or an in-toto statement. Parsing is bounded in file size,
+line length, payload size and statement count, and malformed records are
+skipped with a warning on stderr.
+"""
+
+import base64
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .cache import StatCache
+from .timing import add_bytes, phase
+
+HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Security limits to prevent DoS
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+MAX_STATEMENTS = 100
+MAX_LINE_LENGTH = 1024 * 1024  # 1 MB per line
+MAX_PAYLOAD_SIZE = 5 * 1024 * 1024  # 5 MB decoded payload
+
+
+class AttestationLimitError(ValueError):
+    """Raised by a strict load when the bundle exceeds a limit and would be truncated."""
+
+
+def _warn(message: str):
+    print(message, file=sys.stderr)
+
+
+def parse_attestation_statements(
+    attestation_file: Path,
+    max_statements: int = MAX_STATEMENTS,
+    max_file_size: int = MAX_FILE_SIZE,
+    strict: bool = False,
+) -> List[Dict]:
+    """
+    Parse attestation statements from a JSONL bundle with security hardening.
+
+    Args:
+        attestation_file: Path to attestation.jsonl.
+        max_statements: Stop after this many statements.
+        max_file_size: Ignore larger bundles entirely.
+        strict: Raise AttestationLimitError instead of warning when the file
+            size, statement count or line length limit would drop statements.
+    """
+    statements: List[Dict] = []
+
+    def limit(message: str):
+        if strict:
+            raise AttestationLimitError(f"{attestation_file.name}: {message}")
+        _warn(f"⚠ Warning: {message}")
+
+    # Check file size before processing
+    file_size = attestation_file.stat().st_size
+    if file_size > max_file_size:
+        limit(f"Attestation file too large ({file_size} bytes), max {max_file_size}")
+        return statements
+
+    add_bytes(file_size)
+    with open(attestation_file, encoding='utf-8') as f:
+        line_num = 0
+        for line in f:
+            line_num += 1
+
+            # Security: Limit number of statements
+            if len(statements) >= max_statements:
+                if line.strip():
+                    limit(f"Reached max statements limit ({max_statements})")
+                    break
+                continue
+
+            # Security: Limit line length
+            if len(line) > MAX_LINE_LENGTH:
+                limit(f"Line {line_num} exceeds max length, skipping")
+                continue
+
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                _warn(f"⚠ Warning: Invalid JSON on line {line_num}: {str(e)[:100]}")
+                continue
+
+            # Validate record is a dict
+            if not isinstance(record, dict):
+                _warn(f"⚠ Warning: Line {line_num} is not a JSON object, skipping")
+                continue
+
+            # Handle DSSE envelopes (nested or top-level)
+            # Format 1: dsseEnvelope wrapper (gh attestation download format)
+            if "dsseEnvelope" in record:
+                envelope = record["dsseEnvelope"]
+                if isinstance(envelope, dict) and "payload" in envelope:
+                    try:
+                        # Security: Validate payload is string
+                        payload_str = envelope["payload"]
+                        if not isinstance(payload_str, str):
+                            _warn(f"⚠ Warning: Line {line_num} payload is not a string")
+                            continue
+
+                        # Security: Check decoded size
+                        if len(payload_str) > MAX_PAYLOAD_SIZE * 4 / 3:  # base64 overhead
+                            limit(f"Line {line_num} payload too large")
+                            continue
+
+                        payload_bytes = base64.b64decode(payload_str, validate=True)
+
+                        # Security: Check decoded size
+                        if len(payload_bytes) > MAX_PAYLOAD_SIZE:
+                            limit(f"Line {line_num} decoded payload too large")
+                            continue
+
+                        payload = json.loads(payload_bytes)
+
+                        # Validate payload structure
+                        if isinstance(payload, dict):
+                            statements.append(payload)
+                        continue
+                    except AttestationLimitError:
+                        raise
+                    except (ValueError, json.JSONDecodeError, Exception) as e:
+                        _warn(f"⚠ Warning: Line {line_num} dsseEnvelope decode failed: {str(e)[:100]}")
+                        continue
+
+            # Format 2: Direct payload/payloadType (older format)
+            if "payload" in record and "payloadType" in record:
+                try:
+                    payload_str = record["payload"]
+                    if not isinstance(payload_str, str):
+                        continue
+
+                    if len(payload_str) > MAX_PAYLOAD_SIZE * 4 / 3:
+                        limit(f"Line {line_num} direct payload too large")
+                        continue
+
+                    payload_bytes = base64.b64decode(payload_str, validate=True)
+
+                    if len(payload_bytes) > MAX_PAYLOAD_SIZE:
+                        limit(f"Line {line_num} decoded direct payload too large")
+                        continue
+
+                    payload = json.loads(payload_bytes)
+
+                    if isinstance(payload, dict):
+                        statements.append(payload)
+                    continue
+                except AttestationLimitError:
+                    raise
+                except (ValueError, json.JSONDecodeError, Exception) as e:
+                    _warn(f"⚠ Warning: Line {line_num} direct payload decode failed: {str(e)[:100]}")
+                    continue
+
+            # Format 3: Direct statement (no envelope)
+            if isinstance(record, dict):
+                statements.append(record)
+
+    return statements
+
+
+def load_attestation_statements(
+    attestation_file: Path,
+    cache: Optional[StatCache] = None,
+    max_statements: int = MAX_STATEMENTS,
+    max_file_size: int = MAX_FILE_SIZE,
+    strict: bool = False,
+) -> List[Dict]:
+    """
+    Load the statements of an attestation bundle.
+
+    Args:
+        attestation_file: Path to attestation.jsonl.
+        cache: When given, the parsed bundle is reused while the file is unchanged.
+        max_statements: Statement limit (see parse_attestation_statements).
+        max_file_size: Size limit in bytes.
+        strict: Fail instead of truncating when a limit is hit.
+
+    Returns:
+        The in-toto statements, at most max_statements.
+
+    Raises:
+        AttestationLimitError: A strict load hit a limit.
+    """
+    def parse(path: Path) -> List[Dict]:
+        return parse_attestation_statements(path, max_statements, max_file_size, strict)
+
+    with phase("parse", {"file.path": str(attestation_file)}):
+        if cache is None:
+            return parse(attestation_file)
+        namespace = "attestations"
+        if (max_statements, max_file_size, strict) != (MAX_STATEMENTS, MAX_FILE_SIZE, False):
+            namespace = f"attestations:{max_statements}:{max_file_size}:{int(strict)}"
+        return cache.get_or_load(attestation_file, namespace, parse)
+
+
+def is_slsa_statement(statement: Dict) -> bool:
+    predicate_type = statement.get("predicateType")
+    return isinstance(predicate_type, str) and "slsa" in predicate_type.lower()
+
+
+def statement_subjects(statement: Dict) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """
+    Yield the well-formed subjects of a statement.
+
+    Names with path traversal or backslashes and non-dict digests are
+    skipped, as are non-hex digest values. A leading "./" or "/" is dropped,
+    so names read like manifest entries.
+
+    Yields:
+        Tuples of (relative name, {algorithm: lowercase hex digest}).
+    """
+    subjects = statement.get("subject", [])
+
+    # Security: Validate subjects is a list
+    if not isinstance(subjects, list):
+        return
+
+    for subject in subjects:
+        # Security: Validate subject is a dict
+        if not isinstance(subject, dict):
+            continue
+
+        subject_name = subject.get("name", "")
+        digest = subject.get("digest", {})
+
+        # Security: Validate types
+        if not isinstance(subject_name, str) or not isinstance(digest, dict):
+            continue
+
+        # Security: Prevent path traversal
+        if '..' in subject_name or '\\' in subject_name or '\0' in subject_name:
+            continue
+        subject_name = subject_name[2:] if subject_name.startswith("./") else subject_name.lstrip("/")
+        if not subject_name or subject_name.endswith("/"):
+            continue
+
+        # Security: Validate checksum format (hex string)
+        digests = {}
+        for algorithm, value in digest.items():
+            if isinstance(algorithm, str) and isinstance(value, str) and set(value.lower()) <= HEX_DIGITS:
+                digests[algorithm.lower()] = value.lower()
+        yield subject_name, digests
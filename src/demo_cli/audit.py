@@ -0,0 +1,207 @@
+"""
+Release coverage audit (audit-release).
+
+Joins the entries of a release's checksum manifest with the subjects of every
+SLSA statement in its attestation bundle. Both sides are indexed by name in
+one pass each, so the join is linear in the number of entries and subjects
+instead of running the SLSA provenance check once per artifact. Reports:
+
+- artifacts listed in the manifest that no SLSA statement attests
+- attested subjects that are not listed in the manifest
+- artifacts whose manifest digest disagrees with an attested digest
+
+Digests are compared for every algorithm present on both sides; a subject
+sharing no algorithm with its manifest entry counts as a disagreement. Names
+are matched by full path (``linux/tool`` and ``darwin/tool`` stay distinct);
+a manifest entry and a subject whose paths differ are matched by file name
+only when that file name is unique on both sides.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .attestations import AttestationLimitError, is_slsa_statement, load_attestation_statements, statement_subjects
+from .cache import StatCache
+from .checksums import load_manifest
+
+MANIFEST_CANDIDATES = ("checksums.txt", "SHA256SUMS", "SHA512SUMS")
+ATTESTATION_BUNDLE = "attestation.jsonl"
+
+# The verifier's limits (100 statements, 10 MB) are sized for one artifact; an
+# audit covers the whole release, and fails rather than truncating beyond these
+AUDIT_MAX_STATEMENTS = 100_000
+AUDIT_MAX_FILE_SIZE = 1024 * 1024 * 1024
+
+
+class ReleaseAudit:
+    """Outcome of joining a checksum manifest with attestation subjects."""
+
+    def __init__(self, manifest: Path, attestations: Path):
+        self.manifest = manifest
+        self.attestations = attestations
+        self.statements = 0
+        self.slsa_statements = 0
+        self.covered: List[str] = []
+        self.unattested: List[str] = []
+        self.unlisted: List[str] = []
+        self.mismatched: List[Dict] = []
+        self.seconds = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return not (self.unattested or self.unlisted or self.mismatched)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON export."""
+        return {
+            "manifest": str(self.manifest),
+            "attestations": str(self.attestations),
+            "passed": self.passed,
+            "statements": self.statements,
+            "slsa_statements": self.slsa_statements,
+            "covered": len(self.covered),
+            "unattested": self.unattested,
+            "unlisted": self.unlisted,
+            "mismatched": self.mismatched,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def _basename(name: str) -> str:
+    return name.rsplit("/", 1)[-1]
+
+
+def _unique_basenames(names) -> Dict[str, Optional[str]]:
+    """Map each file name to its full name, or None when several share it."""
+    index: Dict[str, Optional[str]] = {}
+    for name in names:
+        basename = _basename(name)
+        index[basename] = None if basename in index and index[basename] != name else name
+    return index
+
+
+def find_manifest(directory: Path) -> Optional[Path]:
+    return next((directory / name for name in MANIFEST_CANDIDATES if (directory / name).exists()), None)
+
+
+def audit_release(
+    manifest_path: Path,
+    attestation_path: Path,
+    cache: Optional[StatCache] = None,
+) -> ReleaseAudit:
+    """
+    Join a checksum manifest with the subjects of the SLSA statements in a bundle.
+
+    Args:
+        manifest_path: Checksum manifest (checksums.txt, SHA256SUMS, ...).
+        attestation_path: Attestation bundle (attestation.jsonl).
+        cache: Reuse parsed files while they are unchanged.
+
+    Returns:
+        The audit report, with names sorted.
+
+    Raises:
+        OSError: A file cannot be read.
+        AttestationLimitError: The bundle exceeds a parsing limit, so some
+            statements would be missing from the audit.
+    """
+    started = time.perf_counter()
+    report = ReleaseAudit(manifest_path, attestation_path)
+
+    manifest = load_manifest(manifest_path, cache)
+    statements = load_attestation_statements(
+        attestation_path, cache, max_statements=AUDIT_MAX_STATEMENTS, max_file_size=AUDIT_MAX_FILE_SIZE, strict=True
+    )
+    report.statements = len(statements)
+    attested: Dict[str, Dict[str, Set[str]]] = {}
+    for statement in statements:
+        if not is_slsa_statement(statement):
+            continue
+        report.slsa_statements += 1
+        for name, digests in statement_subjects(statement):
+            subject = attested.setdefault(name, {})
+            for algorithm, value in digests.items():
+                subject.setdefault(algorithm, set()).add(value)
+
+    # Fall back to file names only where a name is unique on both sides
+    listed_by_basename = _unique_basenames(manifest.entries)
+    attested_by_basename = _unique_basenames(attested)
+    matched: Set[str] = set()
+
+    for name, entry in manifest.entries.items():
+        subject_name = name if name in attested else None
+        if subject_name is None:
+            basename = _basename(name)
+            if listed_by_basename.get(basename) == name:
+                subject_name = attested_by_basename.get(basename)
+        if subject_name is None:
+            report.unattested.append(name)
+            continue
+        matched.add(subject_name)
+        subject = attested[subject_name]
+        expected = {algorithm: value.lower() for algorithm, value in entry.items()}
+        shared = [algorithm for algorithm in expected if algorithm in subject]
+        # No shared algorithm means nothing vouches for the listed bytes
+        if not shared or any(subject[algorithm] != {expected[algorithm]} for algorithm in shared):
+            report.mismatched.append({
+                "name": name,
+                "manifest": expected,
+                "attested": {algorithm: sorted(values) for algorithm, values in subject.items()},
+            })
+        else:
+            report.covered.append(name)
+
+    report.unlisted = [name for name in attested if name not in matched]
+    report.unattested.sort()
+    report.unlisted.sort()
+    report.mismatched.sort(key=lambda entry: entry["name"])
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _describe(digests: Dict) -> str:
+    parts = []
+    for algorithm, values in sorted(digests.items()):
+        values = [values] if isinstance(values, str) else values
+        parts.append(f"{algorithm.upper()} " + ", ".join(f"{value[:16]}…" for value in values))
+    return "; ".join(parts)
+
+
+def audit_release_command(args) -> int:
+    """Run the audit-release command: 0 when manifest and attestations agree, 1 otherwise, 2 on error."""
+    directory = Path(args.directory)
+    manifest_path = Path(args.manifest) if getattr(args, 'manifest', None) else find_manifest(directory)
+    attestation_path = Path(getattr(args, 'attestations', None) or directory / ATTESTATION_BUNDLE)
+
+    if manifest_path is None:
+        print(f"❌ Error: no checksum manifest in {directory} (expected one of: {', '.join(MANIFEST_CANDIDATES)})",
+              file=sys.stderr)
+        return 2
+    try:
+        report = audit_release(manifest_path, attestation_path)
+    except (OSError, AttestationLimitError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+
+    if getattr(args, 'json', False):
+        print(json.dumps(report.to_dict(), indent=2))
+        return 0 if report.passed else 1
+
+    for name in report.unattested:
+        print(f"{name}: no provenance")
+    for name in report.unlisted:
+        print(f"{name}: attested but not in {manifest_path.name}")
+    for entry in report.mismatched:
+        print(f"{entry['name']}: digest mismatch (manifest {_describe(entry['manifest'])}; "
+              f"attested {_describe(entry['attested']) or 'no digest'})")
+
+    summary = (
+        f"{len(report.covered)} covered, {len(report.unattested)} without provenance, "
+        f"{len(report.unlisted)} not in manifest, {len(report.mismatched)} mismatched — "
+        f"{report.slsa_statements} SLSA statement(s) in {report.seconds:.2f}s"
+    )
+    print(("✓ " if report.passed else "✗ ") + summary)
+    return 0 if report.passed else 1
@@ -0,0 +1,356 @@
+"""
+Deterministic zipapp builder for provenance-demo.pyz.
+
+Used by scripts/build_pyz.sh (``python -m demo_cli.build_pyz``) and by
+``verify --rebuild``. The archive is written in one pass: the shebang goes
+first, then each member is streamed out as soon as it is ready, then the
+central directory. Members are read, compiled and deflated on a thread pool
+(zlib releases the GIL) but always written in sorted order, so the output
+depends only on the inputs, never on scheduling.
+
+Every member gets the SOURCE_DATE_EPOCH timestamp and 0644 permissions, and
+each ``.py`` is accompanied by a checked-hash ``.pyc`` for the build
+interpreter (zipimport loads ``name.pyc`` next to ``name.py``; interpreters
+with a different bytecode magic fall back to the source).
+
+A stamp file next to the output records a hash of the source tree and build
+inputs; when it matches, the existing archive is reused without rebuilding.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .digests import hash_file
+
+# Bump when the archive layout changes so old stamps stop matching
+BUILDER_VERSION = "1"
+
+DEFAULT_SHEBANG = b"#!/usr/bin/env python3\n"
+MAIN_MODULE = b"from demo_cli.cli import main\nmain()\n"
+COMPRESS_LEVEL = 6
+EXCLUDED_DIRS = {"__pycache__"}
+EXCLUDED_SUFFIXES = {".pyc", ".pyo"}
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_ZIP_VERSION = 20       # 2.0: deflate
+_UNIX = 3
+_DEFLATED = 8
+_UTF8_FLAG = 0x800
+_MAX_ENTRIES = 0xFFFF   # no zip64: the archive is a few hundred KiB
+_MAX_SIZE = 0xFFFFFFFF
+
+
+class BuildResult:
+    """Outcome of a zipapp build."""
+
+    def __init__(self, output: Path, sha256: str, inputs_hash: str, members: int, rebuilt: bool):
+        self.output = output
+        self.sha256 = sha256
+        self.inputs_hash = inputs_hash
+        self.members = members
+        self.rebuilt = rebuilt
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON export."""
+        return {
+            "output": str(self.output),
+            "sha256": self.sha256,
+            "inputs_hash": self.inputs_hash,
+            "members": self.members,
+            "rebuilt": self.rebuilt,
+        }
+
+
+def collect_sources(src_dir: Path) -> List[Tuple[str, Path]]:
+    """
+    List the files to pack, as (archive name, path) sorted by archive name.
+
+    Bytecode caches are skipped: they depend on the machine that produced them.
+    """
+    files = []
+    for root, dirs, names in os.walk(src_dir):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        for name in names:
+            path = Path(root) / name
+            if path.suffix in EXCLUDED_SUFFIXES or not path.is_file():
+                continue
+            files.append((path.relative_to(src_dir).as_posix(), path))
+    return sorted(files)
+
+
+def _dos_datetime(epoch: int) -> Tuple[int, int]:
+    # ZIP timestamps start in 1980 and have two-second resolution
+    year, month, day, hour, minute, second = time.gmtime(max(epoch, 315532800))[:6]
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def compile_checked_pyc(source: bytes, arcname: str) -> bytes:
+    """
+    Compile source to checked-hash .pyc bytes (PEP 552), as py_compile does.
+
+    The code object's filename is the archive name so the build directory
+    does not leak into the bytecode.
+    """
+    code = compile(source, arcname, "exec", dont_inherit=True)
+    flags = 0b11  # hash-based, check source
+    return (
+        importlib.util.MAGIC_NUMBER
+        + flags.to_bytes(4, "little")
+        + importlib.util.source_hash(source)
+        + marshal.dumps(code)
+    )
+
+
+def inputs_hash(
+    sources: List[Tuple[str, Path]],
+    source_date_epoch: int,
+    shebang: bytes,
+    bytecode: bool,
+) -> str:
+    """Hash of everything that determines the archive bytes."""
+    digest = hashlib.sha256()
+    header = {
+        "builder": BUILDER_VERSION,
+        "epoch": source_date_epoch,
+        "shebang": shebang.decode("utf-8", errors="replace"),
+        "bytecode": sys.implementation.cache_tag if bytecode else None,
+        "zlib": zlib.ZLIB_RUNTIME_VERSION,
+        "level": COMPRESS_LEVEL,
+    }
+    digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    for arcname, path in sources:
+        digest.update(b"\0" + arcname.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _members(sources: List[Tuple[str, Path]], bytecode: bool) -> List[Tuple[str, object]]:
+    """Archive members in write order: __main__.py, then sources and bytecode sorted by name."""
+    members: List[Tuple[str, object]] = []
+    for arcname, path in sources:
+        members.append((arcname, path))
+        if bytecode and arcname.endswith(".py"):
+            members.append((arcname + "c", ("pyc", path, arcname)))
+    members.sort(key=lambda member: member[0])
+    return [("__main__.py", MAIN_MODULE)] + members
+
+
+def _prepare(member: Tuple[str, object]) -> Tuple[str, int, int, bytes]:
+    """Load and deflate one member. Runs on a worker thread."""
+    arcname, origin = member
+    if isinstance(origin, bytes):
+        data = origin
+    elif isinstance(origin, tuple):
+        _, path, source_name = origin
+        data = compile_checked_pyc(path.read_bytes(), source_name)
+    else:
+        data = origin.read_bytes()
+
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return arcname, zlib.crc32(data), len(data), compressed
+
+
+def _prepared(members: List[Tuple[str, object]], workers: int) -> Iterator[Tuple[str, int, int, bytes]]:
+    """Prepare members in parallel, yielding them in order with a bounded look-ahead."""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="build-pyz") as pool:
+        window: deque = deque()
+        for member in members:
+            window.append(pool.submit(_prepare, member))
+            if len(window) >= workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def write_zipapp(
+    output,
+    members: List[Tuple[str, object]],
+    source_date_epoch: int,
+    shebang: bytes = DEFAULT_SHEBANG,
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Write a zipapp to a binary file object.
+
+    Args:
+        output: Writable binary file object positioned at the start.
+        members: (archive name, bytes or Path or ("pyc", path, name)) in write order.
+        source_date_epoch: Timestamp for every member.
+        shebang: Bytes written before the archive.
+        workers: Threads used to read and compress members.
+
+    Returns:
+        Number of members written.
+    """
+    if len(members) > _MAX_ENTRIES:
+        raise ValueError(f"Too many members for a non-zip64 archive: {len(members)}")
+
+    dos_time, dos_date = _dos_datetime(source_date_epoch)
+    external_attr = 0o644 << 16
+    central = []
+    offset = 0
+
+    output.write(shebang)
+    offset += len(shebang)
+
+    for arcname, crc, size, compressed in _prepared(members, workers or min(8, os.cpu_count() or 1)):
+        if size > _MAX_SIZE or offset > _MAX_SIZE:
+            raise ValueError(f"{arcname}: archive too large without zip64")
+        name = arcname.encode("utf-8")
+        flags = 0 if name.isascii() else _UTF8_FLAG
+        header = _LOCAL_HEADER.pack(
+            b"PK\x03\x04", _ZIP_VERSION, 0, flags, _DEFLATED, dos_time, dos_date,
+            crc, len(compressed), size, len(name), 0,
+        )
+        output.write(header)
+        output.write(name)
+        output.write(compressed)
+
+        central.append(_CENTRAL_HEADER.pack(
+            b"PK\x01\x02", _ZIP_VERSION, _UNIX, _ZIP_VERSION, 0, flags, _DEFLATED, dos_time, dos_date,
+            crc, len(compressed), size, len(name), 0, 0, 0, 0, external_attr, offset,
+        ) + name)
+        offset += len(header) + len(name) + len(compressed)
+
+    directory = b"".join(central)
+    output.write(directory)
+    output.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, len(central), len(central), len(directory), offset, 0))
+    return len(central)
+
+
+def _stamp_path(output: Path) -> Path:
+    return output.with_name(output.name + ".stamp")
+
+
+def _sha256(path: Path) -> str:
+    return hash_file(path)["sha256"]
+
+
+def build(
+    src_dir: Path,
+    output: Path,
+    source_date_epoch: int,
+    shebang: bytes = DEFAULT_SHEBANG,
+    bytecode: bool = True,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> BuildResult:
+    """
+    Build the zipapp, skipping the work when nothing changed since the last build.
+
+    Args:
+        src_dir: Directory whose contents become the archive root (e.g. src/).
+        output: Path of the .pyz to write.
+        source_date_epoch: Timestamp applied to every member.
+        shebang: Interpreter line written before the archive.
+        bytecode: Embed checked-hash .pyc files for the running interpreter.
+        workers: Threads used to read and compress members.
+        force: Rebuild even if the stamp matches.
+
+    Returns:
+        BuildResult describing the archive.
+    """
+    sources = collect_sources(src_dir)
+    if not any(arcname.endswith(".py") for arcname, _ in sources):
+        raise FileNotFoundError(f"No Python sources found in {src_dir}")
+
+    digest = inputs_hash(sources, source_date_epoch, shebang, bytecode)
+    stamp_file = _stamp_path(output)
+
+    if not force and output.exists():
+        try:
+            stamp = json.loads(stamp_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            stamp = None
+        if isinstance(stamp, dict) and stamp.get("inputs_hash") == digest:
+            existing = _sha256(output)
+            # Only trust the stamp if the archive is still the one it describes
+            if stamp.get("sha256") == existing:
+                return BuildResult(output, existing, digest, stamp.get("members", 0), rebuilt=False)
+
+    members = _members(sources, bytecode)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            count = write_zipapp(f, members, source_date_epoch, shebang, workers)
+        os.chmod(tmp_name, 0o755)
+        os.replace(tmp_name, output)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    sha256 = _sha256(output)
+    stamp_file.write_text(
+        json.dumps({"inputs_hash": digest, "sha256": sha256, "members": count}, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    return BuildResult(output, sha256, digest, count, rebuilt=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m demo_cli.build_pyz",
+        description="Build provenance-demo.pyz deterministically",
+    )
+    parser.add_argument("--src", default="src", help="Source root packed into the archive (default: src)")
+    parser.add_argument("--output", "-o", default="dist/provenance-demo.pyz", help="Output .pyz path")
+    parser.add_argument(
+        "--source-date-epoch",
+        type=int,
+        default=None,
+        help="Member timestamp (default: $SOURCE_DATE_EPOCH, else now)",
+    )
+    parser.add_argument("--no-bytecode", action="store_true", help="Do not embed precompiled .pyc files")
+    parser.add_argument("--workers", type=int, help="Compression threads (default: CPU count, max 8)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--json", action="store_true", help="Print the build result as JSON")
+    args = parser.parse_args(argv)
+
+    epoch = args.source_date_epoch
+    if epoch is None:
+        epoch = int(os.environ.get("SOURCE_DATE_EPOCH") or time.time())
+
+    try:
+        result = build(
+            Path(args.src),
+            Path(args.output),
+            epoch,
+            bytecode=not args.no_bytecode,
+            workers=args.workers,
+            force=args.force,
+        )
+    except (OSError, ValueError, SyntaxError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    elif result.rebuilt:
+        print(f"✅ Built {result.output} ({result.members} members, sha256 {result.sha256})")
+    else:
+        print(f"✅ {result.output} is up to date (sha256 {result.sha256})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Caches shared by verification runs.
+
+``StatCache`` keeps parsed evidence (digests, attestation bundles, SBOMs, OSV
+results) in memory keyed by the file's identity, so a long-running process
+such as ``provenance-demo serve`` only re-reads files that changed.
+``DigestCache`` keeps file digests across runs in a SQLite database, so
+regenerating a checksum manifest only hashes new or changed files.
+
+The on-disk cache root is ``$PROVENANCE_CACHE_DIR`` if set, otherwise
+``$XDG_CACHE_HOME/provenance-demo`` (``~/.cache/provenance-demo``), or
+``%LOCALAPPDATA%\\provenance-demo`` on Windows.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+def cache_dir() -> Path:
+    """Return the cache root directory (not created)."""
+    override = os.getenv("PROVENANCE_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    if sys.platform == "win32" and os.getenv("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "provenance-demo"
+
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "provenance-demo"
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """Read a JSON cache file, returning None if it is missing or corrupt."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: Path, data: Any) -> bool:
+    """
+    Atomically write a JSON cache file.
+
+    Returns False instead of raising when the cache location is not writable;
+    caches are an optimization and must never fail a verification.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return True
+    except OSError:
+        return False
+
+
+def file_signature(path: Path) -> Tuple[int, int, int, int, int]:
+    """Identity of a file's current contents: device, inode, size, mtime and ctime."""
+    stat = os.stat(path)
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+
+class StatCache:
+    """In-memory LRU cache of values derived from files, invalidated on change."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, path: Path, namespace: str, loader: Callable[[Path], Any]) -> Any:
+        """
+        Return loader(path), reusing the previous value while the file is unchanged.
+
+        Args:
+            path: File the value is derived from.
+            namespace: Kind of value (e.g. "digest:sha256", "json").
+            loader: Computes the value; exceptions propagate and are not cached.
+        """
+        signature = file_signature(path)
+        key = (namespace, os.path.abspath(path))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader(path)
+
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DigestCache:
+    """Persistent file digests keyed by path and algorithm, invalidated on change."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file. Defaults to digests.sqlite in the cache directory.
+
+        A cache that cannot be opened or written behaves as an empty one.
+        """
+        import sqlite3
+
+        self.path = path or cache_dir() / "digests.sqlite"
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._errors = (sqlite3.Error, OSError)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS digests ("
+                "path TEXT NOT NULL, algorithm TEXT NOT NULL, signature TEXT NOT NULL, digest TEXT NOT NULL, "
+                "PRIMARY KEY (path, algorithm))"
+            )
+        except self._errors:
+            self._db = None
+
+    @staticmethod
+    def _signature(signature: Tuple) -> str:
+        return json.dumps(list(signature))
+
+    def get(self, path: Path, algorithm: str, signature: Tuple) -> Optional[str]:
+        """Cached digest of path, if it was stored for the same file signature."""
+        row = None
+        if self._db is not None:
+            with self._lock:
+                try:
+                    row = self._db.execute(
+                        "SELECT digest FROM digests WHERE path = ? AND algorithm = ? AND signature = ?",
+                        (os.path.abspath(path), algorithm, self._signature(signature)),
+                    ).fetchone()
+                except self._errors:
+                    row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, path: Path, algorithm: str, signature: Tuple, digest: str):
+        """Store a digest computed while the file had signature (see file_signature)."""
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO digests (path, algorithm, signature, digest) VALUES (?, ?, ?, ?)",
+                    (os.path.abspath(path), algorithm, self._signature(signature), digest),
+                )
+            except self._errors:
+                pass
+
+    def close(self):
+        """Commit stored digests and close the database."""
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.commit()
+                self._db.close()
+            except self._errors:
+                pass
+            self._db = None
+
+
+_default_stat_cache: Optional[StatCache] = None
+_default_stat_cache_lock = threading.Lock()
+
+
+def get_default_stat_cache() -> StatCache:
+    """Return the in-memory cache shared by every verification in this process."""
+    global _default_stat_cache
+    with _default_stat_cache_lock:
+        if _default_stat_cache is None:
+            _default_stat_cache = StatCache()
+        return _default_stat_cache
@@ -0,0 +1,135 @@
+"""
+Record and replay of external tool invocations (verify --record/--replay).
+
+While recording, every cosign/gh/osv-scanner call a check makes is saved as
+one JSON file holding the command line, exit code, stdout, stderr and
+duration. Replaying serves the same calls from those files without spawning
+anything, so the checks run their usual parsing paths offline and in
+milliseconds.
+
+Calls are keyed by the tool name and its arguments. Arguments naming an
+existing file are replaced by the file name plus its sha256, so a cassette
+recorded in one directory replays in another as long as the inputs are
+byte-identical, and stops matching as soon as an input changes.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cache import StatCache
+from .digests import file_digest
+
+RECORD = "record"
+REPLAY = "replay"
+
+SCHEMA_VERSION = 1
+
+
+class CassetteMiss(LookupError):
+    """Raised when replaying a call that was not recorded."""
+
+
+class Cassette:
+    """A directory of recorded tool invocations."""
+
+    def __init__(self, directory: Path, mode: str, cache: Optional[StatCache] = None):
+        """
+        Initialize the cassette.
+
+        Args:
+            directory: Directory holding one JSON file per recorded call.
+            mode: RECORD to save calls, REPLAY to serve them.
+            cache: Digest cache for input files (defaults to a private one).
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"unknown cassette mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.cache = cache if cache is not None else StatCache()
+        if mode == RECORD:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def request(self, tool: str, args: List[str]) -> Dict:
+        """The normalized, path-independent form of a call."""
+        argv = [tool]
+        inputs = {}
+        for arg in args:
+            path = Path(arg)
+            if os.path.isfile(arg):
+                argv.append(f"file:{path.name}")
+                inputs[path.name] = file_digest(path, "sha256", self.cache)
+            else:
+                argv.append(arg)
+        return {"argv": argv, "inputs": inputs}
+
+    def _path(self, tool: str, request: Dict) -> Path:
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+        return self.directory / f"{tool}-{key[:16]}.json"
+
+    def record(
+        self,
+        tool: str,
+        args: List[str],
+        result: Optional[subprocess.CompletedProcess] = None,
+        duration_ms: float = 0.0,
+        error: Optional[str] = None,
+    ):
+        """
+        Save one call.
+
+        Args:
+            tool: Tool name, e.g. "cosign".
+            args: Arguments the tool was run with.
+            result: The completed process, unless the call raised.
+            duration_ms: Wall-clock duration of the call.
+            error: "missing" when the tool is not installed, "timeout" when
+                the call timed out.
+        """
+        request = self.request(tool, args)
+        entry = {
+            "schema": SCHEMA_VERSION,
+            **request,
+            "error": error,
+            "exit_code": result.returncode if result is not None else None,
+            "stdout": result.stdout if result is not None else "",
+            "stderr": result.stderr if result is not None else "",
+            "duration_ms": round(duration_ms, 3),
+            "recorded": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        path = self._path(tool, request)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+
+    def replay(self, tool: str, args: List[str], timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Serve a recorded call.
+
+        Raises:
+            FileNotFoundError: The tool was not installed when recording.
+            subprocess.TimeoutExpired: The call timed out when recording.
+            CassetteMiss: No call with these arguments and inputs was recorded.
+        """
+        request = self.request(tool, args)
+        path = self._path(tool, request)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            raise CassetteMiss(f"no recorded call for {' '.join(request['argv'])} in {self.directory}") from None
+
+        if entry.get("error") == "missing":
+            raise FileNotFoundError(errno.ENOENT, f"{tool} not found on PATH (recorded)", tool)
+        if entry.get("error") == "timeout":
+            raise subprocess.TimeoutExpired([tool, *args], timeout or 0)
+        return subprocess.CompletedProcess([tool, *args], entry["exit_code"], entry["stdout"], entry["stderr"])
@@ -0,0 +1,586 @@
+"""
+Checksum manifests: parsing, checking (verify-manifest) and generation
+(checksums generate).
+
+Understands the formats release checksums are published in:
+
+- GNU coreutils (``sha256sum``): ``<hex>  name`` or ``<hex> *name`` (binary
+  mode), including backslash-escaped names
+- BSD / ``sha256sum --tag``: ``SHA256 (name) = <hex>``, any algorithm and
+  several algorithms per file
+- SHA256SUMS / SHA512SUMS: GNU lines whose algorithm follows from the file name
+- single-value files (``app.pyz.sha256``) holding only the digest
+
+A manifest is parsed in one pass into a name -> {algorithm: digest} index.
+Parsed manifests are kept per content digest (and while the file is
+unchanged, per the stat cache), so checking thousands of artifacts against
+one ``checksums.txt`` reads and parses it once instead of scanning it for
+every artifact.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .cache import DigestCache, StatCache, file_signature
+from .digests import default_workers, hash_files, is_rotational
+from .timing import add_bytes, phase
+
+# Hex digest length of each algorithm a manifest may use
+DIGEST_HEX_LENGTHS = {
+    "md5": 32,
+    "sha1": 40,
+    "sha224": 56,
+    "sha256": 64,
+    "sha384": 96,
+    "sha512": 128,
+}
+
+# Algorithms the checksum check trusts, in order of preference. Manifests may
+# also list md5/sha1/sha224 entries; those are parsed but never verified against.
+VERIFIED_ALGORITHMS = ("sha256", "sha512", "sha384")
+
+# Algorithm assumed for an untagged digest of a given length
+_ALGORITHM_BY_LENGTH = {length: name for name, length in DIGEST_HEX_LENGTHS.items()}
+
+# SHA256SUMS-style names, or a trailing .sha256-style suffix (app.pyz.sha256)
+_HINT_RE = re.compile(r"^(?:(md5|sha1|sha224|sha256|sha384|sha512)sums|.+\.(md5|sha1|sha224|sha256|sha384|sha512))$", re.IGNORECASE)
+
+_MAX_CACHED = 64
+
+
+def algorithm_hint(filename: str) -> Optional[str]:
+    """Algorithm implied by a manifest's name, e.g. SHA512SUMS or app.pyz.sha256."""
+    match = _HINT_RE.match(filename)
+    return (match.group(1) or match.group(2)).lower() if match else None
+
+
+def _normalize_algorithm(tag: str) -> str:
+    # BSD tags: SHA256, SHA2-256 (some BSDs), SHA512, MD5, BLAKE2b
+    return tag.strip().lower().replace("sha2-", "sha").replace("-", "")
+
+
+def _unescape(name: str) -> str:
+    # GNU escapes "\" and newline in names and marks such lines with a leading "\"
+    return name.replace("\\\\", "\0").replace("\\n", "\n").replace("\0", "\\")
+
+
+class ChecksumManifest:
+    """Index of the digests listed in one checksum manifest."""
+
+    def __init__(self, source: str = "", digest: str = ""):
+        self.source = source
+        self.digest = digest
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.single: Optional[Tuple[str, str]] = None
+        self.invalid_lines: List[int] = []
+        self._basenames: Dict[str, Optional[str]] = {}
+
+    def add(self, name: str, algorithm: str, digest: str):
+        if name.startswith("./"):
+            name = name[2:]
+        self.entries.setdefault(name, {})[algorithm] = digest
+        basename = name.rsplit("/", 1)[-1]
+        if basename in self._basenames and self._basenames[basename] != name:
+            self._basenames[basename] = None  # ambiguous: only exact paths match
+        else:
+            self._basenames[basename] = name
+
+    def lookup(self, name: str) -> Dict[str, str]:
+        """
+        Digests listed for name.
+
+        Args:
+            name: Path as written in the manifest, or a file name that
+                matches exactly one entry.
+
+        Returns:
+            Mapping of algorithm to hex digest; empty when not listed. A
+            single-value manifest applies to any name.
+        """
+        entry = self.entries.get(name)
+        if entry is None:
+            path = self._basenames.get(name.rsplit("/", 1)[-1])
+            entry = self.entries.get(path) if path else None
+        if entry is None and self.single is not None:
+            entry = {self.single[0]: self.single[1]}
+        return dict(entry) if entry else {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        return bool(self.lookup(name))
+
+
+def parse_manifest(text: str, hint: Optional[str] = None, source: str = "", digest: str = "") -> ChecksumManifest:
+    """
+    Parse checksum manifest text in a single pass.
+
+    Args:
+        text: Manifest contents.
+        hint: Algorithm for untagged digests (from the manifest name). By
+            default it is inferred from the digest length.
+        source: Where the text came from, for messages.
+        digest: sha256 of the manifest bytes.
+
+    Returns:
+        The parsed manifest. Lines that match no format are listed in
+        invalid_lines; digests are not validated here.
+    """
+    manifest = ChecksumManifest(source, digest)
+    for number, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        escaped = line.startswith("\\")
+        if escaped:
+            line = line[1:]
+
+        # BSD: ALGO (name) = digest
+        tag, open_paren, rest = line.partition(" (")
+        if open_paren and tag.replace("-", "").isalnum():
+            name, close, value = rest.rpartition(") = ")
+            if close and value and " " not in value:
+                manifest.add(_unescape(name) if escaped else name, _normalize_algorithm(tag), value)
+                continue
+
+        # GNU: digest, a space, then " " (text) or "*" (binary) and the name
+        value, space, name = line.partition(" ")
+        if not space or name in ("-", " -", "*-"):
+            algorithm = hint or _ALGORITHM_BY_LENGTH.get(len(value), "sha256")
+            if manifest.single is None:
+                manifest.single = (algorithm, value)
+            continue
+        if name[:1] in (" ", "*"):
+            name = name[1:]
+        if not name:
+            manifest.invalid_lines.append(number)
+            continue
+        algorithm = hint or _ALGORITHM_BY_LENGTH.get(len(value), "sha256")
+        manifest.add(_unescape(name) if escaped else name, algorithm, value)
+    return manifest
+
+
+_parsed: "OrderedDict[Tuple[str, Optional[str]], ChecksumManifest]" = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+def _read_manifest(path: Path) -> ChecksumManifest:
+    data = path.read_bytes()
+    add_bytes(len(data))
+    digest = hashlib.sha256(data).hexdigest()
+    hint = algorithm_hint(path.name)
+    key = (digest, hint)
+    with _parsed_lock:
+        manifest = _parsed.get(key)
+        if manifest is not None:
+            _parsed.move_to_end(key)
+            return manifest
+
+    manifest = parse_manifest(data.decode("utf-8", errors="replace"), hint, str(path), digest)
+    with _parsed_lock:
+        _parsed[key] = manifest
+        while len(_parsed) > _MAX_CACHED:
+            _parsed.popitem(last=False)
+    return manifest
+
+
+def load_manifest(path: Path, cache: Optional[StatCache] = None) -> ChecksumManifest:
+    """
+    Load and index a checksum manifest.
+
+    Args:
+        path: Manifest file (checksums.txt, SHA256SUMS, app.pyz.sha256, ...).
+        cache: Stat cache; while the file is unchanged it is not re-read.
+
+    Returns:
+        The parsed manifest, shared with every caller that loads a manifest
+        with the same contents.
+    """
+    path = Path(path)
+    with phase("parse", {"file.path": str(path)}):
+        if cache is None:
+            return _read_manifest(path)
+        return cache.get_or_load(path, "checksum-manifest", _read_manifest)
+
+
+class ManifestReport:
+    """Outcome of checking every file listed in a manifest."""
+
+    def __init__(self, manifest: Path, root: Path, workers: int):
+        self.manifest = manifest
+        self.root = root
+        self.workers = workers
+        self.rotational: Optional[bool] = None
+        self.ok = 0
+        self.mismatched: List[str] = []
+        self.missing: List[str] = []
+        self.invalid: List[str] = []
+        self.outside: List[str] = []
+        self.extra: List[str] = []
+        self.bytes_hashed = 0
+        self.seconds = 0.0
+        self.stopped_early = False
+
+    @property
+    def passed(self) -> bool:
+        return not (self.mismatched or self.missing or self.invalid or self.outside)
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_hashed / 2 ** 20 / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON export."""
+        return {
+            "manifest": str(self.manifest),
+            "root": str(self.root),
+            "passed": self.passed,
+            "ok": self.ok,
+            "mismatched": sorted(self.mismatched),
+            "missing": sorted(self.missing),
+            "invalid": sorted(self.invalid),
+            "outside": sorted(self.outside),
+            "extra": self.extra,
+            "bytes_hashed": self.bytes_hashed,
+            "seconds": round(self.seconds, 3),
+            "mb_per_s": round(self.mb_per_s, 1),
+            "workers": self.workers,
+            "rotational": self.rotational,
+            "stopped_early": self.stopped_early,
+        }
+
+
+def _is_manifest_companion(name: str, manifest_name: str) -> bool:
+    # The manifest itself and its signatures (checksums.txt.sigstore, SHA256SUMS.asc, ...)
+    return name == manifest_name or name.startswith(manifest_name + ".")
+
+
+def find_extra_files(root: Path, manifest: ChecksumManifest, manifest_name: str) -> List[str]:
+    """Files under root (relative POSIX paths, sorted) that the manifest does not list."""
+    extra = []
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        relative = Path(directory).relative_to(root).as_posix()
+        for name in sorted(files):
+            path = name if relative == "." else f"{relative}/{name}"
+            if path not in manifest.entries and not _is_manifest_companion(path, manifest_name):
+                extra.append(path)
+    return extra
+
+
+def check_manifest(
+    manifest_path: Path,
+    root: Optional[Path] = None,
+    workers: Optional[int] = None,
+    stop_on_first_mismatch: bool = False,
+    on_progress: Optional[Callable[[int, int, int], None]] = None,
+) -> ManifestReport:
+    """
+    Hash every file a manifest lists and compare it with the listed digests.
+
+    Args:
+        manifest_path: Checksum manifest in any format parse_manifest reads.
+        root: Directory the listed paths are relative to (default: the
+            manifest's directory).
+        workers: Hashing threads (default: sized to the storage under root).
+        stop_on_first_mismatch: Stop at the first mismatched or unreadable file.
+        on_progress: Called with (files done, files total, bytes hashed)
+            after each file.
+
+    Returns:
+        The report, including files under root the manifest does not list.
+        Listed names that resolve outside root (absolute paths, ``..``) are
+        reported as outside and never opened.
+
+    Raises:
+        OSError: The manifest cannot be read.
+        ValueError: The manifest is a single-value file (``app.pyz.sha256``)
+            that names no files to check.
+    """
+    manifest = load_manifest(manifest_path)
+    if not manifest.entries and manifest.single is not None:
+        raise ValueError(f"{manifest_path} holds a single digest and lists no files; "
+                         "verify the artifact next to it with verify --checks checksum")
+    root = Path(root) if root is not None else Path(manifest_path).parent
+    report = ManifestReport(Path(manifest_path), root, workers or default_workers(root))
+    report.rotational = is_rotational(root)
+
+    resolved_root = root.resolve()
+    expected: Dict[Path, Tuple[str, Dict[str, str]]] = {}
+    for name, listed in manifest.entries.items():
+        try:
+            (root / name).resolve().relative_to(resolved_root)
+        except ValueError:
+            report.outside.append(name)
+            continue
+        usable = {
+            algorithm: digest.lower() for algorithm, digest in listed.items()
+            if len(digest) == DIGEST_HEX_LENGTHS.get(algorithm) and all(c in "0123456789abcdefABCDEF" for c in digest)
+        }
+        if usable:
+            expected[root / name] = (name, usable)
+        else:
+            report.invalid.append(name)
+
+    started = time.perf_counter()
+    done = 0
+    results = hash_files(((path, tuple(usable)) for path, (_, usable) in expected.items()), report.workers)
+    try:
+        for path, outcome in results:
+            done += 1
+            name, usable = expected[path]
+            if isinstance(outcome, OSError):
+                report.missing.append(name)
+            else:
+                digests, size = outcome
+                report.bytes_hashed += size
+                if digests == usable:
+                    report.ok += 1
+                else:
+                    report.mismatched.append(name)
+            if on_progress is not None:
+                on_progress(done, len(expected), report.bytes_hashed)
+            if stop_on_first_mismatch and (report.mismatched or report.missing):
+                report.stopped_early = done < len(expected)
+                break
+    finally:
+        results.close()
+    report.seconds = time.perf_counter() - started
+
+    if not report.stopped_early:
+        report.extra = find_extra_files(root, manifest, Path(manifest_path).name)
+    return report
+
+
+class _Progress:
+    """One-line progress on a terminal: files done, data hashed and MB/s."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.started = time.perf_counter()
+        self._last = 0.0
+
+    def __call__(self, done: int, total: int, bytes_hashed: int):
+        now = time.perf_counter()
+        if done < total and now - self._last < 0.1:
+            return
+        self._last = now
+        elapsed = now - self.started
+        rate = bytes_hashed / 2 ** 20 / elapsed if elapsed else 0.0
+        self.stream.write(f"\r{done}/{total} files  {bytes_hashed / 2 ** 20:,.1f} MB  {rate:,.1f} MB/s ")
+        self.stream.flush()
+
+    def finish(self):
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+def verify_manifest_command(args) -> int:
+    """Run the verify-manifest command: 0 when every listed file matches, 1 otherwise, 2 on error."""
+    manifest_path = Path(args.manifest)
+    as_json = getattr(args, 'json', False)
+    progress = _Progress(sys.stderr) if sys.stderr.isatty() and not as_json else None
+
+    try:
+        report = check_manifest(
+            manifest_path,
+            root=Path(args.root) if getattr(args, 'root', None) else None,
+            workers=getattr(args, 'jobs', None),
+            stop_on_first_mismatch=getattr(args, 'stop_on_first_mismatch', False),
+            on_progress=progress,
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if progress is not None:
+            progress.finish()
+
+    failed = not report.passed or (getattr(args, 'strict', False) and report.extra)
+    if as_json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return 1 if failed else 0
+
+    for name in sorted(report.mismatched):
+        print(f"{name}: FAILED")
+    for name in sorted(report.missing):
+        print(f"{name}: FAILED open or read")
+    for name in sorted(report.invalid):
+        print(f"{name}: FAILED improperly formatted checksum")
+    for name in sorted(report.outside):
+        print(f"{name}: FAILED outside {report.root}")
+    for name in report.extra:
+        print(f"{name}: not in manifest")
+
+    storage = {True: "rotational", False: "non-rotational", None: "unknown storage"}[report.rotational]
+    summary = (
+        f"{report.ok} OK, {len(report.mismatched)} mismatched, {len(report.missing)} missing, "
+        f"{len(report.extra)} extra — {report.bytes_hashed / 2 ** 20:,.1f} MB in {report.seconds:.2f}s "
+        f"({report.mb_per_s:,.1f} MB/s, {report.workers} worker(s), {storage})"
+    )
+    if report.stopped_early:
+        summary += "; stopped at first mismatch"
+    print(("✗ " if failed else "✓ ") + summary)
+    return 1 if failed else 0
+
+
+def _escape(name: str) -> Tuple[str, str]:
+    # GNU convention: escape "\" and newline, and mark the line with a leading "\"
+    if "\\" not in name and "\n" not in name:
+        return "", name
+    return "\\", name.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def format_manifest(digests: Dict[str, Dict[str, str]], algorithms: Sequence[str]) -> str:
+    """
+    Render digests as a manifest, sorted by path.
+
+    One algorithm gives GNU lines (``<hex>  name``, as written by sha256sum);
+    several give BSD-tagged lines (``SHA256 (name) = <hex>``), one per
+    algorithm in the given order.
+    """
+    lines = []
+    for name in sorted(digests):
+        prefix, escaped = _escape(name)
+        if len(algorithms) == 1:
+            lines.append(f"{prefix}{digests[name][algorithms[0]]}  {escaped}")
+        else:
+            lines.extend(f"{prefix}{algorithm.upper()} ({escaped}) = {digests[name][algorithm]}" for algorithm in algorithms)
+    return "".join(line + "\n" for line in lines)
+
+
+def list_files(directory: Path, exclude: Sequence[str] = ()) -> List[str]:
+    """Regular files under directory as sorted relative POSIX paths, skipping dotfiles."""
+    files = []
+    for current, subdirs, names in os.walk(directory):
+        subdirs[:] = [d for d in subdirs if not d.startswith(".")]
+        relative = Path(current).relative_to(directory).as_posix()
+        for name in names:
+            path = name if relative == "." else f"{relative}/{name}"
+            if name.startswith(".") or any(_is_manifest_companion(path, skip) for skip in exclude):
+                continue
+            if os.path.isfile(os.path.join(current, name)):
+                files.append(path)
+    return sorted(files)
+
+
+class GeneratedManifest:
+    """Digests of a directory plus how many were served from the cache."""
+
+    def __init__(self, digests: Dict[str, Dict[str, str]], algorithms: Sequence[str], hashed: int, cached: int):
+        self.digests = digests
+        self.algorithms = list(algorithms)
+        self.hashed = hashed
+        self.cached = cached
+
+    def text(self) -> str:
+        return format_manifest(self.digests, self.algorithms)
+
+
+def generate_manifest(
+    directory: Path,
+    algorithms: Sequence[str] = ("sha256",),
+    workers: Optional[int] = None,
+    cache: Optional[DigestCache] = None,
+    exclude: Sequence[str] = (),
+) -> GeneratedManifest:
+    """
+    Hash every file under directory for a checksum manifest.
+
+    Args:
+        directory: Directory to list (dotfiles are skipped).
+        algorithms: Algorithms to compute, e.g. ("sha256", "sha512").
+        workers: Hashing threads (default: sized to the storage).
+        cache: Persistent digest cache; files whose signature is unchanged
+            are not read again.
+        exclude: Relative paths to leave out, with their companions (the
+            manifest being written and its signatures).
+
+    Returns:
+        The digests per relative path.
+    """
+    unknown = [algorithm for algorithm in algorithms if algorithm not in DIGEST_HEX_LENGTHS]
+    if unknown:
+        raise ValueError(f"unsupported algorithm(s): {', '.join(unknown)}")
+    directory = Path(directory)
+
+    digests: Dict[str, Dict[str, str]] = {}
+    pending: Dict[Path, Tuple[str, Tuple]] = {}
+    for name in list_files(directory, exclude):
+        path = directory / name
+        signature = file_signature(path)
+        known = {}
+        if cache is not None:
+            for algorithm in algorithms:
+                digest = cache.get(path, algorithm, signature)
+                if digest is not None:
+                    known[algorithm] = digest
+        if len(known) == len(algorithms):
+            digests[name] = known
+        else:
+            pending[path] = (name, signature)
+
+    for path, outcome in hash_files(((path, tuple(algorithms)) for path in pending), workers or default_workers(directory)):
+        if isinstance(outcome, OSError):
+            raise outcome
+        name, signature = pending[path]
+        digests[name] = outcome[0]
+        if cache is not None:
+            for algorithm, digest in outcome[0].items():
+                cache.put(path, algorithm, signature, digest)
+
+    return GeneratedManifest(digests, algorithms, hashed=len(pending), cached=len(digests) - len(pending))
+
+
+def checksums_generate_command(args) -> int:
+    """Run `checksums generate`: write a manifest for a directory. Exit status 0, or 2 on error."""
+    directory = Path(args.directory)
+    algorithms = [a.strip().lower() for a in (getattr(args, 'algo', None) or "sha256").split(",") if a.strip()]
+    output = Path(args.output) if getattr(args, 'output', None) else None
+
+    exclude = []
+    if output is not None:
+        try:
+            exclude.append(output.resolve().relative_to(directory.resolve()).as_posix())
+        except ValueError:
+            pass  # written outside the directory
+
+    if not directory.is_dir():
+        print(f"❌ Error: not a directory: {directory}", file=sys.stderr)
+        return 2
+
+    cache = None if getattr(args, 'no_cache', False) else DigestCache()
+    started = time.perf_counter()
+    try:
+        generated = generate_manifest(directory, algorithms, getattr(args, 'jobs', None), cache, exclude)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if cache is not None:
+            cache.close()
+
+    text = generated.text()
+    if output is None:
+        sys.stdout.write(text)
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output.with_name(f".{output.name}.tmp")
+        tmp.write_text(text, encoding="utf-8", newline="\n")
+        os.replace(tmp, output)
+
+    print(
+        f"✓ {len(generated.digests)} file(s), {generated.hashed} hashed, {generated.cached} from cache "
+        f"({time.perf_counter() - started:.2f}s)" + (f" → {output}" if output else ""),
+        file=sys.stderr,
+    )
+    return 0
@@ -1,7 +1,6 @@
 import argparse
 import sys
 import io
-from . import __version__
 
 # Fix Windows encoding for emoji/Unicode characters
 if sys.platform == "win32":
@@ -9,19 +8,34 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-# Try to import rich for better formatting
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# rich is imported on first use: it costs more than the rest of start-up
+# combined, and scripts calling --version or hello through a pipe never need it.
+Console = Panel = Text = None
+RICH_AVAILABLE = None  # resolved by _rich_available()
+
+
+def _rich_available() -> bool:
+    """Import rich for better formatting, returning False if it is not installed."""
+    global RICH_AVAILABLE, Console, Panel, Text
+    if RICH_AVAILABLE is None:
+        try:
+            from rich.console import Console
+            from rich.panel import Panel
+            from rich.text import Text
+            RICH_AVAILABLE = True
+        except ImportError:
+            RICH_AVAILABLE = False
+    return RICH_AVAILABLE
+
+
+def _use_rich() -> bool:
+    """Format with rich only for a terminal; piped output is plain text either way."""
+    return sys.stdout.isatty() and _rich_available()
 
 
 def print_welcome():
     """Print a welcome message with usage examples."""
-    if RICH_AVAILABLE:
+    if _use_rich():
         console = Console()
 
         welcome_text = Text()
@@ -96,6 +110,12 @@ def main():
         action="store_true",
         help="Output results in JSON format"
     )
+    verify_parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson", "junit", "sarif"],
+        help="Output format (default: text); ndjson streams one line per check as it finishes, "
+             "junit and sarif are for CI test and code scanning reports"
+    )
     verify_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -105,6 +125,203 @@ def main():
         "--output", "-o",
         help="Save verification report to file"
     )
+    verify_parser.add_argument(
+        "--rebuild",
+        nargs="?",
+        const=".",
+        metavar="SOURCE",
+        help="Rebuild the binary from a git checkout (default: current directory) and compare digests"
+    )
+    verify_parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Write cProfile stats and tracemalloc peaks for each check to DIR"
+    )
+    verify_parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="http://localhost:4318/v1/traces",
+        metavar="DEST",
+        help="Export OTLP-JSON spans to a file, or POST them to an OTLP/HTTP collector "
+             "(default: http://localhost:4318/v1/traces)"
+    )
+    cassette_group = verify_parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record every cosign/gh/osv-scanner call (output, exit code, duration) to a cassette in DIR"
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve cosign/gh/osv-scanner calls from a cassette recorded with --record instead of running them"
+    )
+    verify_parser.add_argument(
+        "--doctor",
+        action="store_true",
+        help="Show which verification tools are installed and exit"
+    )
+
+    # Serve subcommand
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a long-lived verification service with warm caches"
+    )
+    listen_group = serve_parser.add_mutually_exclusive_group(required=True)
+    listen_group.add_argument(
+        "--socket",
+        help="Unix socket path to listen on (e.g., /run/provenance.sock)"
+    )
+    listen_group.add_argument(
+        "--http",
+        metavar="HOST:PORT",
+        help="Serve HTTP on HOST:PORT (e.g., 127.0.0.1:8080)"
+    )
+    serve_parser.add_argument(
+        "--repo",
+        help="Default GitHub repository (OWNER/REPO) for requests that do not name one"
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        help="HTTP: concurrent verifications (default: CPU count)"
+    )
+    serve_parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=64,
+        help="HTTP: verifications allowed to wait before answering 429 (default: 64)"
+    )
+    serve_parser.add_argument(
+        "--max-upload-mb",
+        type=int,
+        default=512,
+        help="HTTP: largest accepted artifact upload in MiB (default: 512)"
+    )
+    serve_parser.add_argument(
+        "--allow-paths",
+        action="store_true",
+        help="HTTP: accept requests naming a file or evidence directory on the server even on non-loopback binds"
+    )
+    serve_parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=30.0,
+        metavar="SECONDS",
+        help="HTTP: close connections that send nothing for this long (default: 30)"
+    )
+    serve_parser.add_argument(
+        "--upload-timeout",
+        type=float,
+        default=600.0,
+        metavar="SECONDS",
+        help="HTTP: answer 408 to uploads whose body takes longer than this (default: 600)"
+    )
+    serve_parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="HTTP: log every request"
+    )
+
+    # Diff-pyz subcommand
+    diff_parser = subparsers.add_parser(
+        "diff-pyz",
+        help="Compare two .pyz archives member by member (reproducibility triage)"
+    )
+    diff_parser.add_argument("a", help="First archive (e.g., the released .pyz)")
+    diff_parser.add_argument("b", help="Second archive (e.g., a local rebuild)")
+    diff_parser.add_argument(
+        "--first",
+        action="store_true",
+        help="Stop at the first difference"
+    )
+    diff_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output differences in JSON format"
+    )
+
+    # Verify-manifest subcommand
+    manifest_parser = subparsers.add_parser(
+        "verify-manifest",
+        help="Check every file listed in a checksum manifest, in parallel (like sha256sum -c)"
+    )
+    manifest_parser.add_argument("manifest", help="Checksum manifest (checksums.txt, SHA256SUMS, BSD-tagged, ...)")
+    manifest_parser.add_argument(
+        "--root",
+        help="Directory the listed paths are relative to (default: the manifest's directory)"
+    )
+    manifest_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Hashing threads (default: 1 on spinning disks, otherwise CPU count + 4, at most 32)"
+    )
+    manifest_parser.add_argument(
+        "--stop-on-first-mismatch",
+        action="store_true",
+        help="Stop at the first mismatched or unreadable file"
+    )
+    manifest_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Also fail when the directory holds files the manifest does not list"
+    )
+    manifest_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the report in JSON format"
+    )
+
+    # Audit-release subcommand
+    audit_parser = subparsers.add_parser(
+        "audit-release",
+        help="Check that the checksum manifest and the SLSA attestation subjects of a release agree"
+    )
+    audit_parser.add_argument("directory", help="Release directory (e.g., dist/)")
+    audit_parser.add_argument(
+        "--manifest",
+        help="Checksum manifest (default: checksums.txt, SHA256SUMS or SHA512SUMS in the directory)"
+    )
+    audit_parser.add_argument(
+        "--attestations",
+        help="Attestation bundle (default: attestation.jsonl in the directory)"
+    )
+    audit_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the report in JSON format"
+    )
+
+    # Checksums subcommand
+    checksums_parser = subparsers.add_parser(
+        "checksums",
+        help="Generate checksum manifests"
+    )
+    checksums_subparsers = checksums_parser.add_subparsers(dest="checksums_command", required=True)
+    generate_parser = checksums_subparsers.add_parser(
+        "generate",
+        help="Hash every file in a directory into a sorted, reproducible manifest"
+    )
+    generate_parser.add_argument("directory", help="Directory to hash (e.g., dist/)")
+    generate_parser.add_argument(
+        "--algo",
+        default="sha256",
+        help="Comma-separated algorithms (default: sha256); several produce BSD-tagged lines"
+    )
+    generate_parser.add_argument(
+        "--output", "-o",
+        help="Write the manifest to this file instead of stdout (excluded from the listing)"
+    )
+    generate_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Hashing threads (default: 1 on spinning disks, otherwise CPU count + 4, at most 32)"
+    )
+    generate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Hash every file instead of reusing digests of unchanged files"
+    )
 
     # Hello subcommand
     hello_parser = subparsers.add_parser(
@@ -116,7 +333,8 @@ def main():
     args = parser.parse_args()
 
     if args.version:
-        if RICH_AVAILABLE:
+        from . import __version__
+        if _use_rich():
             console = Console()
             version_text = Text()
             version_text.append("provenance-demo ", style="bold cyan")
@@ -137,10 +355,38 @@ def main():
             print(f"❌ Error: verify module not available: {e}", file=sys.stderr)
             return 1
 
+    # Handle serve subcommand
+    if args.command == "serve":
+        if args.http:
+            from .http_server import serve_http_command
+            return serve_http_command(args)
+        from .server import serve_command
+        return serve_command(args)
+
+    # Handle diff-pyz subcommand
+    if args.command == "diff-pyz":
+        from .pyz import diff_pyz_command
+        return diff_pyz_command(args)
+
+    # Handle verify-manifest subcommand
+    if args.command == "verify-manifest":
+        from .checksums import verify_manifest_command
+        return verify_manifest_command(args)
+
+    # Handle audit-release subcommand
+    if args.command == "audit-release":
+        from .audit import audit_release_command
+        return audit_release_command(args)
+
+    # Handle checksums subcommand
+    if args.command == "checksums":
+        from .checksums import checksums_generate_command
+        return checksums_generate_command(args)
+
     # Handle hello subcommand
     if args.command == "hello":
         name = args.name or "world"
-        if RICH_AVAILABLE:
+        if _use_rich():
             console = Console()
             console.print(f"👋 ", end="")
             console.print(f"Hello, {name}!", style="bold green")
@@ -0,0 +1,134 @@
+"""
+File hashing shared by the verifier and the checksum tooling.
+"""
+
+import hashlib
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .cache import StatCache
+from .timing import add_bytes, phase
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path, algorithms: Iterable[str] = ("sha256",)) -> Dict[str, str]:
+    """
+    Hash a file with one or more algorithms in a single read pass.
+
+    Args:
+        path: File to hash.
+        algorithms: hashlib algorithm names, e.g. ("sha256", "sha512").
+
+    Returns:
+        Mapping of algorithm name to lowercase hex digest.
+    """
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+
+    total = 0
+    with phase("hash", {"file.path": str(path)}), open(path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            total += read
+            for hasher in hashers.values():
+                hasher.update(view[:read])
+        add_bytes(total)
+
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+def file_digest(path: Path, algorithm: str = "sha256", cache: Optional[StatCache] = None) -> str:
+    """Return the hex digest of a file, reusing a cached value while it is unchanged."""
+    if cache is None:
+        return hash_file(path, (algorithm,))[algorithm]
+    return cache.get_or_load(path, f"digest:{algorithm}", lambda p: hash_file(p, (algorithm,))[algorithm])
+
+
+def is_rotational(path: Path) -> Optional[bool]:
+    """
+    Whether path lives on a spinning disk.
+
+    Reads the block device's queue/rotational flag from sysfs (Linux only).
+
+    Returns:
+        True or False, or None when the storage cannot be identified
+        (other platforms, network and virtual filesystems).
+    """
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        return None
+    block = Path(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}")
+    # Partitions have no queue of their own; the flag is on the parent disk
+    for flag in (block / "queue" / "rotational", block / ".." / "queue" / "rotational"):
+        try:
+            return flag.read_text().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+def default_workers(path: Path) -> int:
+    """
+    Hashing threads suited to the storage under path.
+
+    hashlib releases the GIL while digesting, so threads scale with cores on
+    SSDs and network storage. Spinning disks get one thread: concurrent
+    reads there turn sequential throughput into seeks.
+    """
+    if is_rotational(path):
+        return 1
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _hash_with_size(path: Path, algorithms: Sequence[str]) -> Tuple[Dict[str, str], int]:
+    size = os.stat(path).st_size
+    return hash_file(path, algorithms), size
+
+
+def hash_files(
+    jobs: Iterable[Tuple[Path, Sequence[str]]],
+    workers: int,
+) -> Iterator[Tuple[Path, Union[Tuple[Dict[str, str], int], OSError]]]:
+    """
+    Hash many files concurrently with :func:`hash_file`.
+
+    Args:
+        jobs: (path, algorithms) pairs.
+        workers: Number of hashing threads.
+
+    Yields:
+        (path, (digests, size)) as each file finishes, or (path, error) when
+        it could not be read. Closing the iterator early cancels the files
+        not yet started.
+    """
+    jobs = iter(jobs)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash") as pool:
+        pending = {}
+
+        def refill():
+            # Keep a bounded number of files queued so huge manifests use little memory
+            for path, algorithms in itertools.islice(jobs, workers * 4 - len(pending)):
+                pending[pool.submit(_hash_with_size, path, algorithms)] = path
+
+        refill()
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        yield path, future.result()
+                    except OSError as e:
+                        yield path, e
+                refill()
+        finally:
+            for future in pending:
+                future.cancel()
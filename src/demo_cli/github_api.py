@@ -0,0 +1,277 @@
+"""
+Minimal GitHub REST API client used by the verifier.
+
+Spawning ``gh`` for every lookup pays process startup, credential lookup and a
+fresh TLS handshake per call. This client keeps a small pool of keep-alive
+connections, authenticates with ``GH_TOKEN``/``GITHUB_TOKEN`` and revalidates
+repeated lookups with ``If-None-Match`` so unchanged responses come back as
+cheap ``304 Not Modified`` replies.
+
+Only the standard library is used. The base URL can be pointed at a local
+HTTP server (``GITHUB_API_URL=http://127.0.0.1:8080``) for testing.
+"""
+
+import http.client
+import json
+import os
+import queue
+import threading
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import tracing
+from .timing import phase
+from .ratelimit import RateLimitExhausted, RateLimitScheduler, get_default_scheduler
+
+DEFAULT_API_URL = "https://api.github.com"
+API_VERSION = "2022-11-28"
+
+
+class GitHubAPIError(Exception):
+    """Raised when a GitHub API request fails."""
+
+    def __init__(self, status: Optional[int], message: str):
+        super().__init__(f"{status}: {message}" if status else message)
+        self.status = status
+        self.message = message
+
+
+class GitHubClient:
+    """Keep-alive GitHub API client with ETag revalidation."""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = DEFAULT_API_URL,
+        pool_size: int = 4,
+        timeout: float = 30.0,
+        etag_cache_size: int = 256,
+        scheduler: Optional[RateLimitScheduler] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            token: API token sent as a bearer token. Anonymous when None.
+            base_url: API root, e.g. https://api.github.com or a local test server.
+            pool_size: Maximum number of idle connections kept for reuse.
+            timeout: Socket timeout in seconds for each request.
+            etag_cache_size: Number of ETag-tagged responses kept for revalidation.
+            scheduler: Shared rate-limit scheduler. Requests are paced and
+                coalesced through it and it is fed the X-RateLimit-* headers.
+        """
+        parsed = urllib.parse.urlsplit(base_url.rstrip("/"))
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Unsupported GitHub API URL: {base_url}")
+
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.scheduler = scheduler
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path_prefix = parsed.path
+
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=pool_size)
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._etag_cache_size = etag_cache_size
+        self._lock = threading.Lock()
+
+        from . import __version__
+        self._user_agent = f"provenance-demo/{__version__}"
+
+    @classmethod
+    def from_env(cls) -> Optional["GitHubClient"]:
+        """
+        Build a client from the environment.
+
+        Returns None when no token is configured or the client is disabled
+        with PROVENANCE_GITHUB_API=0, so callers fall back to the gh CLI.
+        """
+        if os.getenv("PROVENANCE_GITHUB_API", "").strip().lower() in {"0", "false", "no", "off"}:
+            return None
+
+        token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+        if not token:
+            return None
+
+        return cls(
+            token=token,
+            base_url=os.getenv("GITHUB_API_URL", DEFAULT_API_URL),
+            scheduler=get_default_scheduler(),
+        )
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _acquire_connection(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle pooled connection, or a new one. The flag marks reuse."""
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def _release_connection(self, conn: http.client.HTTPConnection):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _headers(self, etag: Optional[str]) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": API_VERSION,
+            "User-Agent": self._user_agent,
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if etag:
+            headers["If-None-Match"] = etag
+        return headers
+
+    def _send(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Send a GET request, retrying once if a reused connection went stale."""
+        for attempt in range(2):
+            conn, reused = self._acquire_connection()
+            try:
+                with phase("network", {"http.request.method": "GET", "url.path": path}):
+                    conn.request("GET", self._path_prefix + path, headers=headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                    tracing.annotate({"http.response.status_code": response.status})
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(conn)
+            return response.status, response_headers, body
+
+        raise GitHubAPIError(None, "Connection lost")  # pragma: no cover
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET an API path and decode the JSON body.
+
+        Args:
+            path: API path starting with '/', e.g. /repos/OWNER/REPO/releases.
+            params: Optional query string parameters.
+
+        Returns:
+            The decoded JSON document. A 304 reply returns the cached document,
+            as does an exhausted rate-limit budget when the path was seen before.
+
+        Raises:
+            GitHubAPIError: On non-2xx responses, undecodable bodies or an
+                exhausted rate limit with nothing cached.
+        """
+        if params:
+            path = f"{path}?{urllib.parse.urlencode(params)}"
+
+        if self.scheduler is None:
+            return self._get_json(path)
+
+        try:
+            document, _stale = self.scheduler.fetch(("GET", self.base_url, path), lambda: self._get_json(path))
+        except RateLimitExhausted as exc:
+            raise GitHubAPIError(429, str(exc)) from exc
+        return document
+
+    def _get_json(self, path: str) -> Any:
+        with self._lock:
+            cached = self._etag_cache.get(path)
+
+        status, headers, body = self._send(path, self._headers(cached[0] if cached else None))
+        if self.scheduler is not None:
+            self.scheduler.update_from_headers(headers)
+
+        if status == 304 and cached:
+            with self._lock:
+                self._etag_cache.move_to_end(path)
+            return cached[1]
+
+        if status in (403, 429) and cached and headers.get("x-ratelimit-remaining") == "0":
+            # Rate limited: degrade to the last response we saw for this path
+            return cached[1]
+
+        if status < 200 or status >= 300:
+            message = body.decode("utf-8", errors="replace")
+            try:
+                message = json.loads(message).get("message", message)
+            except (ValueError, AttributeError):
+                pass
+            raise GitHubAPIError(status, str(message)[:200])
+
+        try:
+            document = json.loads(body) if body else None
+        except ValueError as exc:
+            raise GitHubAPIError(status, f"Invalid JSON response: {exc}") from exc
+
+        etag = headers.get("etag")
+        if etag:
+            with self._lock:
+                self._etag_cache[path] = (etag, document)
+                self._etag_cache.move_to_end(path)
+                while len(self._etag_cache) > self._etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+
+        return document
+
+    def list_releases(self, repo: str, limit: int = 20) -> List[Dict]:
+        """List recent releases (assets included) for OWNER/REPO."""
+        return self.get_json(f"/repos/{repo}/releases", {"per_page": limit}) or []
+
+    def get_release(self, repo: str, tag: Optional[str] = None) -> Dict:
+        """Get a release by tag, or the latest release when tag is None."""
+        if tag:
+            return self.get_json(f"/repos/{repo}/releases/tags/{urllib.parse.quote(tag, safe='')}")
+        return self.get_json(f"/repos/{repo}/releases/latest")
+
+    def list_attestations(self, repo: str, sha256: str) -> List[Dict]:
+        """
+        List attestations recorded for an artifact digest.
+
+        Returns an empty list when GitHub has no attestations for the digest.
+        """
+        try:
+            document = self.get_json(f"/repos/{repo}/attestations/sha256:{sha256}")
+        except GitHubAPIError as exc:
+            if exc.status == 404:
+                return []
+            raise
+        return (document or {}).get("attestations", [])
+
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_default_client: Optional[GitHubClient] = None
+_default_client_lock = threading.Lock()
+_default_client_loaded = False
+
+
+def get_default_client() -> Optional[GitHubClient]:
+    """Return the process-wide client built from the environment (or None)."""
+    global _default_client, _default_client_loaded
+    with _default_client_lock:
+        if not _default_client_loaded:
+            _default_client = GitHubClient.from_env()
+            _default_client_loaded = True
+        return _default_client
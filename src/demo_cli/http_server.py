@@ -0,0 +1,581 @@
+"""
+HTTP front-end for the verification service.
+
+``provenance-demo serve --http 127.0.0.1:8080`` exposes the same warm
+:class:`~demo_cli.server.VerificationService` as the Unix socket server:
+
+    POST /verify    JSON body {"file": "/abs/path/app.pyz", "checks": [...], "repository": "OWNER/REPO"}
+                    or the artifact itself (Content-Type: application/octet-stream)
+                    with ?name=app.pyz&checks=checksum,sbom&evidence=/srv/release
+    GET  /healthz   liveness and worker pool occupancy
+    GET  /metrics   Prometheus text exposition
+
+Verifications run on a fixed pool of worker threads. At most ``max_queue``
+requests wait for a free worker; beyond that the server answers 429 with a
+Retry-After header rather than queueing without bound. Requests for the same
+artifact digest and name (with the same evidence, checks and repository) that
+arrive while one is already running share its result instead of verifying again.
+
+Uploaded artifacts are written to a private temporary directory. An upload
+takes its queue slot before the body is read, and a path request before the
+file is hashed, so a saturated server answers 429 without doing either. Reads time out after ``request_timeout`` seconds
+without data and a body must arrive within ``upload_timeout`` seconds (408
+otherwise), so a client trickling its upload cannot hold a slot indefinitely.
+Evidence files (checksums.txt, attestation.jsonl,
+SBOMs, ...) are taken from the server-side ``evidence`` directory, which must
+already exist on the host.
+
+JSON requests naming a server-side ``file``, and uploads naming an
+``evidence`` directory, make the server read files it can access, so they are
+only accepted on loopback binds unless the server is started with
+``--allow-paths``; elsewhere they get 403.
+"""
+
+import hashlib
+import ipaddress
+import json
+import math
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .digests import CHUNK_SIZE, file_digest
+from .server import MAX_MESSAGE_SIZE, VerificationService
+
+DEFAULT_MAX_UPLOAD = 512 * 1024 * 1024
+DEFAULT_REQUEST_TIMEOUT = 30.0
+DEFAULT_UPLOAD_TIMEOUT = 600.0
+_KNOWN_PATHS = ("/verify", "/healthz", "/metrics")
+
+
+class HTTPError(Exception):
+    """An error with the HTTP status it should be reported as."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class PoolSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class WorkerPool:
+    """Fixed-size worker pool with a bounded wait queue and in-flight coalescing."""
+
+    def __init__(self, workers: int = 4, max_queue: int = 64):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of verifications that run concurrently.
+            max_queue: Number of verifications allowed to wait for a worker.
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="verify")
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.reserved = 0
+        self.duration_sum = 0.0
+        self.stats = {"submitted": 0, "coalesced": 0, "rejected": 0, "completed": 0, "failed": 0}
+
+    @property
+    def busy(self) -> int:
+        """Workers currently running a verification."""
+        return min(self.pending, self.workers)
+
+    @property
+    def queue_depth(self) -> int:
+        """Verifications waiting for a worker."""
+        return max(0, self.pending - self.workers)
+
+    def _check_capacity(self):
+        # Callers hold self._lock
+        if self.pending + self.reserved >= self.workers + self.max_queue:
+            self.stats["rejected"] += 1
+            raise PoolSaturated(f"{self.pending} verifications in progress")
+
+    def reserve(self):
+        """
+        Hold a slot while a request body is received, before it can be submitted.
+
+        Raises:
+            PoolSaturated: If all workers are busy and the queue is full.
+        """
+        with self._lock:
+            self._check_capacity()
+            self.reserved += 1
+
+    def release(self):
+        """Give back a slot taken with reserve() that will not be submitted."""
+        with self._lock:
+            self.reserved -= 1
+
+    def submit(self, key: Hashable, func: Callable[[], Dict], reserved: bool = False) -> Tuple[Future, bool]:
+        """
+        Run func on the pool, or join an in-flight run with the same key.
+
+        Args:
+            key: Requests with equal keys share one run.
+            func: The verification.
+            reserved: The caller holds a slot from reserve(), which this uses up.
+
+        Returns:
+            Tuple of (future, coalesced).
+
+        Raises:
+            PoolSaturated: If all workers are busy and the queue is full.
+        """
+        with self._lock:
+            if reserved:
+                self.reserved -= 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return future, True
+            self._check_capacity()
+
+            self.pending += 1
+            self.stats["submitted"] += 1
+            future = self._executor.submit(self._timed, func)
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda f: self._finished(key, f))
+        return future, False
+
+    def _timed(self, func: Callable[[], Dict]) -> Dict:
+        started = time.perf_counter()
+        try:
+            return func()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.duration_sum += elapsed
+
+    def _finished(self, key: Hashable, future: Future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            self.pending -= 1
+            failed = future.cancelled() or future.exception() is not None
+            self.stats["failed" if failed else "completed"] += 1
+
+    def retry_after(self) -> int:
+        """Seconds a rejected caller should wait, from the average verification time."""
+        with self._lock:
+            finished = self.stats["completed"] + self.stats["failed"]
+            average = self.duration_sum / finished if finished else 1.0
+            backlog = self.pending / self.workers
+        return max(1, math.ceil(average * backlog))
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_checks(value) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [c.strip() for c in value.split(",") if c.strip()] or None
+    if isinstance(value, list) and all(isinstance(c, str) for c in value):
+        return value or None
+    raise HTTPError(400, "'checks' must be a list of check names")
+
+
+def _receive_upload(stream, length: int, target: Path, deadline: Optional[float] = None) -> str:
+    """Stream a request body to target, returning its SHA256.
+
+    Raises HTTPError 408 when a read times out or the body is still
+    incomplete at deadline (a time.monotonic() value).
+    """
+    hasher = hashlib.sha256()
+    remaining = length
+    with open(target, "wb") as f:
+        while remaining:
+            if deadline is not None and time.monotonic() > deadline:
+                raise HTTPError(408, "Timed out receiving the request body")
+            try:
+                chunk = stream.read(min(CHUNK_SIZE, remaining))
+            except TimeoutError:
+                raise HTTPError(408, "Timed out receiving the request body")
+            if not chunk:
+                raise HTTPError(400, "Request body ended before Content-Length bytes")
+            hasher.update(chunk)
+            f.write(chunk)
+            remaining -= len(chunk)
+    return hasher.hexdigest()
+
+
+def _link_evidence(evidence_dir: Path, target_dir: Path, artifact_name: str):
+    """Make the evidence files visible next to an uploaded artifact."""
+    for entry in os.scandir(evidence_dir):
+        if entry.name == artifact_name or not entry.is_file():
+            continue
+        destination = target_dir / entry.name
+        try:
+            os.symlink(entry.path, destination)
+        except OSError:
+            shutil.copyfile(entry.path, destination)
+
+
+class HTTPVerificationServer(ThreadingHTTPServer):
+    """Threaded HTTP server dispatching verifications to a bounded worker pool."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        service: VerificationService,
+        workers: int = 4,
+        max_queue: int = 64,
+        max_upload: int = DEFAULT_MAX_UPLOAD,
+        verbose: bool = False,
+        allow_paths: Optional[bool] = None,
+        request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+        upload_timeout: Optional[float] = DEFAULT_UPLOAD_TIMEOUT,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            address: (host, port) to bind.
+            service: Warm verification state shared by all requests.
+            workers: Number of concurrent verifications.
+            max_queue: Verifications allowed to wait before answering 429.
+            max_upload: Largest accepted artifact upload, in bytes.
+            verbose: Log every request to stderr.
+            allow_paths: Accept JSON requests naming a file on the server and
+                uploads naming a server-side evidence directory. Defaults to True only when bound to a loopback address, since
+                any client could otherwise have the server read any file it
+                can access.
+            request_timeout: Seconds a connection may stay silent while a
+                request is read (None waits forever).
+            upload_timeout: Seconds allowed to receive a whole upload body,
+                during which it holds a worker pool slot (None for no limit).
+        """
+        if allow_paths is None:
+            allow_paths = _is_loopback(address[0])
+        self.allow_paths = allow_paths
+        self.service = service
+        self.pool = WorkerPool(workers=workers, max_queue=max_queue)
+        self.max_upload = max_upload
+        self.request_timeout = request_timeout
+        self.upload_timeout = upload_timeout
+        self.verbose = verbose
+        self.started = time.time()
+        self.verifications = {"passed": 0, "failed": 0}
+        self.responses: Dict[Tuple[str, int], int] = {}
+        self._metrics_lock = threading.Lock()
+        super().__init__(address, _HTTPRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown()
+
+    def record_response(self, path: str, status: int):
+        label = path if path in _KNOWN_PATHS else "other"
+        with self._metrics_lock:
+            self.responses[(label, status)] = self.responses.get((label, status), 0) + 1
+
+    def verify(self, headers, body, query: Dict[str, List[str]]) -> Tuple[int, Dict, Dict[str, str]]:
+        """
+        Handle POST /verify.
+
+        Returns:
+            Tuple of (status, JSON body, extra headers).
+        """
+        length = headers.get("Content-Length")
+        if length is None:
+            raise HTTPError(411, "Content-Length required")
+        try:
+            length = int(length)
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length")
+
+        content_type = headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type == "application/json":
+            return self._verify_path(body, length)
+        return self._verify_upload(body, length, query)
+
+    def _verify_path(self, body, length: int) -> Tuple[int, Dict, Dict[str, str]]:
+        if not self.allow_paths:
+            raise HTTPError(403, "Verifying server-side paths is disabled (start the server with --allow-paths)")
+        if length > MAX_MESSAGE_SIZE:
+            raise HTTPError(413, f"Request body too large (max {MAX_MESSAGE_SIZE} bytes)")
+        try:
+            request = json.loads(body.read(length) or b"{}")
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("file"), str):
+            raise HTTPError(400, "Body must be a JSON object with a 'file' path")
+
+        path = Path(request["file"])
+        if not path.is_absolute():
+            raise HTTPError(400, "file must be an absolute path")
+        if not path.is_file():
+            raise HTTPError(404, f"{path} not found")
+        checks = _parse_checks(request.get("checks"))
+        repository = request.get("repository")
+
+        # Hashing a large file is work too: take a slot first so it is bounded like the verification
+        try:
+            self.pool.reserve()
+        except PoolSaturated as e:
+            return self._saturated(e)
+        submitted = False
+        try:
+            digest = file_digest(path, cache=self.service.cache)
+            # The name matters too: the .sigstore bundle, manifest entry and SLSA subject are looked up by it
+            key = (digest, str(path), tuple(checks or ()), repository)
+            submitted = True
+            return self._run(key, lambda: self.service.verify(str(path), checks, repository), reserved=True)
+        finally:
+            if not submitted:
+                self.pool.release()
+
+    def _verify_upload(self, body, length: int, query: Dict[str, List[str]]) -> Tuple[int, Dict, Dict[str, str]]:
+        if length > self.max_upload:
+            raise HTTPError(413, f"Artifact too large (max {self.max_upload} bytes)")
+
+        name = query.get("name", ["artifact"])[0]
+        if not name or Path(name).name != name or name.startswith("."):
+            raise HTTPError(400, "name must be a plain file name")
+        checks = _parse_checks(query.get("checks", [None])[0])
+        repository = query.get("repository", [None])[0]
+
+        evidence = query.get("evidence", [None])[0]
+        if evidence is not None:
+            if not self.allow_paths:
+                raise HTTPError(403, "Server-side evidence directories are disabled (start the server with --allow-paths)")
+            evidence_dir = Path(evidence)
+            if not evidence_dir.is_absolute() or not evidence_dir.is_dir():
+                raise HTTPError(400, "evidence must be an absolute path to an existing directory")
+
+        # Answer 429 before accepting the body, so a saturated pool does not fill the disk
+        try:
+            self.pool.reserve()
+        except PoolSaturated as e:
+            return self._saturated(e)
+        submitted = False
+        try:
+            with tempfile.TemporaryDirectory(prefix="provenance-upload-") as tmp:
+                target = Path(tmp) / name
+                deadline = time.monotonic() + self.upload_timeout if self.upload_timeout is not None else None
+                digest = _receive_upload(body, length, target, deadline)
+                if evidence is not None:
+                    _link_evidence(evidence_dir, Path(tmp), name)
+
+                key = (digest, name, evidence, tuple(checks or ()), repository)
+                submitted = True
+                status, response, extra = self._run(
+                    key, lambda: self.service.verify(str(target), checks, repository), reserved=True
+                )
+        finally:
+            if not submitted:
+                self.pool.release()
+
+        if response.get("ok"):
+            response["result"] = dict(response["result"], binary=name, sha256=digest)
+        return status, response, extra
+
+    def _saturated(self, error: PoolSaturated) -> Tuple[int, Dict, Dict[str, str]]:
+        return 429, {"ok": False, "error": f"Verification queue is full ({error})"}, {
+            "Retry-After": str(self.pool.retry_after())
+        }
+
+    def _run(self, key: Hashable, func: Callable[[], Dict], reserved: bool = False) -> Tuple[int, Dict, Dict[str, str]]:
+        try:
+            future, coalesced = self.pool.submit(key, func, reserved=reserved)
+        except PoolSaturated as e:
+            return self._saturated(e)
+
+        try:
+            report = future.result()
+        except (ValueError, FileNotFoundError) as e:
+            raise HTTPError(400, str(e))
+
+        if not coalesced:
+            with self._metrics_lock:
+                self.verifications["passed" if report["passed"] else "failed"] += 1
+        return 200, {"ok": True, "coalesced": coalesced, "result": report}, {}
+
+    def healthz(self) -> Dict:
+        return {
+            "status": "ok",
+            "uptime_s": round(time.time() - self.started, 3),
+            "workers": self.pool.workers,
+            "busy": self.pool.busy,
+            "queue_depth": self.pool.queue_depth,
+            "max_queue": self.pool.max_queue,
+        }
+
+    def metrics(self) -> str:
+        """Render counters in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{labels} {value}")
+
+        with self._metrics_lock:
+            responses = sorted(self.responses.items())
+            verifications = dict(self.verifications)
+        pool = self.pool
+        with pool._lock:
+            stats = dict(pool.stats)
+            duration_sum = pool.duration_sum
+        cache = self.service.cache
+
+        metric("provenance_http_requests_total", "counter", "HTTP responses by path and status code.",
+               [(f'{{path="{path}",code="{status}"}}', count) for (path, status), count in responses])
+        metric("provenance_verifications_total", "counter", "Verifications run, by overall result.",
+               [(f'{{result="{result}"}}', count) for result, count in sorted(verifications.items())])
+        metric("provenance_verify_coalesced_total", "counter",
+               "Requests answered by joining an in-flight verification.", [("", stats["coalesced"])])
+        metric("provenance_verify_rejected_total", "counter",
+               "Requests rejected with 429 because the queue was full.", [("", stats["rejected"])])
+        metric("provenance_verify_duration_seconds", "summary", "Time spent running verifications.",
+               [("_sum", round(duration_sum, 6)), ("_count", stats["completed"] + stats["failed"])])
+        metric("provenance_workers", "gauge", "Size of the verification worker pool.", [("", pool.workers)])
+        metric("provenance_workers_busy", "gauge", "Workers currently verifying.", [("", pool.busy)])
+        metric("provenance_queue_depth", "gauge", "Verifications waiting for a worker.", [("", pool.queue_depth)])
+        metric("provenance_queue_limit", "gauge", "Maximum verifications allowed to wait.", [("", pool.max_queue)])
+        metric("provenance_cache_hits_total", "counter", "Digest/evidence cache hits.", [("", cache.hits)])
+        metric("provenance_cache_misses_total", "counter", "Digest/evidence cache misses.", [("", cache.misses)])
+        metric("provenance_cache_entries", "gauge", "Entries in the digest/evidence cache.", [("", len(cache))])
+        return "\n".join(lines) + "\n"
+
+
+class _HTTPRequestHandler(BaseHTTPRequestHandler):
+    server_version = "provenance-demo"
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        # StreamRequestHandler applies self.timeout to the connection
+        self.timeout = self.server.request_timeout
+        super().setup()
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record_response(urlsplit(self.path).path, status)
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/healthz":
+            self._send_json(200, self.server.healthz())
+        elif path == "/metrics":
+            self._send(200, self.server.metrics().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+        else:
+            self._send_json(404, {"ok": False, "error": f"Not found: {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/verify":
+            self.close_connection = True
+            self._send_json(404, {"ok": False, "error": f"Not found: {url.path}"})
+            return
+
+        try:
+            status, payload, headers = self.server.verify(self.headers, self.rfile, parse_qs(url.query))
+        except HTTPError as e:
+            # The body may be partly unread; do not reuse the connection
+            self.close_connection = True
+            status, payload, headers = e.status, {"ok": False, "error": str(e)}, {}
+        except Exception as e:
+            self.close_connection = True
+            status, payload, headers = 500, {"ok": False, "error": str(e)[:500]}, {}
+        if status == 429:
+            # An upload rejected up front leaves its body unread
+            self.close_connection = True
+        self._send_json(status, payload, headers)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def parse_address(value: str) -> Tuple[str, int]:
+    """Parse HOST:PORT (HOST defaults to 127.0.0.1)."""
+    host, sep, port = value.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got {value!r}")
+    return host.strip("[]") or "127.0.0.1", int(port)
+
+
+def serve_http_command(args) -> int:
+    """Run the serve command with --http."""
+    try:
+        address = parse_address(args.http)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    service = VerificationService(github_repo=getattr(args, 'repo', None))
+    try:
+        server = HTTPVerificationServer(
+            address,
+            service,
+            workers=args.workers or os.cpu_count() or 4,
+            max_queue=args.max_queue,
+            max_upload=args.max_upload_mb * 1024 * 1024,
+            verbose=getattr(args, 'verbose', False),
+            allow_paths=True if getattr(args, 'allow_paths', False) else None,
+            request_timeout=getattr(args, 'request_timeout', DEFAULT_REQUEST_TIMEOUT),
+            upload_timeout=getattr(args, 'upload_timeout', DEFAULT_UPLOAD_TIMEOUT),
+        )
+    except OSError as e:
+        print(f"❌ Error: cannot listen on {args.http}: {e}", file=sys.stderr)
+        return 1
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    host, port = server.server_address[:2]
+    print(
+        f"🔐 Verification service listening on http://{host}:{port} "
+        f"({server.pool.workers} workers, queue {server.pool.max_queue})",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
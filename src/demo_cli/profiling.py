@@ -0,0 +1,111 @@
+"""
+cProfile and tracemalloc profiling of verification checks (verify --profile DIR).
+
+Each check runs under its own profiler and writes ``DIR/<check>.pstats``
+(open with ``python -m pstats`` or snakeviz). tracemalloc records the peak
+traced memory of the check and the source lines holding the most memory when
+it finished. The run's profiles are merged into ``DIR/run.pstats`` and the
+summary (also in the JSON report under ``profile``) is written to
+``DIR/profile.json``.
+
+Only the thread running the check is profiled; work handed to the shared
+scheduler's threads shows up as waiting time. Nothing here is imported unless
+``--profile`` is given.
+"""
+
+import cProfile
+import json
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+TOP_FUNCTIONS = 10
+TOP_ALLOCATIONS = 5
+
+
+def _function_name(func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name  # built-in, e.g. "<built-in method posix.read>"
+    return f"{filename}:{line}({name})"
+
+
+def heaviest_functions(stats: pstats.Stats, limit: int = TOP_FUNCTIONS) -> List[Dict]:
+    """Functions with the most own (exclusive) time in a profile."""
+    own = [item for item in stats.stats.items() if item[0][0] != __file__]  # the profiler's own frames
+    rows = sorted(own, key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": _function_name(func),
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+        for func, (_, calls, tottime, cumtime, _) in rows
+    ]
+
+
+class CheckProfiler:
+    """Profiles each check into a directory and summarizes the run."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.checks: Dict[str, Dict] = {}
+        self._files: List[str] = []
+
+    @contextmanager
+    def profile(self, key: str) -> Iterator[None]:
+        """Profile the block as check key."""
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ])
+            if started_tracing:
+                tracemalloc.stop()
+
+            path = self.directory / f"{key}.pstats"
+            profiler.dump_stats(str(path))
+            self._files.append(str(path))
+            self.checks[key] = {
+                "pstats": str(path),
+                "peak_memory_bytes": max(peak, 0),
+                "top_allocations": [
+                    {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "bytes": stat.size, "count": stat.count}
+                    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+                ],
+                "heaviest_functions": heaviest_functions(pstats.Stats(profiler), limit=TOP_ALLOCATIONS),
+            }
+
+    def summary(self) -> Dict:
+        """Merge the run's profiles and return the report summary."""
+        heaviest: List[Dict] = []
+        if self._files:
+            stats = pstats.Stats(*self._files)
+            stats.dump_stats(str(self.directory / "run.pstats"))
+            heaviest = heaviest_functions(stats)
+        return {
+            "directory": str(self.directory),
+            "heaviest_functions": heaviest,
+            "checks": self.checks,
+        }
+
+    def write_summary(self) -> Dict:
+        """Write profile.json into the directory and return the summary."""
+        summary = self.summary()
+        (self.directory / "profile.json").write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+        return summary
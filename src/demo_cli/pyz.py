@@ -0,0 +1,309 @@
+"""
+Read-only inspection of .pyz archives.
+
+Everything here reads the archive with ``zipfile`` and never imports or
+executes code from it: the archive is the thing being verified.
+
+``provenance-demo diff-pyz A B`` triages non-reproducible builds. It compares
+the central directories first (names, order, CRC, sizes, timestamps,
+permissions) and only decompresses members whose CRCs differ, streaming both
+sides until the first differing byte.
+"""
+
+import ast
+import json
+import sys
+import time
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Where the version lives inside a zipapp built by scripts/build_pyz.sh
+VERSION_MEMBERS = ("demo_cli/_version.py",)
+
+# _version.py is a few lines; refuse to inflate anything suspiciously large
+MAX_MEMBER_SIZE = 64 * 1024
+
+
+def version_from_source(source: str) -> Optional[str]:
+    """Return the string assigned to __version__ (or version) without executing the module."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        names = {target.id for target in targets if isinstance(target, ast.Name)}
+        if names & {"__version__", "version"} and isinstance(node.value, ast.Constant):
+            if isinstance(node.value.value, str):
+                return node.value.value
+    return None
+
+
+def _version_from_metadata(text: str) -> Optional[str]:
+    """Return the Version field of a dist-info METADATA file."""
+    for line in text.splitlines():
+        if not line.strip():
+            break  # end of the header block
+        if line.startswith("Version:"):
+            return line.split(":", 1)[1].strip() or None
+    return None
+
+
+def read_version(path: Path) -> Optional[str]:
+    """
+    Read the package version embedded in a .pyz archive.
+
+    Looks for demo_cli/_version.py (generated by hatch-vcs) and falls back to
+    any *.dist-info/METADATA in the archive.
+
+    Args:
+        path: Path to the .pyz file.
+
+    Returns:
+        The version string, or None if the archive has no readable version.
+    """
+    try:
+        with zipfile.ZipFile(path) as zf:
+            members = {info.filename: info for info in zf.infolist()}
+
+            for name in VERSION_MEMBERS:
+                info = members.get(name)
+                if info is not None and info.file_size <= MAX_MEMBER_SIZE:
+                    version = version_from_source(zf.read(info).decode("utf-8", errors="replace"))
+                    if version:
+                        return version
+
+            for name, info in members.items():
+                if name.endswith(".dist-info/METADATA") and info.file_size <= MAX_MEMBER_SIZE:
+                    version = _version_from_metadata(zf.read(info).decode("utf-8", errors="replace"))
+                    if version:
+                        return version
+    except (OSError, zipfile.BadZipFile, RuntimeError, ValueError):
+        return None
+    return None
+
+
+# Central directory fields compared for every member (CRC is compared separately)
+METADATA_FIELDS = (
+    "file_size",
+    "compress_size",
+    "compress_type",
+    "date_time",
+    "external_attr",
+    "flag_bits",
+    "create_system",
+    "extract_version",
+    "extra",
+    "comment",
+)
+_DIFF_CHUNK = 256 * 1024
+_MAX_PREFIX = 64 * 1024
+
+
+class ArchiveDifference:
+    """One difference between two archives."""
+
+    def __init__(
+        self,
+        kind: str,
+        name: Optional[str],
+        message: str,
+        offset: Optional[int] = None,
+        line: Optional[int] = None,
+    ):
+        self.kind = kind
+        self.name = name
+        self.message = message
+        self.offset = offset
+        self.line = line
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON export."""
+        return {
+            "kind": self.kind,
+            "member": self.name,
+            "message": self.message,
+            "offset": self.offset,
+            "line": self.line,
+        }
+
+    def __str__(self) -> str:
+        return f"{self.name or '(archive)'}: {self.message}"
+
+
+def _prefix(path: Path, infos: List[zipfile.ZipInfo]) -> bytes:
+    """Bytes before the first member (the shebang of a zipapp)."""
+    start = min((info.header_offset for info in infos), default=0)
+    with open(path, "rb") as f:
+        return f.read(min(start, _MAX_PREFIX))
+
+
+def _mismatch(a: bytes, b: bytes) -> int:
+    """Index of the first differing byte of two chunks (or the shorter length)."""
+    low, high = 0, min(len(a), len(b))
+    if a[:high] == b[:high]:
+        return high
+    # Narrow down by halving; each comparison runs at memcmp speed
+    while high - low > 64:
+        middle = (low + high) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle
+    for index in range(low, high):
+        if a[index] != b[index]:
+            return index
+    return high
+
+
+def _first_divergence(
+    zf_a: zipfile.ZipFile, info_a: zipfile.ZipInfo, zf_b: zipfile.ZipFile, info_b: zipfile.ZipInfo
+) -> Tuple[Optional[int], Optional[int]]:
+    """Stream-decompress two members until they differ; returns (byte offset, line) or (None, None)."""
+    offset = 0
+    line: Optional[int] = 1
+    with zf_a.open(info_a) as fa, zf_b.open(info_b) as fb:
+        while True:
+            chunk_a = fa.read(_DIFF_CHUNK)
+            chunk_b = fb.read(_DIFF_CHUNK)
+            if chunk_a == chunk_b:
+                if not chunk_a:
+                    return None, None
+                if line is not None:
+                    line = None if b"\0" in chunk_a else line + chunk_a.count(b"\n")
+                offset += len(chunk_a)
+                continue
+
+            index = _mismatch(chunk_a, chunk_b)
+            if line is not None and b"\0" not in chunk_a[:index]:
+                line += chunk_a[:index].count(b"\n")
+            else:
+                line = None
+            return offset + index, line
+
+
+def diff_archives(path_a: Path, path_b: Path, first_only: bool = False) -> List[ArchiveDifference]:
+    """
+    Compare two zip archives member by member.
+
+    Args:
+        path_a: First archive (e.g. the released .pyz).
+        path_b: Second archive (e.g. the local rebuild).
+        first_only: Stop at the first difference.
+
+    Returns:
+        Differences in archive order; empty if the archives are equivalent.
+    """
+    differences: List[ArchiveDifference] = []
+
+    with zipfile.ZipFile(path_a) as zf_a, zipfile.ZipFile(path_b) as zf_b:
+        infos_a = zf_a.infolist()
+        infos_b = zf_b.infolist()
+
+        prefix_a, prefix_b = _prefix(path_a, infos_a), _prefix(path_b, infos_b)
+        if prefix_a != prefix_b:
+            differences.append(ArchiveDifference(
+                "prefix", None, f"bytes before the archive differ: {prefix_a[:80]!r} != {prefix_b[:80]!r}"
+            ))
+            if first_only:
+                return differences
+
+        # A name stored twice is ambiguous: extractors disagree on which copy wins
+        for path, infos in ((path_a, infos_a), (path_b, infos_b)):
+            counts = Counter(info.filename for info in infos)
+            for name in sorted(name for name, count in counts.items() if count > 1):
+                differences.append(ArchiveDifference(
+                    "duplicate", name, f"stored {counts[name]} times in {path.name}"
+                ))
+                if first_only:
+                    return differences
+
+        by_name_b = {info.filename: info for info in infos_b}
+        names_a = [info.filename for info in infos_a]
+        common = [name for name in names_a if name in by_name_b]
+        common_set = set(common)
+        common_b = [info.filename for info in infos_b if info.filename in common_set]
+        if common != common_b:
+            # With duplicate names one list can be a prefix of the other
+            position = next(
+                (i for i, (x, y) in enumerate(zip(common, common_b)) if x != y), min(len(common), len(common_b))
+            )
+            name_a = common[position] if position < len(common) else "(end)"
+            name_b = common_b[position] if position < len(common_b) else "(end)"
+            differences.append(ArchiveDifference(
+                "order", name_a if position < len(common) else name_b,
+                f"member order differs at position {position}: {name_a} != {name_b}"
+            ))
+            if first_only:
+                return differences
+
+        for info_a in infos_a:
+            info_b = by_name_b.get(info_a.filename)
+            if info_b is None:
+                differences.append(ArchiveDifference("only-in-a", info_a.filename, f"only in {path_a.name}"))
+            else:
+                for field in METADATA_FIELDS:
+                    value_a, value_b = getattr(info_a, field), getattr(info_b, field)
+                    if value_a != value_b:
+                        differences.append(ArchiveDifference(
+                            "metadata", info_a.filename, f"{field}: {value_a!r} != {value_b!r}"
+                        ))
+                if info_a.CRC != info_b.CRC:
+                    offset, line = _first_divergence(zf_a, info_a, zf_b, info_b)
+                    where = f"at byte {offset}" + (f" (line {line})" if line is not None else "")
+                    differences.append(ArchiveDifference(
+                        "content", info_a.filename, f"content differs {where}", offset, line
+                    ))
+            if first_only and differences:
+                return differences
+
+        for info_b in infos_b:
+            if info_b.filename not in common_set:
+                differences.append(ArchiveDifference("only-in-b", info_b.filename, f"only in {path_b.name}"))
+                if first_only:
+                    return differences
+
+        if zf_a.comment != zf_b.comment:
+            differences.append(ArchiveDifference("comment", None, f"archive comment: {zf_a.comment!r} != {zf_b.comment!r}"))
+
+    return differences
+
+
+def diff_pyz_command(args) -> int:
+    """Run the diff-pyz command. Exit status follows diff(1): 0 same, 1 different, 2 error."""
+    path_a, path_b = Path(args.a), Path(args.b)
+    started = time.perf_counter()
+    try:
+        differences = diff_archives(path_a, path_b, first_only=getattr(args, 'first', False))
+    except (OSError, zipfile.BadZipFile, RuntimeError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 2
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if getattr(args, 'json', False):
+        print(json.dumps({
+            "a": str(path_a),
+            "b": str(path_b),
+            "identical": not differences,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "differences": [d.to_dict() for d in differences],
+        }, indent=2))
+        return 1 if differences else 0
+
+    if not differences:
+        print(f"✓ {path_a.name} and {path_b.name} have identical members ({elapsed_ms:.1f} ms)")
+        return 0
+
+    print(f"✗ {len(differences)} difference(s) between {path_a} and {path_b} ({elapsed_ms:.1f} ms)")
+    print(f"First divergence: {differences[0]}")
+    for difference in differences[1:]:
+        print(f"  {difference}")
+    return 1
@@ -0,0 +1,237 @@
+"""
+Rate-limit-aware scheduling for GitHub-bound lookups.
+
+Batch runs verify many artifacts from the same releases, so the same
+``gh release view`` / API lookups are issued over and over until GitHub's
+rate limit kicks in and every remaining check fails slowly. The scheduler
+shared by all verifications in a process:
+
+- paces calls with a token bucket, slowing down further once the
+  ``X-RateLimit-Remaining`` budget runs low;
+- coalesces concurrent lookups with the same key into one call and reuses
+  the result for a short time;
+- when the budget is exhausted, serves the last good result for the key
+  instead of waiting for ``X-RateLimit-Reset``.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+
+class RateLimitExhausted(Exception):
+    """Raised when the rate-limit budget is spent and no cached result exists."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"GitHub API rate limit exhausted (resets in {retry_after:.0f}s)")
+        self.retry_after = retry_after
+
+
+class _Call:
+    """An in-flight lookup that other callers can wait on."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.stale = False
+        self.error: Optional[BaseException] = None
+
+
+class RateLimitScheduler:
+    """Token-bucket scheduler with request coalescing and stale fallback."""
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        max_wait: float = 10.0,
+        fresh_ttl: float = 60.0,
+        low_watermark: int = 100,
+        max_entries: int = 1024,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            rate: Sustained calls per second while the budget is healthy.
+            burst: Bucket capacity (calls allowed back-to-back).
+            max_wait: Longest time a call may block waiting for budget before
+                falling back to cached data.
+            fresh_ttl: Seconds a successful result is reused without a new call.
+            low_watermark: Remaining-budget level below which calls are spread
+                evenly over the time left until the reset.
+            max_entries: Number of results remembered for reuse/fallback.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self.fresh_ttl = fresh_ttl
+        self.low_watermark = low_watermark
+        self.max_entries = max_entries
+
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None  # epoch seconds
+
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+
+        self.stats: Dict[str, float] = {
+            "calls": 0,
+            "coalesced": 0,
+            "cache_hits": 0,
+            "served_stale": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """Record the budget reported by X-RateLimit-* / Retry-After headers."""
+        lowered = {k.lower(): v for k, v in headers.items()}
+        with self._cond:
+            try:
+                if "x-ratelimit-remaining" in lowered:
+                    self._remaining = int(lowered["x-ratelimit-remaining"])
+                if "x-ratelimit-reset" in lowered:
+                    self._reset_at = float(lowered["x-ratelimit-reset"])
+                if "retry-after" in lowered:
+                    self._remaining = 0
+                    self._reset_at = time.time() + float(lowered["retry-after"])
+            except ValueError:
+                pass
+            self._cond.notify_all()
+
+    def note_exhausted(self, retry_after: float = 60.0):
+        """Mark the budget as spent when a tool reports a rate-limit error."""
+        with self._cond:
+            self._remaining = 0
+            self._reset_at = time.time() + retry_after
+
+    def _current_rate(self, now: float) -> float:
+        if self._remaining is None or self._reset_at is None or self._remaining > self.low_watermark:
+            return self.rate
+        window = max(self._reset_at - now, 1.0)
+        return max(min(self.rate, self._remaining / window), 1e-3)
+
+    def acquire(self):
+        """
+        Block until a call may be made.
+
+        Raises:
+            RateLimitExhausted: If budget will not be available within max_wait.
+        """
+        with self._cond:
+            waited = 0.0
+            while True:
+                now = time.time()
+                if self._remaining is not None and self._remaining <= 0 and self._reset_at:
+                    retry_after = self._reset_at - now
+                    if retry_after > 0:
+                        if waited + retry_after > self.max_wait:
+                            raise RateLimitExhausted(retry_after)
+                        delay = retry_after
+                    else:
+                        # Window has reset; wait for fresh headers to tell us the new budget
+                        self._remaining = None
+                        self._reset_at = None
+                        continue
+                else:
+                    mono = time.monotonic()
+                    rate = self._current_rate(now)
+                    self._tokens = min(float(self.burst), self._tokens + (mono - self._last_refill) * rate)
+                    self._last_refill = mono
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        if self._remaining is not None:
+                            self._remaining -= 1
+                        self.stats["wait_seconds"] += waited
+                        return
+                    delay = (1.0 - self._tokens) / rate
+                    if waited + delay > self.max_wait:
+                        raise RateLimitExhausted(delay)
+
+                self._cond.wait(delay)
+                waited += delay
+
+    def _remember(self, key: Hashable, result: Any):
+        self._results[key] = (time.monotonic(), result)
+        if len(self._results) > self.max_entries:
+            oldest = min(self._results, key=lambda k: self._results[k][0])
+            del self._results[oldest]
+
+    def fetch(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        cacheable: Callable[[Any], bool] = lambda result: True,
+    ) -> Tuple[Any, bool]:
+        """
+        Run func under the scheduler, coalescing calls that share a key.
+
+        Args:
+            key: Identity of the lookup, e.g. ("release-view", repo, tag).
+            func: Performs the lookup.
+            cacheable: Decides whether a result may be reused/served later.
+
+        Returns:
+            (result, stale) where stale is True if the result was served from
+            cache because the rate-limit budget is exhausted.
+        """
+        with self._cond:
+            cached = self._results.get(key)
+            if cached and time.monotonic() - cached[0] < self.fresh_ttl:
+                self.stats["cache_hits"] += 1
+                return cached[1], False
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, call.stale
+
+        try:
+            try:
+                self.acquire()
+            except RateLimitExhausted:
+                if cached is None:
+                    raise
+                with self._cond:
+                    self.stats["served_stale"] += 1
+                call.result, call.stale = cached[1], True
+            else:
+                result = func()
+                with self._cond:
+                    self.stats["calls"] += 1
+                    if cacheable(result):
+                        self._remember(key, result)
+                call.result = result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._cond:
+                self._inflight.pop(key, None)
+            call.event.set()
+
+        return call.result, call.stale
+
+
+_default_scheduler: Optional[RateLimitScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> RateLimitScheduler:
+    """Return the scheduler shared by every verification in this process."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RateLimitScheduler()
+        return _default_scheduler
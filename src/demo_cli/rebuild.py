@@ -0,0 +1,247 @@
+"""
+Rebuild a released .pyz from source and compare digests (verify --rebuild).
+
+The release's build-metadata.json records the git commit and
+SOURCE_DATE_EPOCH it was built from. The rebuild exports ``src/`` at that
+commit with ``git archive`` and runs the same deterministic builder
+(:mod:`demo_cli.build_pyz`) with the same epoch; a reproducible release
+yields a byte-identical archive.
+
+Everything expensive is cached under ``cache_dir()/rebuild``:
+
+- exported source trees, keyed by git's tree hash of ``src/`` (a content
+  hash, so a tree shared by several commits is exported once), and
+- built archives, reused by the builder's input stamp.
+
+Checking many releases therefore costs one export and one build per
+distinct source tree; repeats only re-hash the inputs.
+
+``demo_cli/_version.py`` is generated by hatch-vcs at build time and is not
+in git. The rebuild regenerates it from the template pinned in
+pyproject.toml and the version of the recorded tag (or, for untagged builds,
+the version setuptools-scm derives from ``git describe``), and the artifact's
+copy must be byte-identical to it. Nothing from the artifact under
+verification goes into the rebuilt tree.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from .build_pyz import build
+from .cache import cache_dir
+from .pyz import MAX_MEMBER_SIZE, VERSION_MEMBERS, version_from_source
+
+GIT_TIMEOUT = 120
+
+# Must match [tool.hatch.build.hooks.vcs] template in pyproject.toml
+VERSION_TEMPLATE = """\
+# file generated by hatch-vcs
+# don't change, don't track in version control
+__version__ = version = {version!r}
+__version_tuple__ = version_tuple = {version_tuple!r}
+"""
+
+_VERSION_RE = re.compile(r"^(\d+(?:\.\d+)*)((?:a|b|rc)\d+)?(?:\.post\d+)?(?:\.dev(\d+))?(?:\+(.+))?$")
+_DESCRIBE_RE = re.compile(r"^(.+)-(\d+)-g([0-9a-f]+)$")
+
+
+class RebuildError(Exception):
+    """Raised when the release cannot be rebuilt from source."""
+
+
+class RebuildResult:
+    """Outcome of rebuilding a release from source."""
+
+    def __init__(self, sha256: str, commit: str, tree: str, output: Path, exported: bool, rebuilt: bool):
+        self.sha256 = sha256
+        self.commit = commit
+        self.tree = tree
+        self.output = output
+        self.exported = exported
+        self.rebuilt = rebuilt
+
+    @property
+    def cached(self) -> bool:
+        """True if neither an export nor a build was needed."""
+        return not (self.exported or self.rebuilt)
+
+
+def _git(source: Path, *args: str, stdout=subprocess.PIPE) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(
+            ["git", "-C", str(source), *args],
+            stdout=stdout,
+            stderr=subprocess.PIPE,
+            timeout=GIT_TIMEOUT,
+        )
+    except FileNotFoundError:
+        raise RebuildError("git not found on PATH")
+    except subprocess.TimeoutExpired:
+        raise RebuildError(f"git {args[0]} timed out after {GIT_TIMEOUT}s")
+
+
+def _resolve(source: Path, revision: str) -> str:
+    result = _git(source, "rev-parse", "--verify", "--quiet", revision)
+    if result.returncode != 0:
+        return ""
+    return result.stdout.decode().strip()
+
+
+def _export_tree(source: Path, commit: str, destination: Path, generated: Dict[str, bytes]):
+    """Extract src/ at commit, plus generated files, into destination atomically."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=destination.parent, prefix=f".{destination.name}."))
+    try:
+        with tempfile.TemporaryFile() as archive:
+            result = _git(source, "archive", "--format=tar", commit, "src", stdout=archive)
+            if result.returncode != 0:
+                raise RebuildError(f"git archive failed: {result.stderr.decode(errors='replace').strip()}")
+            archive.seek(0)
+            with tarfile.open(fileobj=archive, mode="r:") as tar:
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(staging, filter="data")
+                else:  # pragma: no cover - Python without extraction filters
+                    tar.extractall(staging)
+        for name, content in generated.items():
+            (staging / "src" / name).write_bytes(content)
+        try:
+            os.replace(staging / "src", destination)
+        except OSError:
+            if not destination.is_dir():
+                raise
+            # Another verification exported the same tree concurrently
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _tag_version(tag: str) -> str:
+    """The PEP 440 version hatch-vcs derives from a tag (v1.0.0-rc.1 -> 1.0.0rc1)."""
+    return tag.lstrip("v").replace("-alpha.", "a").replace("-beta.", "b").replace("-rc.", "rc")
+
+
+def _version_tuple(version: str) -> tuple:
+    """setuptools-scm's version_tuple: release numbers, then the dev and local parts."""
+    match = _VERSION_RE.match(version)
+    if not match:
+        return (version,)
+    release, _pre, dev, local = match.groups()
+    fields = tuple(int(part) for part in release.split("."))
+    if dev is not None:
+        fields += (f"dev{dev}",)
+    if local is not None:
+        fields += (local,)
+    return fields
+
+
+def _commit_version(source: Path, commit: str) -> str:
+    """The version setuptools-scm (guess-next-dev, node-and-date) gives a clean, untagged commit."""
+    described = _git(source, "describe", "--tags", "--long", "--match", "*[0-9]*", commit)
+    match = _DESCRIBE_RE.match(described.stdout.decode().strip()) if described.returncode == 0 else None
+    if match is None:
+        count = _git(source, "rev-list", "--count", commit).stdout.decode().strip() or "0"
+        node = _git(source, "rev-parse", "--short", commit).stdout.decode().strip()
+        return f"0.1.dev{count}+g{node}"
+    tag, distance, node = match.groups()
+    version = _tag_version(tag)
+    if distance == "0":
+        return version
+    # guess-next-dev bumps the last number of the tag
+    bumped = re.sub(r"(\d+)(?!.*\d)", lambda m: str(int(m.group(1)) + 1), version)
+    return f"{bumped}.dev{distance}+g{node}"
+
+
+def version_module(version: str) -> bytes:
+    """The _version.py hatch-vcs writes for version."""
+    return VERSION_TEMPLATE.format(version=version, version_tuple=_version_tuple(version)).encode("utf-8")
+
+
+def _check_version_module(artifact: Path, expected: bytes, version: str):
+    """Fail unless the artifact's _version.py is exactly the generated one."""
+    try:
+        with zipfile.ZipFile(artifact) as zf:
+            info = zf.getinfo(VERSION_MEMBERS[0])
+            if info.file_size > MAX_MEMBER_SIZE:
+                raise RebuildError(f"{VERSION_MEMBERS[0]} in {artifact.name} is implausibly large")
+            content = zf.read(info)
+    except KeyError:
+        raise RebuildError(f"{artifact.name} has no {VERSION_MEMBERS[0]}")
+    except (OSError, zipfile.BadZipFile) as e:
+        raise RebuildError(f"Cannot read {artifact.name}: {e}")
+
+    if content != expected:
+        declared = version_from_source(content.decode("utf-8", errors="replace"))
+        raise RebuildError(
+            f"{VERSION_MEMBERS[0]} in {artifact.name} is not the file hatch-vcs generates for {version}"
+            + (f" (it declares {declared})" if declared and declared != version else "")
+        )
+
+
+def rebuild_release(
+    source: Path,
+    metadata: Dict,
+    artifact: Path,
+    cache_root: Optional[Path] = None,
+) -> RebuildResult:
+    """
+    Rebuild artifact from a source checkout using its build metadata.
+
+    Args:
+        source: Git checkout containing the recorded commit.
+        metadata: Parsed build-metadata.json (git_commit, SOURCE_DATE_EPOCH, ...).
+        artifact: The released .pyz (only its _version.py is read, to compare).
+        cache_root: Cache directory. Defaults to cache_dir() / "rebuild".
+
+    Returns:
+        RebuildResult with the digest of the rebuilt archive.
+
+    Raises:
+        RebuildError: If the inputs cannot be reconstructed.
+    """
+    commit = str(metadata.get("git_commit") or "")
+    if not commit or commit == "unknown":
+        raise RebuildError("build-metadata.json does not record git_commit")
+    epoch = str(metadata.get("SOURCE_DATE_EPOCH") or "")
+    if not epoch.isdigit():
+        raise RebuildError("build-metadata.json does not record a numeric SOURCE_DATE_EPOCH")
+
+    bytecode = metadata.get("bytecode")
+    if bytecode and bytecode != sys.implementation.cache_tag:
+        raise RebuildError(
+            f"Release bytecode is {bytecode} but this interpreter is {sys.implementation.cache_tag}; "
+            f"rerun with the matching Python version"
+        )
+
+    if _git(source, "rev-parse", "--git-dir").returncode != 0:
+        raise RebuildError(f"{source} is not a git checkout")
+    full_commit = _resolve(source, f"{commit}^{{commit}}")
+    if not full_commit:
+        raise RebuildError(f"Commit {commit[:12]} not found in {source} (try: git fetch --tags)")
+    tree = _resolve(source, f"{full_commit}:src")
+    if not tree:
+        raise RebuildError(f"Commit {commit[:12]} has no src/ directory")
+
+    tag = str(metadata.get("git_tag") or "")
+    version = _tag_version(tag) if tag and tag != "none" else _commit_version(source, full_commit)
+    generated = version_module(version)
+    _check_version_module(artifact, generated, version)
+    version_key = hashlib.sha256(generated).hexdigest()[:16]
+
+    root = cache_root or (cache_dir() / "rebuild")
+    tree_dir = root / "trees" / f"{tree}-{version_key}"
+    exported = False
+    if not tree_dir.is_dir():
+        _export_tree(source, full_commit, tree_dir, {VERSION_MEMBERS[0]: generated})
+        exported = True
+
+    output = root / "builds" / f"{tree}-{version_key}-{epoch}" / artifact.name
+    result = build(tree_dir, output, int(epoch))
+    return RebuildResult(result.sha256, full_commit, tree, output, exported, result.rebuilt)
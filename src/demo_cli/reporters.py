@@ -0,0 +1,395 @@
+"""
+Reporters render verification progress and results.
+
+``Verifier.verify_all`` only runs checks and emits events; a reporter chosen
+once at start-up decides what (if anything) is written:
+
+- ``rich``: coloured output with a spinner (interactive terminals only)
+- ``plain``: the same text without rich (CI logs, pipes)
+- ``json``: the JSON report, streamed check by check
+- ``ndjson``: one line per check as it finishes, then a summary line
+- ``junit``: JUnit XML for CI test report viewers
+- ``sarif``: SARIF 2.1.0 for code scanning dashboards
+
+The base :class:`Reporter` renders nothing and is used by the verification
+services. Machine-readable reporters write to a stream as events arrive, so a
+report is never held in memory, and rich is imported only by
+:class:`RichReporter`.
+"""
+
+import json
+import sys
+from typing import IO, TYPE_CHECKING, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .verify import VerificationResult, Verifier
+
+FORMATS = ("text", "json", "ndjson", "junit", "sarif")
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TROUBLESHOOTING = [
+    "⚠ Some verifications failed or are skipped",
+    "This may be expected if:",
+    "  • You're running a development build (not a release)",
+    "  • Security tools (cosign, gh, osv-scanner) are not installed",
+    "  • Attestation files are not present locally",
+]
+
+# (key, display name) of each check about to run
+CheckList = Sequence[Tuple[str, str]]
+
+
+class Reporter:
+    """Receives verification events and renders nothing (quiet and service use)."""
+
+    def start(self, verifier: "Verifier", checks: CheckList):
+        """Called once before the first check runs."""
+
+    def check_started(self, key: str, name: str):
+        """Called when a check starts."""
+
+    def check_finished(self, key: str, result: "VerificationResult"):
+        """Called with each result as soon as its check finishes."""
+
+    def invalid_checks(self, selected: List[str], available: List[str]):
+        """Called when none of the requested checks exist."""
+
+    def finish(self, verifier: "Verifier", success: bool):
+        """Called once after the last check."""
+
+    def close(self):
+        """Release live displays; safe to call more than once."""
+
+
+class TeeReporter(Reporter):
+    """Forwards every event to several reporters (e.g. text on stdout plus a JSON file)."""
+
+    def __init__(self, *reporters: Reporter):
+        self.reporters = reporters
+
+    def start(self, verifier, checks):
+        for reporter in self.reporters:
+            reporter.start(verifier, checks)
+
+    def check_started(self, key, name):
+        for reporter in self.reporters:
+            reporter.check_started(key, name)
+
+    def check_finished(self, key, result):
+        for reporter in self.reporters:
+            reporter.check_finished(key, result)
+
+    def invalid_checks(self, selected, available):
+        for reporter in self.reporters:
+            reporter.invalid_checks(selected, available)
+
+    def finish(self, verifier, success):
+        for reporter in self.reporters:
+            reporter.finish(verifier, success)
+
+    def close(self):
+        for reporter in self.reporters:
+            reporter.close()
+
+
+class PlainReporter(Reporter):
+    """Human-readable text without rich."""
+
+    def __init__(self, stream: Optional[IO[str]] = None, verbose: bool = False):
+        self.stream = stream or sys.stdout
+        self.verbose = verbose
+
+    def _print(self, text: str = ""):
+        print(text, file=self.stream)
+
+    def _header(self, text: str):
+        self._print(f"\n{'=' * 60}")
+        self._print(text)
+        self._print('=' * 60)
+
+    def start(self, verifier, checks):
+        self._header(f"🔐 Verifying {verifier.binary_path.name if verifier.binary_path else 'binary'}")
+        self._print(f"Version: {verifier.version}")
+        self._print(f"Repository: {verifier.github_repo}")
+
+    def check_started(self, key, name):
+        self._print(f"\nChecking {name}...")
+
+    def check_finished(self, key, result):
+        status = "✓" if result.passed else "✗"
+        timing = f" ({result.duration_ms:.0f}ms)" if self.verbose and result.duration_ms else ""
+        self._print(f"{status} {result.name}: {result.message}{timing}")
+        if result.details:
+            self._print(f"  {result.details}")
+
+    def invalid_checks(self, selected, available):
+        self._print(f"No valid checks found in: {', '.join(selected)}")
+        self._print(f"Available checks: {', '.join(available)}")
+
+    def finish(self, verifier, success):
+        if not verifier.results:
+            return
+        passed = sum(1 for r in verifier.results if r.passed)
+        self._header("Summary")
+        self._print(f"{'✓' if success else '✗'} {passed}/{len(verifier.results)} checks passed")
+
+        if not success:
+            self._print()
+            for line in TROUBLESHOOTING:
+                self._print(line)
+            self._print("\n💡 For detailed troubleshooting:")
+            self._print("   • Review error messages above for specific guidance")
+            self._print("   • See: docs/security/VERIFICATION-EXAMPLE.md")
+            self._print(f"   • Download all release artifacts: gh release download <tag> --repo {verifier.github_repo}")
+
+
+class RichReporter(Reporter):
+    """Coloured output with a spinner while each check runs."""
+
+    def __init__(self, stream: Optional[IO[str]] = None, verbose: bool = False):
+        from rich.console import Console
+
+        self.console = Console(file=stream)
+        self.verbose = verbose
+        self._progress = None
+        self._task = None
+
+    def start(self, verifier, checks):
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        self.console.print(
+            f"\n[bold cyan]🔐 Verifying {verifier.binary_path.name if verifier.binary_path else 'binary'}[/bold cyan]"
+        )
+        self.console.print(f"[dim]Version: {verifier.version}[/dim]")
+        self.console.print(f"[dim]Repository: {verifier.github_repo}[/dim]")
+        if checks:
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console,
+                transient=True,
+            )
+            self._progress.start()
+
+    def check_started(self, key, name):
+        if self._progress is not None:
+            self._task = self._progress.add_task(f"Checking {name}...", total=None)
+
+    def check_finished(self, key, result):
+        if self._progress is not None and self._task is not None:
+            self._progress.remove_task(self._task)
+            self._task = None
+        status = "[green]✓[/green]" if result.passed else "[red]✗[/red]"
+        timing = f" [dim]({result.duration_ms:.0f}ms)[/dim]" if self.verbose and result.duration_ms else ""
+        self.console.print(f"{status} {result.name}: {result.message}{timing}")
+        if result.details:
+            self.console.print(f"  [dim]{result.details}[/dim]")
+
+    def invalid_checks(self, selected, available):
+        self.console.print(f"[red]No valid checks found in: {', '.join(selected)}[/red]")
+        self.console.print(f"[dim]Available checks: {', '.join(available)}[/dim]")
+
+    def finish(self, verifier, success):
+        self.close()
+        if not verifier.results:
+            return
+        passed = sum(1 for r in verifier.results if r.passed)
+        status_color = "green" if success else "red"
+        self.console.print("\n[bold cyan]Summary[/bold cyan]")
+        self.console.print(f"[{status_color}]{passed}/{len(verifier.results)} checks passed[/{status_color}]")
+
+        if not success:
+            self.console.print(f"\n[yellow]{TROUBLESHOOTING[0]}[/yellow]")
+            for line in TROUBLESHOOTING[1:]:
+                self.console.print(f"[dim]{line}[/dim]")
+            self.console.print("\n[cyan]💡 For detailed troubleshooting:[/cyan]")
+            self.console.print("[dim]   • Review error messages above for specific guidance[/dim]")
+            self.console.print("[dim]   • See: docs/security/VERIFICATION-EXAMPLE.md[/dim]")
+            self.console.print(
+                f"[dim]   • Download all release artifacts: gh release download <tag> --repo {verifier.github_repo}[/dim]"
+            )
+
+    def close(self):
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
+
+
+class StreamReporter(Reporter):
+    """Base for machine-readable reporters: the stream carries only the report."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    def invalid_checks(self, selected, available):
+        print(f"No valid checks found in: {', '.join(selected)}", file=sys.stderr)
+        print(f"Available checks: {', '.join(available)}", file=sys.stderr)
+
+
+class JSONReporter(StreamReporter):
+    """
+    The JSON report (see ``Verifier.to_report``), written as checks finish.
+
+    Run-level fields come first and ``passed``/``summary`` last, so the
+    document is complete only once ``finish`` has been called.
+    """
+
+    def __init__(self, stream: IO[str]):
+        super().__init__(stream)
+        self._count = 0
+        self._header_keys = set()
+
+    def start(self, verifier, checks):
+        header = {
+            "binary": str(verifier.binary_path) if verifier.binary_path else None,
+            "version": verifier.version,
+            "repository": verifier.github_repo,
+            "timestamp": verifier.timestamp,
+        }
+        self._header_keys = set(header)
+        self.stream.write(json.dumps(header, indent=2)[:-2] + ',\n  "checks": [')
+
+    def check_finished(self, key, result):
+        item = json.dumps(result.to_dict(), indent=2).replace("\n", "\n    ")
+        self.stream.write(("," if self._count else "") + "\n    " + item)
+        self.stream.flush()
+        self._count += 1
+
+    def finish(self, verifier, success):
+        summary = verifier.to_summary(success)
+        tail = json.dumps({key: value for key, value in summary.items() if key not in self._header_keys}, indent=2)
+        self.stream.write(("\n  ]," if self._count else "],") + tail[1:] + "\n")
+        self.stream.flush()
+
+
+class NDJSONReporter(StreamReporter):
+    """One JSON line per check as it finishes, then a summary line."""
+
+    def _write(self, record):
+        self.stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.stream.flush()
+
+    def check_finished(self, key, result):
+        self._write({"type": "check", **result.to_dict()})
+
+    def finish(self, verifier, success):
+        self._write({"type": "summary", **verifier.to_summary(success)})
+
+
+class JUnitReporter(StreamReporter):
+    """
+    JUnit XML with one testcase per check.
+
+    Testcases are written as they finish, so the testsuite carries no count
+    attributes; CI report viewers (GitHub, GitLab, Jenkins) derive them.
+    """
+
+    def start(self, verifier, checks):
+        name = verifier.binary_path.name if verifier.binary_path else "binary"
+        self.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        self.stream.write(
+            f"  <testsuite name={quoteattr(f'provenance-verify {name}')} timestamp={quoteattr(verifier.timestamp)}>\n"
+        )
+
+    def check_finished(self, key, result):
+        seconds = (result.duration_ms or 0) / 1000
+        self.stream.write(
+            f"    <testcase classname=\"provenance.verify\" name={quoteattr(key)} time=\"{seconds:.3f}\">"
+        )
+        if result.passed:
+            self.stream.write(f"\n      <system-out>{escape(result.message)}</system-out>\n    </testcase>\n")
+        else:
+            self.stream.write(
+                f"\n      <failure message={quoteattr(result.message)}>{escape(result.details or '')}</failure>\n"
+                f"    </testcase>\n"
+            )
+        self.stream.flush()
+
+    def finish(self, verifier, success):
+        self.stream.write("  </testsuite>\n</testsuites>\n")
+        self.stream.flush()
+
+
+class SARIFReporter(StreamReporter):
+    """SARIF 2.1.0 with one rule per selected check and one result per check run."""
+
+    def __init__(self, stream: IO[str]):
+        super().__init__(stream)
+        self._count = 0
+        self._artifact = "binary"
+
+    def start(self, verifier, checks):
+        from . import __version__
+
+        self._artifact = verifier.binary_path.name if verifier.binary_path else "binary"
+        rules = [
+            {"id": key, "name": name, "shortDescription": {"text": f"{name} verification"}}
+            for key, name in checks
+        ]
+        driver = {
+            "name": "provenance-demo verify",
+            "version": __version__,
+            "informationUri": f"https://github.com/{verifier.github_repo}",
+            "rules": rules,
+        }
+        head = json.dumps({"$schema": SARIF_SCHEMA, "version": "2.1.0"})[:-1]
+        self.stream.write(f'{head}, "runs": [{{"tool": {{"driver": {json.dumps(driver)}}}, "results": [\n')
+
+    def check_finished(self, key, result):
+        record = {
+            "ruleId": key,
+            "kind": "pass" if result.passed else "fail",
+            "level": "none" if result.passed else "error",
+            "message": {"text": result.message + (f"\n{result.details}" if result.details else "")},
+            "locations": [{"physicalLocation": {"artifactLocation": {"uri": self._artifact}}}],
+        }
+        self.stream.write(("," if self._count else "") + json.dumps(record) + "\n")
+        self.stream.flush()
+        self._count += 1
+
+    def finish(self, verifier, success):
+        self.stream.write(']}]}\n')
+        self.stream.flush()
+
+
+def rich_available() -> bool:
+    """Return True if rich can be imported."""
+    try:
+        import rich  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_reporter(output_format: str = "text", stream: Optional[IO[str]] = None, verbose: bool = False) -> Reporter:
+    """
+    Select the reporter for an output format.
+
+    Args:
+        output_format: One of FORMATS.
+        stream: Where to write. Defaults to stdout.
+        verbose: Include per-check timings in text output.
+
+    Returns:
+        The reporter. Text uses rich only when the stream is an interactive
+        terminal and rich is installed; otherwise no rich object is created.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    stream = stream or sys.stdout
+    if output_format == "text":
+        isatty = getattr(stream, "isatty", None)
+        if isatty and isatty() and rich_available():
+            return RichReporter(stream, verbose=verbose)
+        return PlainReporter(stream, verbose=verbose)
+    if output_format == "json":
+        return JSONReporter(stream)
+    if output_format == "ndjson":
+        return NDJSONReporter(stream)
+    if output_format == "junit":
+        return JUnitReporter(stream)
+    if output_format == "sarif":
+        return SARIFReporter(stream)
+    raise ValueError(f"Unknown output format: {output_format}")
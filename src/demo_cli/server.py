@@ -0,0 +1,297 @@
+"""
+Long-running verification service.
+
+``provenance-demo serve --socket PATH`` keeps the state that makes a cold
+``provenance-demo verify`` slow warm between requests: the interpreter and
+its imports, file digests and parsed evidence (attestation bundles, SBOMs,
+OSV results, Sigstore bundles), the external tool registry, the GitHub API
+connection pool and the rate-limit scheduler. Repeated verifications of
+unchanged evidence are then answered from memory.
+
+Wire protocol: every message, in both directions, is a 4-byte big-endian
+length followed by that many bytes of UTF-8 encoded JSON. A connection may
+carry any number of request/response pairs.
+
+Requests::
+
+    {"op": "verify", "file": "/abs/path/app.pyz", "checks": ["checksum"], "repository": "OWNER/REPO"}
+    {"op": "ping"}
+    {"op": "stats"}
+
+Responses are ``{"ok": true, "result": <verification report>}`` (the same
+document ``verify --json`` prints) or ``{"ok": false, "error": "..."}``.
+
+The socket is created owner-only (0600); anyone who can connect can make
+the service read files the service user can read.
+"""
+
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cache import StatCache, get_default_stat_cache
+from .ratelimit import RateLimitScheduler, get_default_scheduler
+from .tools import KNOWN_TOOLS, ToolRegistry, get_default_registry
+from .verify import Verifier
+
+logger = logging.getLogger(__name__)
+
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+_HEADER = struct.Struct(">I")
+
+
+class ProtocolError(Exception):
+    """Raised for malformed or oversized messages."""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1024 * 1024))
+        if not chunk:
+            if remaining == size:
+                return None
+            raise ProtocolError("Connection closed mid-message")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def send_message(sock: socket.socket, payload: Dict):
+    """Send one length-prefixed JSON message."""
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    if len(data) > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message too large ({len(data)} bytes)")
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def recv_message(sock: socket.socket) -> Optional[Dict]:
+    """Receive one length-prefixed JSON message. Returns None on a clean EOF."""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message too large ({size} bytes), max {MAX_MESSAGE_SIZE}")
+
+    body = _recv_exact(sock, size) or b""
+    try:
+        message = json.loads(body)
+    except ValueError as exc:
+        raise ProtocolError(f"Invalid JSON: {exc}") from exc
+    if not isinstance(message, dict):
+        raise ProtocolError("Message must be a JSON object")
+    return message
+
+
+class VerificationService:
+    """Verification state kept warm across requests."""
+
+    def __init__(
+        self,
+        github_repo: Optional[str] = None,
+        cache: Optional[StatCache] = None,
+        tools: Optional[ToolRegistry] = None,
+        scheduler: Optional[RateLimitScheduler] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            github_repo: Default OWNER/REPO for requests that do not name one.
+            cache: Digest/evidence cache shared by all requests.
+            tools: External tool registry shared by all requests.
+            scheduler: Rate-limit scheduler shared by all requests.
+        """
+        self.github_repo = github_repo
+        self.cache = cache if cache is not None else get_default_stat_cache()
+        self.tools = tools if tools is not None else get_default_registry()
+        self.scheduler = scheduler if scheduler is not None else get_default_scheduler()
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        # Resolve tools up front so the first request does not pay for it
+        for tool in KNOWN_TOOLS:
+            self.tools.resolve(tool)
+
+    def verify(
+        self,
+        file: str,
+        checks: Optional[List[str]] = None,
+        repository: Optional[str] = None,
+    ) -> Dict:
+        """Verify a file and return the JSON report."""
+        path = Path(file)
+        if not path.is_absolute():
+            raise ValueError("file must be an absolute path")
+
+        verifier = Verifier(
+            path,
+            quiet=True,
+            scheduler=self.scheduler,
+            tools=self.tools,
+            cache=self.cache,
+        )
+        if repository or self.github_repo:
+            verifier.github_repo = repository or self.github_repo
+
+        success = verifier.verify_all(selected_checks=checks)
+        return verifier.to_report(success)
+
+    def stats(self) -> Dict:
+        """Counters describing the warm state."""
+        return {
+            "uptime_s": round(time.time() - self.started, 3),
+            "requests": self.requests,
+            "cache_entries": len(self.cache),
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "scheduler": dict(self.scheduler.stats),
+        }
+
+    def handle(self, request: Dict) -> Dict:
+        """Dispatch one protocol request to a response message."""
+        with self._lock:
+            self.requests += 1
+
+        op = request.get("op", "verify")
+        try:
+            if op == "ping":
+                return {"ok": True, "pong": True}
+            if op == "stats":
+                return {"ok": True, "stats": self.stats()}
+            if op == "verify":
+                if not isinstance(request.get("file"), str):
+                    raise ValueError("verify requires a 'file' path")
+                checks = request.get("checks")
+                if checks is not None and not (
+                    isinstance(checks, list) and all(isinstance(c, str) for c in checks)
+                ):
+                    raise ValueError("'checks' must be a list of check names")
+                return {
+                    "ok": True,
+                    "result": self.verify(request["file"], checks, request.get("repository")),
+                }
+            raise ValueError(f"Unknown op: {op}")
+        except Exception as exc:
+            return {"ok": False, "error": str(exc)[:500]}
+
+
+class _UnixRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                request = recv_message(self.request)
+            except ProtocolError as exc:
+                try:
+                    send_message(self.request, {"ok": False, "error": str(exc)})
+                except OSError:
+                    pass
+                return
+            except OSError:
+                return
+
+            if request is None:
+                return
+            try:
+                send_message(self.request, self.server.service.handle(request))
+            except OSError as exc:
+                # The client went away before reading its reply
+                logger.debug("Dropped reply to disconnected client: %s", exc)
+                return
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class UnixVerificationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Threaded Unix socket server answering length-prefixed JSON requests."""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path: str, service: VerificationService):
+            self.service = service
+            _prepare_socket_path(socket_path)
+            old_umask = os.umask(0o177)
+            try:
+                super().__init__(socket_path, _UnixRequestHandler)
+            finally:
+                os.umask(old_umask)
+
+        def server_close(self):
+            super().server_close()
+            try:
+                os.unlink(self.server_address)
+            except OSError:
+                pass
+else:  # pragma: no cover - Windows without AF_UNIX support
+    UnixVerificationServer = None
+
+
+def _prepare_socket_path(socket_path: str):
+    """Remove a stale socket file, refusing to replace a live server or other files."""
+    path = Path(socket_path)
+    if not path.exists() and not path.is_symlink():
+        return
+    if not path.is_socket():
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        path.unlink()
+    else:
+        raise FileExistsError(f"A server is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+def request(socket_path: str, payload: Dict, timeout: float = 120.0) -> Dict:
+    """Send one request to a running service and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        send_message(sock, payload)
+        response = recv_message(sock)
+    if response is None:
+        raise ProtocolError("Server closed the connection without a response")
+    return response
+
+
+def serve_command(args) -> int:
+    """Run the serve command."""
+    if UnixVerificationServer is None:
+        print("❌ Error: Unix domain sockets are not supported on this platform", file=sys.stderr)
+        return 1
+
+    service = VerificationService(github_repo=getattr(args, 'repo', None))
+    try:
+        server = UnixVerificationServer(args.socket, service)
+    except (OSError, FileExistsError) as e:
+        print(f"❌ Error: cannot listen on {args.socket}: {e}", file=sys.stderr)
+        return 1
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    print(f"🔐 Verification service listening on {args.socket}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
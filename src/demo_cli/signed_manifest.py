@@ -0,0 +1,88 @@
+"""
+Signed checksum manifests (SHA256SUMS with SHA256SUMS.bundle).
+
+A release can be signed once: cosign signs SHA256SUMS in the release
+workflow, and every artifact whose sha256 matches the signed manifest is
+covered by that signature (the check ``scripts/verify_provenance.sh`` does
+with ``cosign verify-blob ... SHA256SUMS``). The verifier checks a manifest's
+signature once per manifest digest, bundle digest and expected signer and
+remembers the outcome for the process, so verifying N artifacts of a release
+costs one cosign call instead of N.
+"""
+
+import re
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+MANIFEST_NAME = "SHA256SUMS"
+BUNDLE_NAME = "SHA256SUMS.bundle"
+GITHUB_ACTIONS_ISSUER = "https://token.actions.githubusercontent.com"
+
+
+def workflow_identity_regexp(repo: str) -> str:
+    """Certificate identity of any GitHub Actions workflow in repo (OWNER/REPO)."""
+    return f"^https://github\\.com/{re.escape(repo)}/\\.github/workflows/"
+
+
+class ManifestSignatureCache:
+    """Remembers which signed manifests verified, by digest pair and signer."""
+
+    def __init__(self):
+        self._verified: Dict[Tuple, str] = {}
+        self._inflight: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.verifications = 0
+
+    def verify(self, key: Tuple, run: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str, bool]:
+        """
+        Verify a manifest signature unless the same key already verified.
+
+        Concurrent callers with the same key wait for a single run. Only
+        successful verifications are remembered; a failure (possibly a
+        network error) is retried by the next caller.
+
+        Args:
+            key: (manifest sha256, bundle sha256, identity, issuer).
+            run: Verifies the signature, returning (verified, detail).
+
+        Returns:
+            Tuple of (verified, detail, served from cache).
+        """
+        with self._lock:
+            if key in self._verified:
+                return True, self._verified[key], True
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                with self._lock:
+                    if key in self._verified:
+                        return True, self._verified[key], True
+                self.verifications += 1
+                verified, detail = run()
+                if verified:
+                    with self._lock:
+                        self._verified[key] = detail
+            finally:
+                # Also when run() raises (cosign missing or timing out)
+                with self._lock:
+                    if self._inflight.get(key) is key_lock:
+                        del self._inflight[key]
+        return verified, detail, False
+
+    def clear(self):
+        with self._lock:
+            self._verified.clear()
+
+
+_default_cache: Optional[ManifestSignatureCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_manifest_signatures() -> ManifestSignatureCache:
+    """Return the cache shared by every verification in this process."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ManifestSignatureCache()
+        return _default_cache
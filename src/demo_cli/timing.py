@@ -0,0 +1,134 @@
+"""
+Per-phase timing of verification checks.
+
+``verify_all`` runs each check under :func:`measure`, and the code doing the
+work marks what it is spending time on::
+
+    with phase("hash"):
+        digest = hash_file(path)
+
+Phases are exclusive: time spent in a nested phase (a ``parse`` that calls a
+``subprocess:gh``) is charged to the inner phase only, so the phases of a
+check add up to at most its total. Names used by the verifier:
+
+- ``hash``: hashing artifacts
+- ``parse``: loading JSON/JSONL evidence files and tool output
+- ``subprocess:<tool>``: running cosign, gh, osv-scanner, ...
+- ``network``: GitHub API requests
+
+Clocks are ``time.perf_counter_ns``. Outside :func:`measure` (e.g. direct
+calls to a single check) every helper is a no-op. While a trace is being
+recorded (:mod:`demo_cli.tracing`), each phase is also a span.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from . import tracing
+
+_NS_PER_MS = 1_000_000
+
+
+class PhaseTimer:
+    """Accumulates exclusive phase durations and bytes read for one check."""
+
+    def __init__(self):
+        self.phases: Dict[str, int] = {}
+        self.bytes_read = 0
+        self.total_ns = 0
+        self._stack: List[List] = []  # [name, ns when it last resumed]
+
+    def _charge(self, name: str, elapsed_ns: int):
+        self.phases[name] = self.phases.get(name, 0) + elapsed_ns
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Charge the time spent inside the block to name."""
+        now = time.perf_counter_ns()
+        if self._stack:
+            parent = self._stack[-1]
+            self._charge(parent[0], now - parent[1])
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter_ns()
+            entry = self._stack.pop()
+            self._charge(entry[0], now - entry[1])
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON export (milliseconds)."""
+        accounted = sum(self.phases.values())
+        return {
+            "total_ms": round(self.total_ns / _NS_PER_MS, 3),
+            "phases": {name: round(ns / _NS_PER_MS, 3) for name, ns in sorted(self.phases.items())},
+            "other_ms": round(max(self.total_ns - accounted, 0) / _NS_PER_MS, 3),
+            "bytes_read": self.bytes_read,
+        }
+
+
+_current: ContextVar[Optional[PhaseTimer]] = ContextVar("provenance_phase_timer", default=None)
+
+
+@contextmanager
+def measure() -> Iterator[PhaseTimer]:
+    """Time a block (one check) and collect the phases recorded inside it."""
+    timer = PhaseTimer()
+    token = _current.set(timer)
+    started = time.perf_counter_ns()
+    try:
+        yield timer
+    finally:
+        timer.total_ns = time.perf_counter_ns() - started
+        _current.reset(token)
+
+
+def phase(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager charging its block to name in the current check, if any.
+
+    Args:
+        name: Phase name, e.g. "parse" or "subprocess:cosign".
+        attributes: Span attributes, used only while a trace is recorded.
+    """
+    timer = _current.get()
+    if tracing.active():
+        return _traced_phase(timer, name, attributes)
+    if timer is None:
+        return nullcontext()
+    return timer.phase(name)
+
+
+@contextmanager
+def _traced_phase(timer: Optional[PhaseTimer], name: str, attributes: Optional[Dict[str, Any]]) -> Iterator[None]:
+    external = name == "network" or name.startswith("subprocess:")
+    kind = tracing.SPAN_KIND_CLIENT if external else tracing.SPAN_KIND_INTERNAL
+    with timer.phase(name) if timer is not None else nullcontext(), tracing.span(name, attributes, kind):
+        yield
+
+
+def add_bytes(count: int):
+    """Record bytes read from disk by the current check."""
+    timer = _current.get()
+    if timer is not None:
+        timer.bytes_read += count
+    tracing.increment("io.bytes_read", count)
+
+
+def combine(timings: Iterable[Dict]) -> Dict:
+    """Sum per-check timings (as produced by PhaseTimer.to_dict) into run totals."""
+    total = {"total_ms": 0.0, "phases": {}, "other_ms": 0.0, "bytes_read": 0}
+    for timing in timings:
+        total["total_ms"] += timing["total_ms"]
+        total["other_ms"] += timing["other_ms"]
+        total["bytes_read"] += timing["bytes_read"]
+        for name, ms in timing["phases"].items():
+            total["phases"][name] = total["phases"].get(name, 0.0) + ms
+    total["total_ms"] = round(total["total_ms"], 3)
+    total["other_ms"] = round(total["other_ms"], 3)
+    total["phases"] = {name: round(ms, 3) for name, ms in sorted(total["phases"].items())}
+    return total
@@ -0,0 +1,208 @@
+"""
+Discovery and capability cache for the external verification tools.
+
+Checks used to find out whether cosign, gh or osv-scanner were installed by
+spawning them and catching ``FileNotFoundError``. The registry resolves each
+tool's path once per process, probes its version at most once per binary
+(cached on disk and invalidated when the binary's mtime or size changes) and
+lets checks fail instantly for missing tools without spawning anything.
+
+Directories listed in ``PROVENANCE_TOOL_DIR`` are searched before ``$PATH``,
+which lets benchmarks and tests substitute stand-ins (see
+``benchmarks/fake_tools``) without touching the user's environment.
+"""
+
+import functools
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cache import cache_dir, read_json, write_json
+
+KNOWN_TOOLS = ("cosign", "gh", "osv-scanner")
+
+TOOL_DIR_ENV = "PROVENANCE_TOOL_DIR"
+
+# Arguments that make each tool print its version
+VERSION_ARGS = {
+    "cosign": ["version"],
+    "gh": ["--version"],
+    "osv-scanner": ["--version"],
+}
+
+# Verification checks (verify --checks keys) that depend on each tool
+TOOL_CHECKS = {
+    "cosign": ["signature", "certificate"],
+    "gh": ["attestation", "sbom-attestation", "metadata"],
+    "osv-scanner": ["osv"],
+}
+
+INSTALL_COMMANDS = {
+    "cosign": {
+        "darwin": "brew install cosign",
+        "linux": "brew install cosign  # or: wget https://github.com/sigstore/cosign/releases/latest/download/cosign-linux-amd64",
+        "win32": "winget install Sigstore.Cosign",
+    },
+    "gh": {
+        "darwin": "brew install gh",
+        "linux": "brew install gh  # or: sudo apt install gh / sudo dnf install gh",
+        "win32": "winget install GitHub.cli",
+    },
+    "osv-scanner": {
+        "darwin": "brew install osv-scanner",
+        "linux": "brew install osv-scanner  # or: go install github.com/google/osv-scanner/cmd/osv-scanner@latest",
+        "win32": "go install github.com/google/osv-scanner/cmd/osv-scanner@latest",
+    },
+}
+
+_VERSION_RE = re.compile(r"v?(\d+\.\d+(?:\.\d+)?[0-9A-Za-z.+-]*)")
+
+
+@functools.lru_cache(maxsize=None)
+def install_command(tool: str) -> str:
+    """Get platform-specific installation command for a tool."""
+    commands = INSTALL_COMMANDS.get(tool, {})
+    return commands.get(sys.platform, commands.get("linux", f"See https://docs.{tool}.dev"))
+
+
+class ToolInfo:
+    """Resolved location and version of an external tool."""
+
+    def __init__(self, name: str, path: Optional[str] = None, version: Optional[str] = None):
+        self.name = name
+        self.path = path
+        self.version = version
+
+    @property
+    def available(self) -> bool:
+        return self.path is not None
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON export."""
+        return {
+            "tool": self.name,
+            "available": self.available,
+            "path": self.path,
+            "version": self.version,
+            "checks": TOOL_CHECKS.get(self.name, []),
+            "install": None if self.available else install_command(self.name),
+        }
+
+
+class ToolRegistry:
+    """Resolves external tools once and caches their versions on disk."""
+
+    def __init__(self, cache_file: Optional[Path] = None, search_path: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            cache_file: JSON file for version probes. Defaults to tools.json
+                in the cache directory.
+            search_path: PATH-style string to search instead of $PATH.
+                Defaults to $PROVENANCE_TOOL_DIR (if set) followed by $PATH.
+        """
+        self.cache_file = cache_file or cache_dir() / "tools.json"
+        self.search_path = search_path
+        self._tools: Dict[str, ToolInfo] = {}
+        self._lock = threading.Lock()
+
+    def _which(self, name: str) -> Optional[str]:
+        search_path = self.search_path
+        if search_path is None:
+            tool_dir = os.environ.get(TOOL_DIR_ENV)
+            if tool_dir:
+                search_path = os.pathsep.join([tool_dir, os.environ.get("PATH", os.defpath)])
+        return shutil.which(name, path=search_path)
+
+    def resolve(self, name: str) -> ToolInfo:
+        """Return the tool's location, looking it up only on first use."""
+        with self._lock:
+            info = self._tools.get(name)
+            if info is None:
+                path = self._which(name)
+                info = self._tools[name] = ToolInfo(name, path)
+            return info
+
+    def available(self, name: str) -> bool:
+        return self.resolve(name).available
+
+    def path(self, name: str) -> Optional[str]:
+        return self.resolve(name).path
+
+    @staticmethod
+    def _fingerprint(path: str) -> Optional[Dict]:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    def version(self, name: str) -> Optional[str]:
+        """
+        Return the tool's version, probing the binary only on a cache miss.
+
+        Cached entries are keyed by path and invalidated when the binary's
+        mtime or size changes (e.g. after an upgrade).
+        """
+        info = self.resolve(name)
+        if not info.available or info.version is not None:
+            return info.version
+
+        fingerprint = self._fingerprint(info.path)
+        cache = read_json(self.cache_file) or {}
+        entry = cache.get(info.path)
+        if entry and fingerprint and entry.get("fingerprint") == fingerprint:
+            info.version = entry.get("version")
+            return info.version
+
+        info.version = self._probe_version(info)
+        if fingerprint:
+            cache[info.path] = {"tool": name, "fingerprint": fingerprint, "version": info.version}
+            write_json(self.cache_file, cache)
+        return info.version
+
+    @staticmethod
+    def _probe_version(info: ToolInfo) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                [info.path, *VERSION_ARGS.get(info.name, ["--version"])],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+        output = f"{result.stdout}\n{result.stderr}"
+        for line in output.splitlines():
+            if "version" in line.lower():
+                match = _VERSION_RE.search(line)
+                if match:
+                    return match.group(1)
+        match = _VERSION_RE.search(output)
+        return match.group(1) if match else None
+
+    def capabilities(self) -> List[ToolInfo]:
+        """Resolve every known tool including its version (for verify --doctor)."""
+        for name in KNOWN_TOOLS:
+            self.version(name)
+        return [self.resolve(name) for name in KNOWN_TOOLS]
+
+
+_default_registry: Optional[ToolRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> ToolRegistry:
+    """Return the registry shared by every verification in this process."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ToolRegistry()
+        return _default_registry
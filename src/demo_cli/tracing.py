@@ -0,0 +1,199 @@
+"""
+Trace export of verification runs as OTLP-JSON spans (verify --trace DEST).
+
+Each ``verify_all`` run under an active :class:`Tracer` produces a root span
+for the artifact, a child span per check and grandchild spans for the phases
+recorded by :mod:`demo_cli.timing` (``subprocess:<tool>``, ``parse``,
+``hash``, ``network``). Spans carry attributes such as the check key and
+result, bytes read, and tool exit codes.
+
+The export is the OTLP/HTTP JSON encoding of an ``ExportTraceServiceRequest``
+and is produced with the standard library only:
+
+- a file path appends one request per line (the format of the OpenTelemetry
+  Collector's file exporter and ``otlpjsonfile`` receiver);
+- an ``http://`` URL is POSTed to a collector, e.g.
+  ``http://localhost:4318/v1/traces``.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SCOPE_NAME = "demo_cli.verify"
+EXPORT_TIMEOUT = 10
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """A finished or in-progress span."""
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], name: str, attributes: Dict[str, Any], kind: int):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes)
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    def set_status(self, ok: bool, message: str = ""):
+        """Mark the span as succeeded or failed."""
+        self.status = STATUS_OK if ok else STATUS_ERROR
+        self.status_message = "" if ok else message
+
+    def to_dict(self) -> Dict:
+        """Convert to the OTLP JSON span encoding."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_attribute(key, value) for key, value in self.attributes.items() if value is not None],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+def _attribute(key: str, value: Any) -> Dict:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}  # int64 is a string in OTLP JSON
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+_current_tracer: ContextVar[Optional["Tracer"]] = ContextVar("provenance_tracer", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("provenance_span", default=None)
+
+
+class Tracer:
+    """Collects the spans of one or more verification runs."""
+
+    def __init__(self, service_name: str = "provenance-demo", service_version: Optional[str] = None):
+        self.service_name = service_name
+        self.service_version = service_version
+        self.spans: List[Span] = []
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        """Make this tracer receive the spans started inside the block."""
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: int = SPAN_KIND_INTERNAL) -> Iterator[Span]:
+        """Record a span around the block, as a child of the current span."""
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        span = Span(trace_id, parent.span_id if parent else None, name, attributes or {}, kind)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_status(False, f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            self.spans.append(span)
+
+    def to_otlp(self) -> Dict:
+        """Build an OTLP ExportTraceServiceRequest for the recorded spans."""
+        resource = {"service.name": self.service_name, "service.version": self.service_version}
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [_attribute(key, value) for key, value in resource.items() if value is not None],
+                },
+                "scopeSpans": [{
+                    "scope": {"name": SCOPE_NAME},
+                    "spans": [span.to_dict() for span in sorted(self.spans, key=lambda s: s.start_ns)],
+                }],
+            }]
+        }
+
+    def export(self, destination: str):
+        """
+        Export the recorded spans and forget them.
+
+        Args:
+            destination: File to append to, or an http(s) URL of an OTLP/HTTP
+                collector endpoint.
+
+        Raises:
+            OSError: If the file cannot be written or the collector is unreachable.
+        """
+        if not self.spans:
+            return
+        payload = json.dumps(self.to_otlp(), separators=(",", ":"))
+        if destination.startswith(("http://", "https://")):
+            import urllib.request
+
+            request = urllib.request.Request(
+                destination,
+                data=payload.encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urllib.request.urlopen(request, timeout=EXPORT_TIMEOUT) as response:
+                response.read()
+        else:
+            path = Path(destination)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(payload + "\n")
+        self.spans = []
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None, kind: int = SPAN_KIND_INTERNAL):
+    """Context manager recording a span if a tracer is active (yields the Span or None)."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, attributes, kind)
+
+
+def active() -> bool:
+    """True if spans are being recorded in this context."""
+    return _current_tracer.get() is not None
+
+
+def annotate(attributes: Dict[str, Any]):
+    """Set attributes on the current span, if any."""
+    current = _current_span.get()
+    if current is not None and _current_tracer.get() is not None:
+        current.attributes.update(attributes)
+
+
+def increment(key: str, amount: int):
+    """Add to a numeric attribute of the current span, if any."""
+    current = _current_span.get()
+    if current is not None and _current_tracer.get() is not None:
+        current.attributes[key] = current.attributes.get(key, 0) + amount
@@ -12,7 +12,7 @@ the complete security toolchain:
 """
 
 import base64
-import hashlib
+import errno
 import io
 import json
 import os
@@ -20,7 +20,24 @@ import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .attestations import is_slsa_statement, load_attestation_statements, statement_subjects
+from .cache import StatCache, get_default_stat_cache
+from .cassettes import RECORD, REPLAY, Cassette
+from .checksums import DIGEST_HEX_LENGTHS, VERIFIED_ALGORITHMS, load_manifest
+from .digests import file_digest
+from .pyz import read_version as read_pyz_version
+from .reporters import Reporter, TeeReporter, get_reporter
+from .timing import add_bytes, combine as combine_timings, measure, phase
+from .tracing import Tracer, annotate, span
+from .github_api import GitHubAPIError, GitHubClient, get_default_client
+from .ratelimit import RateLimitScheduler, get_default_scheduler
+from .signed_manifest import (
+    BUNDLE_NAME, GITHUB_ACTIONS_ISSUER, MANIFEST_NAME, ManifestSignatureCache,
+    get_default_manifest_signatures, workflow_identity_regexp,
+)
+from .tools import ToolRegistry, get_default_registry, install_command
 
 # Fix Windows encoding for emoji/Unicode characters
 if sys.platform == "win32":
@@ -28,14 +45,23 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# rich is imported only by `verify --doctor` and the rich reporter, so the
+# services and non-interactive runs never import it.
+Console = Table = None
+RICH_AVAILABLE = None  # resolved by _rich_available()
+
+
+def _rich_available() -> bool:
+    """Import rich for formatted output, returning False if it is not installed."""
+    global RICH_AVAILABLE, Console, Table
+    if RICH_AVAILABLE is None:
+        try:
+            from rich.console import Console
+            from rich.table import Table
+            RICH_AVAILABLE = True
+        except ImportError:
+            RICH_AVAILABLE = False
+    return RICH_AVAILABLE
 
 
 class VerificationResult:
@@ -47,6 +73,7 @@ class VerificationResult:
         self.message = message
         self.details = details
         self.duration_ms = duration_ms
+        self.timings: Optional[Dict] = None  # per-phase breakdown, set by verify_all
 
     def to_dict(self) -> Dict:
         """Convert result to dictionary for JSON export."""
@@ -59,19 +86,63 @@ class VerificationResult:
             result["details"] = self.details
         if self.duration_ms is not None:
             result["duration_ms"] = round(self.duration_ms, 2)
+        if self.timings is not None:
+            result["timings"] = self.timings
         return result
 
 
 class Verifier:
     """Handles all verification operations for the CLI binary."""
 
-    def __init__(self, binary_path: Optional[Path] = None, verbose: bool = False):
+    def __init__(
+        self,
+        binary_path: Optional[Path] = None,
+        verbose: bool = False,
+        github_client: Optional[GitHubClient] = None,
+        scheduler: Optional[RateLimitScheduler] = None,
+        tools: Optional[ToolRegistry] = None,
+        cache: Optional[StatCache] = None,
+        quiet: bool = False,
+        rebuild_source: Optional[Path] = None,
+        reporter: Optional[Reporter] = None,
+        profile_dir: Optional[Path] = None,
+        tracer: Optional[Tracer] = None,
+        cassette: Optional[Cassette] = None,
+        manifest_signatures: Optional[ManifestSignatureCache] = None,
+    ):
         """
         Initialize verifier.
 
         Args:
             binary_path: Path to the binary to verify. If None, uses the running binary.
             verbose: Enable verbose output with timing information.
+            github_client: GitHub API client for release/attestation lookups.
+                If None, a shared client is built from GH_TOKEN/GITHUB_TOKEN;
+                without a token the gh CLI is used instead.
+            scheduler: Rate-limit scheduler for gh calls. Defaults to the
+                process-wide scheduler shared by all verifications.
+            tools: Registry used to locate cosign/gh/osv-scanner. Defaults to
+                the process-wide registry.
+            cache: Cache for digests and parsed evidence files. Defaults to
+                the process-wide cache, so repeated verifications in one
+                process (e.g. `provenance-demo serve`) only re-read changed files.
+            quiet: Suppress all console output (used by the verification service).
+                Ignored when a reporter is given.
+            rebuild_source: Git checkout to rebuild the binary from. When set,
+                the reproducible build check rebuilds the recorded commit and
+                compares digests instead of only checking the metadata.
+            reporter: Renders progress and results. Defaults to text output
+                on stdout, or no output at all when quiet.
+            profile_dir: Write cProfile stats and tracemalloc peaks for each
+                check to this directory (verify --profile).
+            tracer: Record a span per run, check and phase (verify --trace).
+            cassette: Record every external tool call to, or replay them
+                from, a cassette directory (verify --record/--replay). GitHub
+                lookups then go through gh unless a client is given, so they
+                are captured too.
+            manifest_signatures: Signed SHA256SUMS manifests already verified.
+                Defaults to the process-wide cache, so the artifacts of one
+                release share a single cosign verification.
         """
         if binary_path:
             self.binary_path = binary_path
@@ -79,13 +150,35 @@ class Verifier:
             # Try to find the .pyz file we're running from
             self.binary_path = self._find_running_binary()
 
-        self.console = Console() if RICH_AVAILABLE else None
+        if reporter is None:
+            reporter = Reporter() if quiet else get_reporter("text", verbose=verbose)
+        self.reporter = reporter
+        self.timestamp: Optional[str] = None
+        self.tracer = tracer
+        self.profiler = None
+        self.profile: Optional[Dict] = None
+        if profile_dir is not None:
+            from .profiling import CheckProfiler
+            self.profiler = CheckProfiler(profile_dir)
         self.results: List[VerificationResult] = []
         self.verbose = verbose
+        self.cache = cache if cache is not None else get_default_stat_cache()
+        self.rebuild_source = rebuild_source
 
         # GitHub repo info (will be replaced during setup)
         self.github_repo = os.getenv("GITHUB_REPOSITORY", "OWNER/REPO")
-        self.version = self._get_version()
+        self.cassette = cassette
+        if github_client is None and cassette is None:
+            github_client = get_default_client()
+        self.github_client = github_client
+        self.scheduler = scheduler if scheduler is not None else get_default_scheduler()
+        self.tools = tools if tools is not None else get_default_registry()
+        self.manifest_signatures = (
+            manifest_signatures if manifest_signatures is not None else get_default_manifest_signatures()
+        )
+        self._attestation_types: Optional[List[str]] = None
+        self._attestation_types_loaded = False
+        self._version: Optional[str] = None
 
         # Detect platform for installation guidance
         self.platform = sys.platform
@@ -93,28 +186,7 @@ class Verifier:
     @staticmethod
     def _get_install_command(tool: str) -> str:
         """Get platform-specific installation command for a tool."""
-        platform = sys.platform
-
-        install_commands = {
-            "cosign": {
-                "darwin": "brew install cosign",
-                "linux": "brew install cosign  # or: wget https://github.com/sigstore/cosign/releases/latest/download/cosign-linux-amd64",
-                "win32": "winget install Sigstore.Cosign",
-            },
-            "gh": {
-                "darwin": "brew install gh",
-                "linux": "brew install gh  # or: sudo apt install gh / sudo dnf install gh",
-                "win32": "winget install GitHub.cli",
-            },
-            "osv-scanner": {
-                "darwin": "brew install osv-scanner",
-                "linux": "brew install osv-scanner  # or: go install github.com/google/osv-scanner/cmd/osv-scanner@latest",
-                "win32": "go install github.com/google/osv-scanner/cmd/osv-scanner@latest",
-            },
-        }
-
-        commands = install_commands.get(tool, {})
-        return commands.get(platform, commands.get("linux", f"See https://docs.{tool}.dev"))
+        return install_command(tool)
 
     def _find_running_binary(self) -> Optional[Path]:
         """Find the .pyz file we're running from."""
@@ -137,26 +209,30 @@ class Verifier:
 
         return None
 
+    @property
+    def version(self) -> str:
+        """Version of the binary being verified, determined on first use."""
+        if self._version is None:
+            self._version = self._get_version()
+        return self._version
+
+    @version.setter
+    def version(self, value: str):
+        self._version = value
+
     def _get_version(self) -> str:
         """
         Get the package version.
 
-        If verifying an external binary, extract version from that binary.
-        Otherwise, use the version of the running package.
+        If verifying an external binary, read the version embedded in that
+        binary. Otherwise, use the version of the running package.
         """
-        # If verifying an external .pyz file, extract its version
+        # Read a .pyz version from the archive itself; the binary is not
+        # trusted yet, so it is never executed
         if self.binary_path and self.binary_path.suffix == ".pyz" and self.binary_path.exists():
-            try:
-                result = subprocess.run(
-                    [str(self.binary_path), "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip()
-            except Exception:
-                pass  # Fall through to default version
+            version = read_pyz_version(self.binary_path)
+            if version:
+                return version
 
         # Use the version of the running package
         try:
@@ -165,41 +241,159 @@ class Verifier:
         except ImportError:
             return "unknown"
 
-    def _print_header(self, text: str):
-        """Print a section header."""
-        if self.console:
-            self.console.print(f"\n[bold cyan]{text}[/bold cyan]")
-        else:
-            print(f"\n{'='*60}")
-            print(text)
-            print('='*60)
-
-    def _print_result(self, result: VerificationResult):
-        """Print a verification result."""
-        if self.console:
-            status = "[green]✓[/green]" if result.passed else "[red]✗[/red]"
-            timing = f" [dim]({result.duration_ms:.0f}ms)[/dim]" if self.verbose and result.duration_ms else ""
-            self.console.print(f"{status} {result.name}: {result.message}{timing}")
-            if result.details:
-                self.console.print(f"  [dim]{result.details}[/dim]")
-        else:
-            status = "✓" if result.passed else "✗"
-            timing = f" ({result.duration_ms:.0f}ms)" if self.verbose and result.duration_ms else ""
-            print(f"{status} {result.name}: {result.message}{timing}")
-            if result.details:
-                print(f"  {result.details}")
+    def _run_tool(self, tool: str, args: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """
+        Run an external tool resolved through the tool registry.
+
+        Raises FileNotFoundError without spawning anything when the tool is
+        not installed, so checks report the missing tool instantly. With a
+        cassette, the call is recorded or served from disk.
+        """
+        cassette = self.cassette
+        if cassette is not None and cassette.replaying:
+            return cassette.replay(tool, args, timeout)
+
+        path = self.tools.path(tool)
+        if path is None:
+            if cassette is not None:
+                cassette.record(tool, args, error="missing")
+            raise FileNotFoundError(errno.ENOENT, f"{tool} not found on PATH", tool)
+
+        started = time.perf_counter()
+        with phase(f"subprocess:{tool}", {"process.executable.name": tool}):
+            try:
+                result = subprocess.run(
+                    [path, *args],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+            except subprocess.TimeoutExpired:
+                if cassette is not None:
+                    cassette.record(tool, args, duration_ms=(time.perf_counter() - started) * 1000, error="timeout")
+                raise
+            annotate({"process.exit_code": result.returncode})
+        if cassette is not None:
+            cassette.record(tool, args, result, (time.perf_counter() - started) * 1000)
+        return result
+
+    def _run_gh(
+        self, args: List[str], timeout: int, key: Optional[Tuple] = None, cache: bool = True
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a gh command through the shared rate-limit scheduler.
+
+        Calls with the same key are coalesced and successful results reused,
+        so verifying many artifacts of one release costs one lookup per tag.
+        Once GitHub reports the rate limit as exhausted, the last successful
+        result is served instead of waiting for the reset. With cache=False
+        the result is never reused by a later call.
+        """
+        replaying = self.cassette is not None and self.cassette.replaying
+        if not replaying and not self.tools.available("gh"):
+            if self.cassette is not None:
+                self.cassette.record("gh", args, error="missing")
+            raise FileNotFoundError(errno.ENOENT, "gh not found on PATH", "gh")
+
+        def run() -> subprocess.CompletedProcess:
+            result = self._run_tool("gh", args, timeout)
+            if result.returncode != 0 and "rate limit" in (result.stderr or "").lower():
+                self.scheduler.note_exhausted()
+            return result
+
+        result, _stale = self.scheduler.fetch(
+            key or ("gh", *args),
+            run,
+            cacheable=lambda r: cache and r.returncode == 0
+        )
+        return result
+
+    def _attestation_key(self, *extra: str) -> Tuple[Tuple, bool]:
+        """Scheduler key for an attestation lookup of the binary, and whether its result may be reused."""
+        digest = self._calculate_binary_sha256()
+        return ("attestation", self.github_repo, str(self.binary_path), digest, *extra), digest is not None
 
     def _calculate_binary_sha256(self) -> Optional[str]:
         """Return the SHA256 checksum for the current binary."""
         if not self.binary_path or not self.binary_path.exists():
             return None
 
-        sha256_hash = hashlib.sha256()
-        with open(self.binary_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        return file_digest(self.binary_path, "sha256", self.cache)
+
+    def _verify_signed_manifest(self) -> Optional[Tuple[bool, str, bool]]:
+        """
+        Check the binary against a signed SHA256SUMS next to it.
 
-        return sha256_hash.hexdigest()
+        The manifest signature is verified with cosign once per manifest,
+        bundle and expected signer (see :mod:`demo_cli.signed_manifest`); each
+        artifact then only needs its digest to match the manifest entry.
+
+        Returns:
+            None when no signed manifest covers the binary, otherwise a tuple
+            of (passed, details, signature served from cache).
+
+        Raises:
+            FileNotFoundError: cosign is not installed.
+            subprocess.TimeoutExpired: cosign timed out.
+        """
+        manifest = self.binary_path.parent / MANIFEST_NAME
+        bundle = self.binary_path.parent / BUNDLE_NAME
+        if not manifest.exists() or not bundle.exists():
+            return None
+
+        expected = load_manifest(manifest, self.cache).lookup(self.binary_path.name).get("sha256")
+        if expected is None:
+            return None
+        actual = self._calculate_binary_sha256()
+        if actual != expected.lower():
+            return (
+                False,
+                f"Binary does not match the signed {MANIFEST_NAME} manifest\n"
+                f"Expected: {expected}\nActual:   {actual}",
+                False,
+            )
+
+        identity = workflow_identity_regexp(self.github_repo)
+        key = (
+            file_digest(manifest, "sha256", self.cache),
+            file_digest(bundle, "sha256", self.cache),
+            identity,
+            GITHUB_ACTIONS_ISSUER,
+        )
+
+        def run() -> Tuple[bool, str]:
+            result = self._run_tool(
+                "cosign",
+                [
+                    "verify-blob",
+                    str(manifest),
+                    "--bundle", str(bundle),
+                    "--certificate-identity-regexp", identity,
+                    "--certificate-oidc-issuer", GITHUB_ACTIONS_ISSUER
+                ],
+                timeout=30
+            )
+            if result.returncode == 0:
+                return True, f"{MANIFEST_NAME} signed by a {self.github_repo} workflow (OIDC issuer: GitHub Actions)"
+            return False, (
+                f"Signed {MANIFEST_NAME} manifest failed verification\n"
+                + (result.stderr[:200] if result.stderr else "")
+            ).rstrip()
+
+        verified, details, cached = self.manifest_signatures.verify(key, run)
+        if verified:
+            details += f"\nChecksum: {actual[:16]}… (manifest: {MANIFEST_NAME})"
+        return verified, details, cached
+
+    def _load_json(self, path: Path):
+        """Load a JSON evidence file, reusing the parsed document while it is unchanged."""
+        def load(p: Path):
+            with open(p, encoding='utf-8') as f:
+                add_bytes(os.fstat(f.fileno()).st_size)
+                return json.load(f)
+
+        with phase("parse", {"file.path": str(path)}):
+            return self.cache.get_or_load(path, "json", load)
 
     def verify_checksum(self) -> VerificationResult:
         """Verify the binary's checksum matches the release."""
@@ -211,23 +405,17 @@ class Verifier:
                 f"Could not locate binary at {self.binary_path}"
             )
 
-        checksum = self._calculate_binary_sha256()
-        if not checksum:
-            return VerificationResult(
-                "Checksum Verification",
-                False,
-                "Unable to calculate binary checksum"
-            )
-
         # Try to find checksum manifest
         candidates = [
             self.binary_path.parent / "checksums.txt",
             self.binary_path.parent / f"{self.binary_path.name}.sha256",
             self.binary_path.with_suffix(self.binary_path.suffix + ".sha256"),
+            self.binary_path.parent / "SHA256SUMS",
+            self.binary_path.parent / "SHA512SUMS",
         ]
-        checksums_file = next((p for p in candidates if p.exists()), None)
+        existing = [p for p in candidates if p.exists()]
 
-        if not checksums_file:
+        if not existing:
             return VerificationResult(
                 "Checksum Verification",
                 False,
@@ -237,38 +425,45 @@ class Verifier:
                 f"   gh release download <tag> --repo {self.github_repo} --pattern 'checksums.txt'"
             )
 
-        expected_checksum = None
-        try:
-            for line in checksums_file.read_text().splitlines():
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-
-                parts = stripped.split()
-                if len(parts) == 1:
-                    # .sha256 files often contain only the checksum
-                    expected_checksum = parts[0]
-                    break
-
-                candidate_path = parts[-1].lstrip("*")
-                if Path(candidate_path).name == self.binary_path.name:
-                    expected_checksum = parts[0]
-                    break
-        except Exception as exc:
+        # Use the first manifest that lists the binary: checksums.txt may cover other artifacts only
+        checksums_file, listed, errors = None, None, []
+        for candidate in existing:
+            try:
+                entry = load_manifest(candidate, self.cache).lookup(self.binary_path.name)
+            except Exception as exc:
+                errors.append(f"{candidate.name}: {exc}")
+                continue
+            if entry:
+                checksums_file, listed = candidate, entry
+                break
+
+        if not listed:
+            if errors:
+                return VerificationResult(
+                    "Checksum Verification",
+                    False,
+                    "Failed to read checksum manifest",
+                    "; ".join(errors)[:200]
+                )
             return VerificationResult(
                 "Checksum Verification",
                 False,
-                "Failed to read checksum manifest",
-                str(exc)[:200]
+                "Binary missing from checksum manifest",
+                f"Manifest: {', '.join(str(p) for p in existing)}"
             )
 
-        if not expected_checksum:
+        # Security: Only SHA-2 digests of at least 256 bits are trusted; MD5/SHA-1 never are
+        algorithm = next((a for a in VERIFIED_ALGORITHMS if a in listed), None)
+        if algorithm is None:
             return VerificationResult(
                 "Checksum Verification",
                 False,
-                "Binary missing from checksum manifest",
-                f"Manifest: {checksums_file}"
+                "No SHA-256/384/512 checksum for binary in manifest",
+                f"Manifest lists only: {', '.join(sorted(a.upper() for a in listed))}\n"
+                f"💡 MD5 and SHA-1 are not accepted for release verification"
             )
+        expected_checksum = listed[algorithm]
+        label = algorithm.upper()
 
         # Security: Validate expected_checksum is a valid hex string
         if not all(c in '0123456789abcdefABCDEF' for c in expected_checksum):
@@ -279,20 +474,32 @@ class Verifier:
                 f"Checksum contains non-hex characters"
             )
 
-        # Security: Validate SHA256 checksum length (64 hex characters)
-        if len(expected_checksum) != 64:
+        # Security: Validate checksum length (64 hex characters for SHA256)
+        expected_length = DIGEST_HEX_LENGTHS[algorithm]
+        if len(expected_checksum) != expected_length:
             return VerificationResult(
                 "Checksum Verification",
                 False,
                 "Invalid checksum length in manifest",
-                f"Expected 64 characters, got {len(expected_checksum)}"
+                f"Expected {expected_length} characters, got {len(expected_checksum)}"
+            )
+
+        if algorithm == "sha256":
+            checksum = self._calculate_binary_sha256()
+        else:
+            checksum = file_digest(self.binary_path, algorithm, self.cache)
+        if not checksum:
+            return VerificationResult(
+                "Checksum Verification",
+                False,
+                "Unable to calculate binary checksum"
             )
 
         if checksum.lower() != expected_checksum.lower():
             return VerificationResult(
                 "Checksum Verification",
                 False,
-                "⚠️  SHA256 checksum mismatch - file may be corrupted or tampered",
+                f"⚠️  {label} checksum mismatch - file may be corrupted or tampered",
                 f"Calculated: {checksum[:16]}…\n"
                 f"Expected:   {expected_checksum[:16]}…\n"
                 f"💡 Possible causes:\n"
@@ -306,7 +513,7 @@ class Verifier:
         return VerificationResult(
             "Checksum Verification",
             True,
-            "SHA256 checksum matches release manifest",
+            f"{label} checksum matches release manifest",
             f"Checksum: {checksum[:16]}… (manifest: {checksums_file.name})"
         )
 
@@ -324,28 +531,40 @@ class Verifier:
         if not sig_bundle.exists():
             sig_bundle = self.binary_path.parent / f"{self.binary_path.name}.sigstore"
 
-        if not sig_bundle.exists():
-            return VerificationResult(
-                "Sigstore Signature",
-                False,
-                "No signature bundle found",
-                f"Expected at: {sig_bundle.name}\n"
-                f"💡 Download signature from GitHub release:\n"
-                f"   gh release download <tag> --repo {self.github_repo} --pattern '*.sigstore'"
-            )
-
         # Try to verify using cosign CLI (preferred for full verification)
         try:
-            result = subprocess.run(
+            # A signed SHA256SUMS covers every artifact it lists with one signature
+            signed = self._verify_signed_manifest()
+            if signed is not None:
+                passed, details, cached = signed
+                if not passed:
+                    return VerificationResult("Sigstore Signature", False, "Signed checksum manifest verification failed", details)
+                return VerificationResult(
+                    "Sigstore Signature",
+                    True,
+                    f"Signature verified via signed {MANIFEST_NAME} manifest" + (" (cached)" if cached else ""),
+                    details
+                )
+
+            if not sig_bundle.exists():
+                return VerificationResult(
+                    "Sigstore Signature",
+                    False,
+                    "No signature bundle found",
+                    f"Expected at: {sig_bundle.name}\n"
+                    f"💡 Download signature from GitHub release:\n"
+                    f"   gh release download <tag> --repo {self.github_repo} --pattern '*.sigstore'"
+                )
+
+            result = self._run_tool(
+                "cosign",
                 [
-                    "cosign", "verify-blob",
+                    "verify-blob",
                     str(self.binary_path),
                     "--bundle", str(sig_bundle),
                     "--certificate-identity-regexp", ".*",
                     "--certificate-oidc-issuer-regexp", ".*"
                 ],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
@@ -393,6 +612,43 @@ class Verifier:
                 str(e)[:200]
             )
 
+    def _lookup_attestation_types(self) -> Optional[List[str]]:
+        """
+        Return predicate types of the GitHub attestations recorded for the binary.
+
+        Uses the GitHub API client so a missing attestation is reported without
+        spawning gh. Returns None when the client is unavailable or the lookup
+        fails, in which case callers defer to gh.
+        """
+        if self._attestation_types_loaded:
+            return self._attestation_types
+        self._attestation_types_loaded = True
+
+        if self.github_client is None:
+            return None
+
+        checksum = self._calculate_binary_sha256()
+        if not checksum:
+            return None
+
+        try:
+            attestations = self.github_client.list_attestations(self.github_repo, checksum)
+        except (GitHubAPIError, OSError):
+            return None
+
+        predicate_types = []
+        for attestation in attestations:
+            try:
+                envelope = attestation["bundle"]["dsseEnvelope"]
+                statement = json.loads(base64.b64decode(envelope["payload"], validate=True))
+                predicate_types.append(str(statement.get("predicateType", "")))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                # Unknown bundle layout - let gh decide
+                return None
+
+        self._attestation_types = predicate_types
+        return predicate_types
+
     def verify_github_attestation(self) -> VerificationResult:
         """Verify GitHub attestation using gh CLI."""
         if not self.binary_path or not self.binary_path.exists():
@@ -402,16 +658,29 @@ class Verifier:
                 "Binary not found"
             )
 
+        # Fast path: no attestation recorded for this digest, so gh would fail too
+        attestation_types = self._lookup_attestation_types()
+        if attestation_types is not None and not attestation_types:
+            return VerificationResult(
+                "GitHub Attestation",
+                False,
+                "No attestation found for binary digest",
+                f"Repository: {self.github_repo}\n"
+                f"💡 Check the artifact was attested by the release workflow:\n"
+                f"   gh attestation verify {self.binary_path.name} --repo {self.github_repo}"
+            )
+
         try:
-            result = subprocess.run(
+            key, cacheable = self._attestation_key()
+            result = self._run_gh(
                 [
-                    "gh", "attestation", "verify",
+                    "attestation", "verify",
                     str(self.binary_path),
                     "--repo", self.github_repo
                 ],
-                capture_output=True,
-                text=True,
-                timeout=30
+                timeout=30,
+                key=key,
+                cache=cacheable
             )
 
             if result.returncode == 0:
@@ -468,17 +737,29 @@ class Verifier:
                 "Binary not found"
             )
 
+        attestation_types = self._lookup_attestation_types()
+        if attestation_types is not None and not any(
+            t.startswith("https://spdx.dev/Document") for t in attestation_types
+        ):
+            return VerificationResult(
+                "SBOM Attestation",
+                False,
+                "SBOM attestation not found or verification failed",
+                "This is expected for releases before SBOM attestation was added"
+            )
+
         try:
-            result = subprocess.run(
+            key, cacheable = self._attestation_key("https://spdx.dev/Document")
+            result = self._run_gh(
                 [
-                    "gh", "attestation", "verify",
+                    "attestation", "verify",
                     str(self.binary_path),
                     "--repo", self.github_repo,
                     "--predicate-type", "https://spdx.dev/Document"
                 ],
-                capture_output=True,
-                text=True,
-                timeout=30
+                timeout=30,
+                key=key,
+                cache=cacheable
             )
 
             if result.returncode == 0:
@@ -548,8 +829,7 @@ class Verifier:
                 continue
 
             try:
-                with open(sbom_file) as f:
-                    sbom = json.load(f)
+                sbom = self._load_json(sbom_file)
 
                 if format_name == "cyclonedx" and sbom.get("bomFormat") == "CycloneDX":
                     components = sbom.get("components", [])
@@ -599,24 +879,23 @@ class Verifier:
         scan_results_file = self.binary_path.parent / "osv-scan-results.json"
         if scan_results_file.exists():
             try:
-                with open(scan_results_file) as f:
-                    results = json.load(f)
-                    # OSV scanner results structure
-                    vulnerabilities = results.get("results", [{}])[0].get("packages", [])
-                    if not vulnerabilities:
-                        return VerificationResult(
-                            "OSV Vulnerability Scan",
-                            True,
-                            "No known vulnerabilities found",
-                            "Pre-scanned results from release"
-                        )
-                    else:
-                        return VerificationResult(
-                            "OSV Vulnerability Scan",
-                            False,
-                            f"Found vulnerabilities in {len(vulnerabilities)} package(s)",
-                            f"See osv-scan-report.txt for details"
-                        )
+                results = self._load_json(scan_results_file)
+                # OSV scanner results structure
+                vulnerabilities = results.get("results", [{}])[0].get("packages", [])
+                if not vulnerabilities:
+                    return VerificationResult(
+                        "OSV Vulnerability Scan",
+                        True,
+                        "No known vulnerabilities found",
+                        "Pre-scanned results from release"
+                    )
+                else:
+                    return VerificationResult(
+                        "OSV Vulnerability Scan",
+                        False,
+                        f"Found vulnerabilities in {len(vulnerabilities)} package(s)",
+                        f"See osv-scan-report.txt for details"
+                    )
             except Exception:
                 # Fall through to run scan ourselves
                 pass
@@ -637,10 +916,9 @@ class Verifier:
             )
 
         try:
-            result = subprocess.run(
-                ["osv-scanner", "--sbom", str(sbom_file), "--format", "json"],
-                capture_output=True,
-                text=True,
+            result = self._run_tool(
+                "osv-scanner",
+                ["--sbom", str(sbom_file), "--format", "json"],
                 timeout=60
             )
 
@@ -655,7 +933,8 @@ class Verifier:
             elif result.returncode == 1:
                 # Parse vulnerabilities if possible
                 try:
-                    output = json.loads(result.stdout)
+                    with phase("parse"):
+                        output = json.loads(result.stdout)
                     vuln_count = len(output.get("results", [{}])[0].get("packages", []))
                     return VerificationResult(
                         "OSV Vulnerability Scan",
@@ -707,114 +986,8 @@ class Verifier:
             )
 
     def _load_attestation_statements(self, attestation_file: Path) -> List[Dict]:
-        """Load attestation statements from a JSONL bundle with security hardening."""
-        # Security limits to prevent DoS
-        MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
-        MAX_STATEMENTS = 100
-        MAX_LINE_LENGTH = 1024 * 1024  # 1 MB per line
-        MAX_PAYLOAD_SIZE = 5 * 1024 * 1024  # 5 MB decoded payload
-
-        statements: List[Dict] = []
-
-        # Check file size before processing
-        file_size = attestation_file.stat().st_size
-        if file_size > MAX_FILE_SIZE:
-            print(f"⚠ Warning: Attestation file too large ({file_size} bytes), max {MAX_FILE_SIZE}")
-            return statements
-
-        with open(attestation_file, encoding='utf-8') as f:
-            line_num = 0
-            for line in f:
-                line_num += 1
-
-                # Security: Limit number of statements
-                if len(statements) >= MAX_STATEMENTS:
-                    print(f"⚠ Warning: Reached max statements limit ({MAX_STATEMENTS})")
-                    break
-
-                # Security: Limit line length
-                if len(line) > MAX_LINE_LENGTH:
-                    print(f"⚠ Warning: Line {line_num} exceeds max length, skipping")
-                    continue
-
-                if not line.strip():
-                    continue
-
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError as e:
-                    print(f"⚠ Warning: Invalid JSON on line {line_num}: {str(e)[:100]}")
-                    continue
-
-                # Validate record is a dict
-                if not isinstance(record, dict):
-                    print(f"⚠ Warning: Line {line_num} is not a JSON object, skipping")
-                    continue
-
-                # Handle DSSE envelopes (nested or top-level)
-                # Format 1: dsseEnvelope wrapper (gh attestation download format)
-                if "dsseEnvelope" in record:
-                    envelope = record["dsseEnvelope"]
-                    if isinstance(envelope, dict) and "payload" in envelope:
-                        try:
-                            # Security: Validate payload is string
-                            payload_str = envelope["payload"]
-                            if not isinstance(payload_str, str):
-                                print(f"⚠ Warning: Line {line_num} payload is not a string")
-                                continue
-
-                            # Security: Check decoded size
-                            if len(payload_str) > MAX_PAYLOAD_SIZE * 4 / 3:  # base64 overhead
-                                print(f"⚠ Warning: Line {line_num} payload too large")
-                                continue
-
-                            payload_bytes = base64.b64decode(payload_str, validate=True)
-
-                            # Security: Check decoded size
-                            if len(payload_bytes) > MAX_PAYLOAD_SIZE:
-                                print(f"⚠ Warning: Line {line_num} decoded payload too large")
-                                continue
-
-                            payload = json.loads(payload_bytes)
-
-                            # Validate payload structure
-                            if isinstance(payload, dict):
-                                statements.append(payload)
-                            continue
-                        except (ValueError, json.JSONDecodeError, Exception) as e:
-                            print(f"⚠ Warning: Line {line_num} dsseEnvelope decode failed: {str(e)[:100]}")
-                            continue
-
-                # Format 2: Direct payload/payloadType (older format)
-                if "payload" in record and "payloadType" in record:
-                    try:
-                        payload_str = record["payload"]
-                        if not isinstance(payload_str, str):
-                            continue
-
-                        if len(payload_str) > MAX_PAYLOAD_SIZE * 4 / 3:
-                            print(f"⚠ Warning: Line {line_num} direct payload too large")
-                            continue
-
-                        payload_bytes = base64.b64decode(payload_str, validate=True)
-
-                        if len(payload_bytes) > MAX_PAYLOAD_SIZE:
-                            continue
-
-                        payload = json.loads(payload_bytes)
-
-                        if isinstance(payload, dict):
-                            statements.append(payload)
-                        continue
-                    except (ValueError, json.JSONDecodeError, Exception) as e:
-                        print(f"⚠ Warning: Line {line_num} direct payload decode failed: {str(e)[:100]}")
-                        continue
-
-                # Format 3: Direct statement (no envelope)
-                if isinstance(record, dict):
-                    statements.append(record)
-
-        return statements
+        """Load attestation statements, reusing the parsed bundle while it is unchanged."""
+        return load_attestation_statements(attestation_file, self.cache)
 
     def verify_slsa_provenance(self) -> VerificationResult:
         """Verify SLSA provenance attestation."""
@@ -858,10 +1031,7 @@ class Verifier:
                     "Unable to calculate binary checksum"
                 )
 
-            slsa_statements = [
-                stmt for stmt in statements
-                if "predicateType" in stmt and "slsa" in stmt["predicateType"].lower()
-            ]
+            slsa_statements = [stmt for stmt in statements if is_slsa_statement(stmt)]
 
             if not slsa_statements:
                 return VerificationResult(
@@ -872,42 +1042,12 @@ class Verifier:
                 )
 
             for statement in slsa_statements:
-                subjects = statement.get("subject", [])
-
-                # Security: Validate subjects is a list
-                if not isinstance(subjects, list):
-                    continue
-
-                for subject in subjects:
-                    # Security: Validate subject is a dict
-                    if not isinstance(subject, dict):
-                        continue
-
-                    subject_name = subject.get("name", "")
-                    digest = subject.get("digest", {})
-
-                    # Security: Validate types
-                    if not isinstance(subject_name, str) or not isinstance(digest, dict):
-                        continue
-
-                    subject_checksum = (digest.get("sha256") or "").lower()
-
-                    # Security: Validate checksum format (hex string)
-                    if not all(c in '0123456789abcdef' for c in subject_checksum):
-                        continue
-
-                    # Security: Prevent path traversal - only compare filenames
-                    try:
-                        subject_filename = Path(subject_name).name
-                        # Additional check: ensure no path traversal characters
-                        if '..' in subject_name or '/' in subject_filename or '\\' in subject_filename:
-                            continue
-                    except (ValueError, OSError):
-                        continue
-
-                    if subject_filename != self.binary_path.name:
+                for subject_name, digests in statement_subjects(statement):
+                    # Only compare file names
+                    if subject_name.rsplit("/", 1)[-1] != self.binary_path.name:
                         continue
 
+                    subject_checksum = digests.get("sha256", "")
                     if subject_checksum != binary_checksum.lower():
                         return VerificationResult(
                             "SLSA Provenance",
@@ -988,13 +1128,13 @@ class Verifier:
 
         # Check build metadata file if it exists
         metadata_file = self.binary_path.parent / "build-metadata.json"
+        metadata = None
         if metadata_file.exists():
             try:
-                with open(metadata_file) as f:
-                    metadata = json.load(f)
-                    epoch = _extract_epoch_from_payload(metadata)
-                    if epoch:
-                        source_date_epoch = epoch
+                metadata = self._load_json(metadata_file)
+                epoch = _extract_epoch_from_payload(metadata)
+                if epoch:
+                    source_date_epoch = epoch
             except Exception:
                 pass
 
@@ -1014,6 +1154,9 @@ class Verifier:
                 f"Value: {source_date_epoch}"
             )
 
+        if self.rebuild_source is not None:
+            return self._verify_by_rebuild(metadata)
+
         return VerificationResult(
             "Reproducible Build",
             True,
@@ -1021,6 +1164,49 @@ class Verifier:
             f"SOURCE_DATE_EPOCH: {source_date_epoch}"
         )
 
+    def _verify_by_rebuild(self, metadata: Optional[Dict]) -> VerificationResult:
+        """Rebuild the binary from source at the recorded commit and compare digests."""
+        if not isinstance(metadata, dict):
+            return VerificationResult(
+                "Reproducible Build",
+                False,
+                "build-metadata.json not found",
+                "--rebuild needs the git_commit and SOURCE_DATE_EPOCH recorded at build time"
+            )
+
+        from .rebuild import RebuildError, rebuild_release
+
+        try:
+            rebuilt = rebuild_release(self.rebuild_source, metadata, self.binary_path)
+        except RebuildError as e:
+            return VerificationResult(
+                "Reproducible Build",
+                False,
+                "Could not rebuild from source",
+                f"{e}\n💡 Rebuild from a full clone: git clone https://github.com/{self.github_repo}"
+            )
+
+        expected = self._calculate_binary_sha256()
+        details = (
+            f"Commit: {rebuilt.commit[:12]} | SOURCE_DATE_EPOCH: {metadata.get('SOURCE_DATE_EPOCH')}"
+            f" | Rebuild: {'cached' if rebuilt.cached else 'fresh'}"
+        )
+        if rebuilt.sha256 == expected:
+            return VerificationResult(
+                "Reproducible Build",
+                True,
+                "Rebuilt from source: digests match",
+                f"{details}\nSHA256: {expected}"
+            )
+
+        return VerificationResult(
+            "Reproducible Build",
+            False,
+            "Rebuilt binary does not match the release",
+            f"{details}\nRelease: {expected}\nRebuilt: {rebuilt.sha256} ({rebuilt.output})\n"
+            f"💡 Find the first difference: provenance-demo diff-pyz {self.binary_path} {rebuilt.output}"
+        )
+
     def verify_certificate_identity(self) -> VerificationResult:
         """Verify Sigstore certificate identity and issuer."""
         if not self.binary_path or not self.binary_path.exists():
@@ -1031,28 +1217,41 @@ class Verifier:
             )
 
         sig_bundle = self.binary_path.with_suffix(self.binary_path.suffix + ".sigstore")
-        if not sig_bundle.exists():
-            return VerificationResult(
-                "Certificate Identity",
-                False,
-                "Signature bundle not found",
-                f"Expected: {self.binary_path.name}.sigstore\n"
-                f"💡 Download signature from GitHub release:\n"
-                f"   gh release download <tag> --repo {self.github_repo} --pattern '*.sigstore'"
-            )
 
         try:
+            # The signed SHA256SUMS is checked against the same identity and issuer
+            signed = self._verify_signed_manifest()
+            if signed is not None:
+                passed, details, cached = signed
+                if not passed:
+                    return VerificationResult("Certificate Identity", False, "Signed checksum manifest verification failed", details)
+                return VerificationResult(
+                    "Certificate Identity",
+                    True,
+                    f"Certificate identity verified via signed {MANIFEST_NAME} manifest" + (" (cached)" if cached else ""),
+                    f"OIDC issuer: GitHub Actions | Repo: {self.github_repo}"
+                )
+
+            if not sig_bundle.exists():
+                return VerificationResult(
+                    "Certificate Identity",
+                    False,
+                    "Signature bundle not found",
+                    f"Expected: {self.binary_path.name}.sigstore\n"
+                    f"💡 Download signature from GitHub release:\n"
+                    f"   gh release download <tag> --repo {self.github_repo} --pattern '*.sigstore'"
+                )
+
             # Use cosign to verify with specific identity requirements
-            result = subprocess.run(
+            result = self._run_tool(
+                "cosign",
                 [
-                    "cosign", "verify-blob",
+                    "verify-blob",
                     str(self.binary_path),
                     "--bundle", str(sig_bundle),
                     "--certificate-identity-regexp", f".*{self.github_repo}.*",
                     "--certificate-oidc-issuer", "https://token.actions.githubusercontent.com"
                 ],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
@@ -1188,8 +1387,7 @@ class Verifier:
                 continue
 
             try:
-                with open(sbom_file) as f:
-                    sbom = json.load(f)
+                sbom = self._load_json(sbom_file)
 
                 # Parse CycloneDX format
                 if sbom.get("bomFormat") == "CycloneDX":
@@ -1269,8 +1467,7 @@ class Verifier:
                 continue
 
             try:
-                with open(sbom_file) as f:
-                    sbom = json.load(f)
+                sbom = self._load_json(sbom_file)
 
                 if sbom.get("bomFormat") == "CycloneDX":
                     for component in sbom.get("components", []):
@@ -1353,8 +1550,7 @@ class Verifier:
             )
 
         try:
-            with open(sig_bundle) as f:
-                bundle_data = json.load(f)
+            bundle_data = self._load_json(sig_bundle)
 
             # Extract Rekor log entry details - handle both bundle formats
             # Format 1: verificationMaterial.tlogEntries (newer format)
@@ -1431,6 +1627,88 @@ class Verifier:
                 str(e)[:200]
             )
 
+    @staticmethod
+    def _release_from_api(release: Dict) -> Dict:
+        """Map a REST API release object onto the fields `gh release view --json` returns."""
+        return {
+            "tagName": release.get("tag_name") or "",
+            "name": release.get("name") or "",
+            "assets": [{"name": asset.get("name", "")} for asset in release.get("assets") or []],
+            "body": release.get("body") or "",
+        }
+
+    def _find_release_via_api(self) -> Optional[Dict]:
+        """Find the release containing the binary using the GitHub API client."""
+        # The release list already inlines assets, so one request replaces
+        # the per-tag `gh release view` calls.
+        for release in self.github_client.list_releases(self.github_repo, limit=20):
+            if any(asset.get("name") == self.binary_path.name for asset in release.get("assets") or []):
+                return self._release_from_api(release)
+
+        # If not found, fall back to latest release
+        try:
+            return self._release_from_api(self.github_client.get_release(self.github_repo))
+        except GitHubAPIError as exc:
+            if exc.status == 404:
+                return None
+            raise
+
+    def _find_release_via_gh(self) -> Optional[Dict]:
+        """Find the release containing the binary using the gh CLI."""
+        # Step 1: Get list of recent release tags
+        result = self._run_gh(
+            [
+                "release", "list",
+                "--repo", self.github_repo,
+                "--json", "tagName",
+                "--limit", "20"
+            ],
+            timeout=30,
+            key=("release-list", self.github_repo)
+        )
+
+        if result.returncode != 0:
+            raise GitHubAPIError(None, result.stderr.strip()[:200] or "gh release list failed")
+
+        releases = json.loads(result.stdout)
+
+        # Step 2: For each release, check if it contains our artifact
+        for release in releases:
+            tag = release.get("tagName", "")
+            if not tag:
+                continue
+
+            # Get full release details including assets
+            view_result = self._run_gh(
+                [
+                    "release", "view", tag,
+                    "--repo", self.github_repo,
+                    "--json", "tagName,name,assets,body"
+                ],
+                timeout=10,
+                key=("release-view", self.github_repo, tag)
+            )
+
+            if view_result.returncode == 0:
+                release_details = json.loads(view_result.stdout)
+                assets = release_details.get("assets", [])
+                if any(asset["name"] == self.binary_path.name for asset in assets):
+                    return release_details
+
+        # If not found, fall back to latest release
+        result = self._run_gh(
+            [
+                "release", "view",
+                "--repo", self.github_repo,
+                "--json", "tagName,name,assets,body"
+            ],
+            timeout=30,
+            key=("release-view", self.github_repo, None)
+        )
+        if result.returncode == 0:
+            return json.loads(result.stdout)
+        return None
+
     def verify_artifact_metadata(self) -> VerificationResult:
         """Verify GitHub release artifact metadata."""
         if not self.binary_path:
@@ -1442,73 +1720,30 @@ class Verifier:
 
         try:
             # Try to find the release containing this artifact
-            # Step 1: Get list of recent release tags
-            result = subprocess.run(
-                [
-                    "gh", "release", "list",
-                    "--repo", self.github_repo,
-                    "--json", "tagName",
-                    "--limit", "20"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode != 0:
+            try:
+                if self.github_client is not None:
+                    release_data = self._find_release_via_api()
+                else:
+                    release_data = self._find_release_via_gh()
+            except GitHubAPIError as e:
+                if self.github_client is not None:
+                    hints = (
+                        f"   • Check GH_TOKEN/GITHUB_TOKEN can read {self.github_repo}\n"
+                        f"   • Set PROVENANCE_GITHUB_API=0 to use the gh CLI instead"
+                    )
+                else:
+                    hints = (
+                        f"   • Check authentication: gh auth status\n"
+                        f"   • Re-authenticate: gh auth login\n"
+                        f"   • Check repository access: gh repo view {self.github_repo}"
+                    )
                 return VerificationResult(
                     "Artifact Metadata",
                     False,
                     "Could not fetch GitHub release list",
-                    f"💡 Troubleshooting:\n"
-                    f"   • Check authentication: gh auth status\n"
-                    f"   • Re-authenticate: gh auth login\n"
-                    f"   • Check repository access: gh repo view {self.github_repo}"
-                )
-
-            releases = json.loads(result.stdout)
-
-            # Step 2: For each release, check if it contains our artifact
-            release_data = None
-            for release in releases:
-                tag = release.get("tagName", "")
-                if not tag:
-                    continue
-
-                # Get full release details including assets
-                view_result = subprocess.run(
-                    [
-                        "gh", "release", "view", tag,
-                        "--repo", self.github_repo,
-                        "--json", "tagName,name,assets,body"
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
+                    f"{e}\n💡 Troubleshooting:\n{hints}"
                 )
 
-                if view_result.returncode == 0:
-                    release_details = json.loads(view_result.stdout)
-                    assets = release_details.get("assets", [])
-                    if any(asset["name"] == self.binary_path.name for asset in assets):
-                        release_data = release_details
-                        break
-
-            # If not found, fall back to latest release
-            if not release_data:
-                result = subprocess.run(
-                    [
-                        "gh", "release", "view",
-                        "--repo", self.github_repo,
-                        "--json", "tagName,name,assets,body"
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                if result.returncode == 0:
-                    release_data = json.loads(result.stdout)
-
             if not release_data:
                 return VerificationResult(
                     "Artifact Metadata",
@@ -1583,7 +1818,7 @@ class Verifier:
                 details
             )
 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, TimeoutError):
             return VerificationResult(
                 "Artifact Metadata",
                 False,
@@ -1603,24 +1838,23 @@ class Verifier:
                 str(e)[:200]
             )
 
-    def verify_all(self, selected_checks: Optional[List[str]] = None) -> bool:
+    def verify_all(
+        self,
+        selected_checks: Optional[List[str]] = None,
+        on_result: Optional[Callable[[VerificationResult], None]] = None,
+    ) -> bool:
         """
         Run all verification checks (or selected checks).
 
         Args:
             selected_checks: List of check names to run. If None, run all checks.
+            on_result: Called with each result as soon as its check finishes
+                (e.g. to act on early failures while later checks run).
 
         Returns:
             True if all checks passed, False otherwise.
         """
-        self._print_header(f"🔐 Verifying {self.binary_path.name if self.binary_path else 'binary'}")
-
-        if self.console:
-            self.console.print(f"[dim]Version: {self.version}[/dim]")
-            self.console.print(f"[dim]Repository: {self.github_repo}[/dim]")
-        else:
-            print(f"Version: {self.version}")
-            print(f"Repository: {self.github_repo}")
+        self.timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
         # Define all available checks with their keys
         all_checks = [
@@ -1641,91 +1875,177 @@ class Verifier:
         ]
 
         # Filter checks if selected_checks is provided
+        checks = all_checks
         if selected_checks:
             selected_keys = set(c.lower().strip() for c in selected_checks)
-            checks_to_run = [
+            checks = [
                 (key, name, func) for key, name, func in all_checks
                 if key in selected_keys or name.lower() in selected_keys
             ]
-            if len(checks_to_run) == 0:
-                if self.console:
-                    self.console.print(f"[red]No valid checks found in: {', '.join(selected_checks)}[/red]")
-                    self.console.print(f"[dim]Available checks: {', '.join([key for key, _, _ in all_checks])}[/dim]")
-                else:
-                    print(f"No valid checks found in: {', '.join(selected_checks)}")
-                    print(f"Available checks: {', '.join([key for key, _, _ in all_checks])}")
-                return False
-            checks = [(name, func) for _, name, func in checks_to_run]
-        else:
-            checks = [(name, func) for _, name, func in all_checks]
-
-        # Run checks with timing if verbose
-        if self.console:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-                transient=True
-            ) as progress:
-                for name, check_func in checks:
-                    task = progress.add_task(f"Checking {name}...", total=None)
-                    start_time = time.time()
-                    result = check_func()
-                    duration_ms = (time.time() - start_time) * 1000
-                    result.duration_ms = duration_ms
-                    self.results.append(result)
-                    progress.remove_task(task)
-                    self._print_result(result)
-        else:
-            for name, check_func in checks:
-                print(f"\nChecking {name}...")
-                start_time = time.time()
-                result = check_func()
-                duration_ms = (time.time() - start_time) * 1000
-                result.duration_ms = duration_ms
+
+        if not checks:
+            self.reporter.start(self, [])
+            self.reporter.invalid_checks(selected_checks, [key for key, _, _ in all_checks])
+            self.reporter.finish(self, False)
+            self.reporter.close()
+            return False
+
+        if self.tracer is None:
+            return self._run_checks(checks, on_result)
+
+        artifact = self.binary_path.name if self.binary_path else "binary"
+        with self.tracer.activate(), span(f"verify {artifact}", {
+            "verify.artifact": artifact,
+            "verify.version": self.version,
+            "verify.repository": self.github_repo,
+        }) as root:
+            all_passed = self._run_checks(checks, on_result)
+            root.attributes["verify.passed"] = all_passed
+            root.set_status(all_passed, "verification failed")
+        return all_passed
+
+    def _run_checks(
+        self,
+        checks: List[Tuple[str, str, Callable[[], VerificationResult]]],
+        on_result: Optional[Callable[[VerificationResult], None]],
+    ) -> bool:
+        """Run checks in order, reporting each result; returns True if all passed."""
+        reporter = self.reporter
+        try:
+            reporter.start(self, [(key, name) for key, name, _ in checks])
+            for key, name, check_func in checks:
+                reporter.check_started(key, name)
+                with measure() as timer, span(f"check {key}", {"verify.check.key": key}) as check_span:
+                    if self.profiler is None:
+                        result = check_func()
+                    else:
+                        with self.profiler.profile(key):
+                            result = check_func()
+                result.duration_ms = timer.total_ns / 1_000_000
+                result.timings = timer.to_dict()
+                if check_span is not None:
+                    check_span.attributes["verify.check.name"] = result.name
+                    check_span.attributes["verify.check.passed"] = result.passed
+                    check_span.set_status(result.passed, result.message)
                 self.results.append(result)
-                self._print_result(result)
-
-        # Summary
-        passed = sum(1 for r in self.results if r.passed)
-        total = len(self.results)
-        all_passed = passed == total
-
-        self._print_header("Summary")
-        if self.console:
-            status_color = "green" if all_passed else "red"
-            self.console.print(f"[{status_color}]{passed}/{total} checks passed[/{status_color}]")
-
-            if not all_passed:
-                self.console.print("\n[yellow]⚠ Some verifications failed or are skipped[/yellow]")
-                self.console.print("[dim]This may be expected if:[/dim]")
-                self.console.print("[dim]  • You're running a development build (not a release)[/dim]")
-                self.console.print("[dim]  • Security tools (cosign, gh, osv-scanner) are not installed[/dim]")
-                self.console.print("[dim]  • Attestation files are not present locally[/dim]")
-                self.console.print("\n[cyan]💡 For detailed troubleshooting:[/cyan]")
-                self.console.print(f"[dim]   • Review error messages above for specific guidance[/dim]")
-                self.console.print(f"[dim]   • See: docs/security/VERIFICATION-EXAMPLE.md[/dim]")
-                self.console.print(f"[dim]   • Download all release artifacts: gh release download <tag> --repo {self.github_repo}[/dim]")
-        else:
-            status = "✓" if all_passed else "✗"
-            print(f"{status} {passed}/{total} checks passed")
-
-            if not all_passed:
-                print("\n⚠ Some verifications failed or are skipped")
-                print("This may be expected if:")
-                print("  • You're running a development build (not a release)")
-                print("  • Security tools (cosign, gh, osv-scanner) are not installed")
-                print("  • Attestation files are not present locally")
-                print("\n💡 For detailed troubleshooting:")
-                print("   • Review error messages above for specific guidance")
-                print("   • See: docs/security/VERIFICATION-EXAMPLE.md")
-                print(f"   • Download all release artifacts: gh release download <tag> --repo {self.github_repo}")
+                reporter.check_finished(key, result)
+                if on_result:
+                    on_result(result)
+
+            all_passed = all(r.passed for r in self.results)
+            if self.profiler is not None:
+                self.profile = self.profiler.write_summary()
+            reporter.finish(self, all_passed)
+        finally:
+            reporter.close()
 
         return all_passed
 
+    def to_summary(self, success: bool) -> Dict:
+        """Build the report fields that describe the whole run (everything but the checks)."""
+        summary = {
+            "binary": str(self.binary_path) if self.binary_path else None,
+            "version": self.version,
+            "repository": self.github_repo,
+            "timestamp": self.timestamp or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "passed": success,
+            "summary": {
+                "total": len(self.results),
+                "passed": sum(1 for r in self.results if r.passed),
+                "failed": sum(1 for r in self.results if not r.passed),
+            },
+            "timings": combine_timings(r.timings for r in self.results if r.timings is not None),
+        }
+        if self.profile is not None:
+            summary["profile"] = self.profile
+        return summary
+
+    def to_report(self, success: bool) -> Dict:
+        """Build the JSON verification report for the results collected so far."""
+        report = self.to_summary(success)
+        report["checks"] = [r.to_dict() for r in self.results]
+        return report
+
+
+def doctor_command(args, tools: Optional[ToolRegistry] = None) -> int:
+    """Print the capability matrix of external tools (verify --doctor)."""
+    tools = tools or get_default_registry()
+    capabilities = tools.capabilities()
+
+    if getattr(args, 'json', False):
+        print(json.dumps({"tools": [info.to_dict() for info in capabilities]}, indent=2))
+        return 0
+
+    if _rich_available():
+        table = Table(title="🩺 Verification tool capabilities")
+        table.add_column("Tool", style="cyan")
+        table.add_column("Status")
+        table.add_column("Version")
+        table.add_column("Checks")
+        table.add_column("Path / install", style="dim")
+        for info in capabilities:
+            table.add_row(
+                info.name,
+                "[green]✓ available[/green]" if info.available else "[red]✗ missing[/red]",
+                info.version or "-",
+                ", ".join(info.to_dict()["checks"]),
+                info.path if info.available else install_command(info.name),
+            )
+        Console().print(table)
+    else:
+        print("Verification tool capabilities")
+        print("=" * 60)
+        for info in capabilities:
+            status = "✓ available" if info.available else "✗ missing"
+            print(f"{info.name:<12} {status:<12} {info.version or '-':<10} checks: {', '.join(info.to_dict()['checks'])}")
+            print(f"  {info.path if info.available else 'Install: ' + install_command(info.name)}")
+
+    return 0
+
+
+class _ReportWriteError(OSError):
+    """Writing the report failed (as opposed to I/O done by the checks)."""
+
+
+class _ReportStream:
+    """The report destination (the --output file, or stdout) for streaming reporters."""
+
+    def __init__(self, output: Optional[str]):
+        self._file = open(output, "w", encoding="utf-8") if output else None
+        self._stream = self._file or sys.stdout
+        self._name = output or "<stdout>"
+
+    def write(self, text: str) -> int:
+        try:
+            return self._stream.write(text)
+        except OSError as e:
+            raise _ReportWriteError(e.errno, e.strerror, self._name) from e
+
+    def flush(self):
+        try:
+            self._stream.flush()
+        except OSError as e:
+            raise _ReportWriteError(e.errno, e.strerror, self._name) from e
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                raise _ReportWriteError(e.errno, e.strerror, self._name) from e
+
 
 def verify_command(args) -> int:
     """Run the verify command."""
+    if getattr(args, 'doctor', False):
+        return doctor_command(args)
+
     binary_path = None
     if hasattr(args, 'file') and args.file:
         binary_path = Path(args.file)
@@ -1738,68 +2058,72 @@ def verify_command(args) -> int:
     # Determine verbose mode
     verbose = hasattr(args, 'verbose') and args.verbose
 
-    # Create verifier
-    verifier = Verifier(binary_path, verbose=verbose)
-
-    # JSON output mode
-    if hasattr(args, 'json') and args.json:
-        success = verifier.verify_all(selected_checks=selected_checks)
-
-        # Build JSON output
-        output = {
-            "binary": str(verifier.binary_path) if verifier.binary_path else None,
-            "version": verifier.version,
-            "repository": verifier.github_repo,
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "passed": success,
-            "summary": {
-                "total": len(verifier.results),
-                "passed": sum(1 for r in verifier.results if r.passed),
-                "failed": sum(1 for r in verifier.results if not r.passed),
-            },
-            "checks": [r.to_dict() for r in verifier.results]
-        }
-
-        json_str = json.dumps(output, indent=2)
-
-        # Output to file or stdout
-        if hasattr(args, 'output') and args.output:
-            try:
-                Path(args.output).write_text(json_str)
-                print(f"Verification report saved to: {args.output}", file=sys.stderr)
-            except Exception as e:
-                print(f"Error saving report: {e}", file=sys.stderr)
-                return 1
-        else:
-            print(json_str)
-
-        return 0 if success else 1
-
-    # Normal output mode
-    success = verifier.verify_all(selected_checks=selected_checks)
-
-    # Save report to file if requested
-    if hasattr(args, 'output') and args.output:
-        try:
-            output = {
-                "binary": str(verifier.binary_path) if verifier.binary_path else None,
-                "version": verifier.version,
-                "repository": verifier.github_repo,
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "passed": success,
-                "summary": {
-                    "total": len(verifier.results),
-                    "passed": sum(1 for r in verifier.results if r.passed),
-                    "failed": sum(1 for r in verifier.results if not r.passed),
-                },
-                "checks": [r.to_dict() for r in verifier.results]
-            }
-            Path(args.output).write_text(json.dumps(output, indent=2))
-            if verifier.console:
-                verifier.console.print(f"\n[dim]Verification report saved to: {args.output}[/dim]")
+    rebuild_source = Path(args.rebuild) if getattr(args, 'rebuild', None) else None
+    profile_dir = Path(args.profile) if getattr(args, 'profile', None) else None
+    trace_destination = getattr(args, 'trace', None)
+    tracer = None
+    if trace_destination:
+        from . import __version__
+        tracer = Tracer(service_version=__version__)
+
+    cassette = None
+    if getattr(args, 'record', None) or getattr(args, 'replay', None):
+        if args.replay and not Path(args.replay).is_dir():
+            print(f"Error: cassette directory not found: {args.replay}", file=sys.stderr)
+            return 1
+        cassette = Cassette(Path(args.record or args.replay), RECORD if args.record else REPLAY)
+
+    output = getattr(args, 'output', None)
+    output_format = getattr(args, 'format', None) or ("json" if getattr(args, 'json', False) else "text")
+
+    # The report is streamed to --output (or stdout) while the checks run.
+    # Text output goes to the terminal and --output receives the JSON report.
+    try:
+        report_stream = _ReportStream(output)
+    except OSError as e:
+        print(f"Error saving report: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        with report_stream as stream:
+            if output_format == "text":
+                reporter = get_reporter("text", verbose=verbose)
+                if output:
+                    reporter = TeeReporter(reporter, get_reporter("json", stream))
             else:
-                print(f"\nVerification report saved to: {args.output}")
-        except Exception as e:
-            print(f"Error saving report: {e}", file=sys.stderr)
+                reporter = get_reporter(output_format, stream, verbose=verbose)
+
+            verifier = Verifier(
+                binary_path,
+                verbose=verbose,
+                rebuild_source=rebuild_source,
+                reporter=reporter,
+                profile_dir=profile_dir,
+                tracer=tracer,
+                cassette=cassette,
+            )
+            success = verifier.verify_all(selected_checks=selected_checks)
+    except _ReportWriteError as e:
+        print(f"Error saving report: {e}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        # Profiles, cassettes and other files the run itself reads or writes
+        print(f"Error during verification: {e}", file=sys.stderr)
+        return 1
+
+    # Keep stdout for the report in machine-readable formats
+    notice_stream = sys.stdout if output_format == "text" else sys.stderr
+    if output:
+        print(f"\nVerification report saved to: {output}", file=notice_stream)
+    if tracer is not None:
+        try:
+            tracer.export(trace_destination)
+            print(f"\nTrace exported to: {trace_destination}", file=notice_stream)
+        except OSError as e:
+            print(f"⚠ Warning: could not export trace to {trace_destination}: {e}", file=sys.stderr)
+    if verifier.profile is not None:
+        print(f"\nProfiles saved to: {profile_dir} (heaviest functions by own time)", file=notice_stream)
+        for row in verifier.profile["heaviest_functions"][:5]:
+            print(f"  {row['tottime_ms']:>10.1f} ms  {row['function']}", file=notice_stream)
 
     return 0 if success else 1
@@ -1,6 +1,10 @@
 """Pytest configuration hooks for the provenance-template test suite."""
 import os
 
+import pytest
+
+PERF_ROWS = pytest.StashKey[list]()
+
 
 def _env_flag(name: str) -> bool:
     """Interpret common truthy strings from environment variables."""
@@ -8,7 +12,7 @@ def _env_flag(name: str) -> bool:
 
 
 def pytest_addoption(parser):
-    """Register CLI flags used by the published distribution tests."""
+    """Register CLI flags used by the published distribution and perf tests."""
     parser.addoption(
         "--release-tag",
         action="store",
@@ -28,3 +32,38 @@ def pytest_addoption(parser):
         default=os.getenv("GITHUB_REPO", "redoubt-cysec/provenance-template"),
         help="GitHub repository in OWNER/REPO format (defaults to this project).",
     )
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=_env_flag("PROVENANCE_RUN_PERF"),
+        help="Run the perf regression tests against benchmarks/baseline.json (or set PROVENANCE_RUN_PERF=1).",
+    )
+
+
+def pytest_configure(config):
+    config.stash[PERF_ROWS] = []
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip perf tests unless --run-perf is given."""
+    if config.getoption("--run-perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="perf tests need --run-perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture
+def perf_rows(request):
+    """Comparison rows collected by the perf tests for the end-of-run diff table."""
+    return request.config.stash[PERF_ROWS]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    rows = config.stash.get(PERF_ROWS, [])
+    if rows:
+        from benchmarks.perf import format_table
+
+        terminalreporter.section("performance vs baseline")
+        terminalreporter.write_line(format_table(rows))
@@ -3,6 +3,11 @@ End-to-End Attestation Verification Tests
 
 These tests verify that attestations can be downloaded and verified for actual releases.
 They require the GitHub CLI (gh) to be installed and authenticated.
+
+They are not replayed from cassettes: they inspect the live release (gh release
+list/view/download), and a cassette records a tool's output, not the artifacts
+it downloads. Offline coverage of the same verifier code paths is in
+tests/test_cassettes.py.
 """
 import os
 import subprocess
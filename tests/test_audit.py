@@ -0,0 +1,133 @@
+"""Tests for the release coverage audit (provenance-demo audit-release)."""
+import argparse
+import base64
+import json
+
+import pytest
+
+from demo_cli.attestations import AttestationLimitError, load_attestation_statements, statement_subjects
+from demo_cli.audit import audit_release, audit_release_command
+
+SLSA = "https://slsa.dev/provenance/v1"
+
+
+def _digest(char):
+    return char * 64
+
+
+def _release(tmp_path):
+    (tmp_path / "checksums.txt").write_text(
+        f"{_digest('a')}  app.pyz\n{_digest('b')}  dist/lib.whl\n{_digest('c')}  sbom.spdx.json\n",
+        encoding="utf-8",
+    )
+    provenance = {
+        "predicateType": SLSA,
+        "subject": [
+            {"name": "app.pyz", "digest": {"sha256": _digest("A")}},
+            {"name": "lib.whl", "digest": {"sha256": _digest("f")}},
+            {"name": "orphan.tar.gz", "digest": {"sha256": _digest("d")}},
+            {"name": "../escape.pyz", "digest": {"sha256": _digest("e")}},
+        ],
+    }
+    sbom = {"predicateType": "https://spdx.dev/Document", "subject": [{"name": "sbom.spdx.json", "digest": {"sha256": _digest("c")}}]}
+    envelope = {"dsseEnvelope": {"payload": base64.b64encode(json.dumps(provenance).encode()).decode()}}
+    (tmp_path / "attestation.jsonl").write_text(json.dumps(envelope) + "\n" + json.dumps(sbom) + "\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_audit_joins_manifest_with_slsa_subjects(tmp_path):
+    release = _release(tmp_path)
+
+    report = audit_release(release / "checksums.txt", release / "attestation.jsonl")
+
+    assert (report.statements, report.slsa_statements) == (2, 1)
+    assert report.covered == ["app.pyz"]
+    assert report.unattested == ["sbom.spdx.json"]
+    assert report.unlisted == ["orphan.tar.gz"]
+    assert report.mismatched == [
+        {"name": "dist/lib.whl", "manifest": {"sha256": _digest("b")}, "attested": {"sha256": [_digest("f")]}}
+    ]
+    assert not report.passed
+
+
+def test_entries_sharing_a_file_name_are_matched_by_path(tmp_path):
+    (tmp_path / "checksums.txt").write_text(
+        f"{_digest('1')}  linux/tool\n{_digest('2')}  darwin/tool\n{_digest('3')}  windows/tool.exe\n",
+        encoding="utf-8",
+    )
+    subjects = [
+        {"name": "linux/tool", "digest": {"sha256": _digest("1")}},
+        {"name": "./darwin/tool", "digest": {"sha256": _digest("9")}},
+        {"name": "tool.exe", "digest": {"sha256": _digest("3")}},
+        {"name": "tool", "digest": {"sha256": _digest("1")}},
+    ]
+    (tmp_path / "attestation.jsonl").write_text(json.dumps({"predicateType": SLSA, "subject": subjects}) + "\n")
+
+    report = audit_release(tmp_path / "checksums.txt", tmp_path / "attestation.jsonl")
+
+    assert report.covered == ["linux/tool", "windows/tool.exe"]
+    assert [entry["name"] for entry in report.mismatched] == ["darwin/tool"]
+    # A bare "tool" could be either platform's build, so it matches neither
+    assert report.unlisted == ["tool"]
+
+
+def test_subjects_with_path_traversal_are_skipped(tmp_path):
+    statements = load_attestation_statements(_release(tmp_path) / "attestation.jsonl")
+
+    names = [name for name, _ in statement_subjects(statements[0])]
+    assert names == ["app.pyz", "lib.whl", "orphan.tar.gz"]
+
+
+def test_large_release_is_covered(tmp_path):
+    lines, subjects = [], []
+    for i in range(5000):
+        digest = f"{i:064x}"
+        lines.append(f"{digest}  artifact-{i}.tar.gz")
+        subjects.append({"name": f"artifact-{i}.tar.gz", "digest": {"sha256": digest}})
+    (tmp_path / "SHA256SUMS").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (tmp_path / "attestation.jsonl").write_text(json.dumps({"predicateType": SLSA, "subject": subjects}) + "\n")
+
+    report = audit_release(tmp_path / "SHA256SUMS", tmp_path / "attestation.jsonl")
+
+    assert report.passed and len(report.covered) == 5000
+
+
+def test_audit_reads_past_the_verifier_statement_limit(tmp_path):
+    lines, statements = [], []
+    for i in range(150):
+        digest = f"{i:064x}"
+        lines.append(f"{digest}  artifact-{i}.tar.gz")
+        statement = {"predicateType": SLSA, "subject": [{"name": f"artifact-{i}.tar.gz", "digest": {"sha256": digest}}]}
+        statements.append(json.dumps(statement))
+    (tmp_path / "checksums.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (tmp_path / "attestation.jsonl").write_text("\n".join(statements) + "\n", encoding="utf-8")
+
+    report = audit_release(tmp_path / "checksums.txt", tmp_path / "attestation.jsonl")
+    assert report.passed and report.slsa_statements == 150
+
+
+def test_truncated_bundle_fails_the_audit(tmp_path, monkeypatch, capsys):
+    release = _release(tmp_path)
+    monkeypatch.setattr("demo_cli.audit.AUDIT_MAX_STATEMENTS", 1)
+
+    with pytest.raises(AttestationLimitError):
+        audit_release(release / "checksums.txt", release / "attestation.jsonl")
+    args = argparse.Namespace(directory=str(release), manifest=None, attestations=None, json=False)
+    assert audit_release_command(args) == 2
+    assert "max statements limit" in capsys.readouterr().err
+
+
+def test_audit_release_command(tmp_path, capsys):
+    release = _release(tmp_path)
+    args = {"directory": str(release), "manifest": None, "attestations": None, "json": False}
+
+    assert audit_release_command(argparse.Namespace(**args)) == 1
+    out = capsys.readouterr().out
+    assert "sbom.spdx.json: no provenance" in out and "orphan.tar.gz: attested but not in checksums.txt" in out
+    assert "dist/lib.whl: digest mismatch" in out
+
+    assert audit_release_command(argparse.Namespace(**{**args, "json": True})) == 1
+    assert json.loads(capsys.readouterr().out)["covered"] == 1
+
+    (release / "attestation.jsonl").unlink()
+    assert audit_release_command(argparse.Namespace(**args)) == 2
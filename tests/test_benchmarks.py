@@ -0,0 +1,63 @@
+"""Tests for the benchmark suite in benchmarks/."""
+import hashlib
+import json
+
+from benchmarks.generate import BINARY_NAME, generate_release, parse_size
+from benchmarks.perf import compare, format_table, regressions
+from benchmarks.run import check_methods, run_benchmarks, summarize
+
+
+def test_generated_release_is_deterministic_and_verifiable(tmp_path):
+    first = generate_release(tmp_path / "a", binary_size=3 * 1024 * 1024 + 17, subjects=50, components=20, manifest_lines=300)
+    second = generate_release(tmp_path / "b", binary_size=3 * 1024 * 1024 + 17, subjects=50, components=20, manifest_lines=300)
+
+    for name in ("checksums.txt", "attestation.jsonl", "sbom.spdx.json", "sbom.cyclonedx.json", BINARY_NAME):
+        assert (tmp_path / "a" / name).read_bytes() == (tmp_path / "b" / name).read_bytes()
+    binary = (tmp_path / "a" / BINARY_NAME).read_bytes()
+    assert len(binary) == first["binary_size"] and hashlib.sha256(binary).hexdigest() == second["sha256"]
+    assert len((tmp_path / "a" / "checksums.txt").read_text().splitlines()) == 300
+    assert len(json.loads((tmp_path / "a" / "sbom.spdx.json").read_text())["packages"]) == 20
+    assert len(json.loads((tmp_path / "a" / "sbom.cyclonedx.json").read_text())["components"]) == 20
+
+
+def test_benchmarks_report_time_and_memory(tmp_path):
+    generate_release(tmp_path, subjects=10, components=10, manifest_lines=10)
+
+    results = {row["name"]: row for row in run_benchmarks(tmp_path, repeat=2)}
+
+    assert set(results) == set(check_methods()) | {"verify_all"}
+    for name in ("verify_checksum", "verify_slsa_provenance", "verify_sbom", "verify_license_compliance"):
+        assert results[name]["passed"], results[name]["message"]
+    assert results["verify_checksum"]["peak_memory_bytes"] > 0
+    assert results["verify_all"]["runs"] == 2
+
+
+def test_summary_statistics():
+    assert parse_size("4G") == 4 * 1024 ** 3 and parse_size("512k") == 512 * 1024
+    summary = summarize([i * 1_000_000 for i in range(1, 101)])
+    assert (summary["median_ms"], summary["p95_ms"], summary["min_ms"]) == (50.5, 95.0, 1.0)
+
+
+def test_perf_compare_flags_regressions_beyond_tolerance():
+    baseline = {
+        "tolerance": {"median_ms": 0.5, "mb_per_s": 0.25},
+        "benchmarks": {
+            "hash_throughput": {"median_ms": 100.0, "mb_per_s": 800.0},
+            "sbom_parse": {"median_ms": 100.0, "tolerance": {"median_ms": 2.0}},
+        },
+    }
+    results = {
+        "hash_throughput": {"median_ms": 149.0, "mb_per_s": 600.0},
+        "sbom_parse": {"median_ms": 290.0, "p95_ms": 400.0},
+    }
+
+    rows = {(row["benchmark"], row["metric"]): row for row in compare(baseline, results)}
+    assert rows["hash_throughput", "median_ms"]["status"] == "ok"
+    assert rows["hash_throughput", "mb_per_s"]["status"] == "regressed"
+    assert rows["sbom_parse", "median_ms"]["status"] == "ok"
+    assert rows["sbom_parse", "p95_ms"]["status"] == "new"
+    tightened = regressions(compare(baseline, results, scale=0.5))
+    assert [(row["benchmark"], row["metric"]) for row in tightened] == [
+        ("hash_throughput", "median_ms"), ("hash_throughput", "mb_per_s"), ("sbom_parse", "median_ms")
+    ]
+    assert "regressed" in format_table(list(rows.values()))
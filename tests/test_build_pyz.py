@@ -0,0 +1,94 @@
+"""Tests for the deterministic zipapp builder (python -m demo_cli.build_pyz)."""
+import os
+import py_compile
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import demo_cli
+from demo_cli.build_pyz import build, compile_checked_pyc
+
+SRC_DIR = Path(demo_cli.__file__).resolve().parent.parent
+EPOCH = 1700000000
+
+
+@pytest.fixture
+def src_tree(tmp_path):
+    package = tmp_path / "src" / "demo_cli"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "cli.py").write_text("def main():\n    print('hello from pyz')\n")
+    (package / "data.txt").write_text("payload\n")
+    (package / "__pycache__").mkdir()
+    (package / "__pycache__" / "cli.cpython-311.pyc").write_bytes(b"stale")
+    return tmp_path / "src"
+
+
+def test_archive_layout(src_tree, tmp_path):
+    output = build(src_tree, tmp_path / "out" / "app.pyz", EPOCH).output
+
+    assert output.read_bytes().startswith(b"#!/usr/bin/env python3\n")
+    assert os.access(output, os.X_OK)
+    with zipfile.ZipFile(output) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == [
+            "__main__.py",
+            "demo_cli/__init__.py",
+            "demo_cli/__init__.pyc",
+            "demo_cli/cli.py",
+            "demo_cli/cli.pyc",
+            "demo_cli/data.txt",
+        ]
+        assert {info.date_time for info in zf.infolist()} == {(2023, 11, 14, 22, 13, 20)}
+
+    result = subprocess.run([sys.executable, str(output)], capture_output=True, text=True, timeout=30)
+    assert result.stdout.strip() == "hello from pyz"
+
+
+def test_output_is_deterministic(src_tree, tmp_path):
+    first = build(src_tree, tmp_path / "a" / "app.pyz", EPOCH, workers=1)
+    os.utime(src_tree / "demo_cli" / "cli.py", (1, 1))
+    second = build(src_tree, tmp_path / "b" / "app.pyz", EPOCH, workers=8)
+
+    assert first.sha256 == second.sha256
+    assert first.output.read_bytes() == second.output.read_bytes()
+    assert build(src_tree, tmp_path / "c" / "app.pyz", EPOCH + 3600).sha256 != first.sha256
+
+
+def test_pyc_matches_py_compile(tmp_path):
+    source = SRC_DIR / "demo_cli" / "digests.py"
+    cfile = tmp_path / "digests.pyc"
+    py_compile.compile(
+        str(source), cfile=str(cfile), dfile="demo_cli/digests.py", doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+
+    assert compile_checked_pyc(source.read_bytes(), "demo_cli/digests.py") == cfile.read_bytes()
+
+
+def test_unchanged_inputs_skip_rebuild(src_tree, tmp_path):
+    output = tmp_path / "out" / "app.pyz"
+    assert build(src_tree, output, EPOCH).rebuilt
+
+    assert not build(src_tree, output, EPOCH).rebuilt
+    assert build(src_tree, output, EPOCH, force=True).rebuilt
+
+    (src_tree / "demo_cli" / "cli.py").write_text("def main():\n    print('changed')\n")
+    assert build(src_tree, output, EPOCH).rebuilt
+
+    # A modified archive is rebuilt even though the stamp still matches the inputs
+    output.write_bytes(output.read_bytes() + b"tampered")
+    assert build(src_tree, output, EPOCH).rebuilt
+
+
+def test_repository_sources_build_a_working_cli(tmp_path):
+    output = build(SRC_DIR, tmp_path / "provenance-demo.pyz", EPOCH).output
+
+    result = subprocess.run(
+        [sys.executable, str(output), "hello", "pyz"], capture_output=True, text=True, timeout=30
+    )
+    assert result.returncode == 0
+    assert "Hello, pyz!" in result.stdout
@@ -0,0 +1,66 @@
+"""Tests for recording and replaying external tool calls (verify --record/--replay)."""
+import json
+
+import pytest
+
+from benchmarks.generate import BINARY_NAME, generate_release
+from benchmarks.run import FAKE_TOOLS
+from demo_cli.cache import StatCache
+from demo_cli.cassettes import RECORD, REPLAY, Cassette, CassetteMiss
+from demo_cli.ratelimit import RateLimitScheduler
+from demo_cli.reporters import Reporter
+from demo_cli.tools import ToolRegistry
+from demo_cli.verify import Verifier
+
+CHECKS = ["signature", "attestation", "osv", "metadata"]
+
+
+def _run(release, tmp_path, cassette, search_path):
+    verifier = Verifier(
+        release / BINARY_NAME,
+        cache=StatCache(),
+        scheduler=RateLimitScheduler(),
+        tools=ToolRegistry(cache_file=tmp_path / "tools.json", search_path=search_path),
+        reporter=Reporter(),
+        cassette=cassette,
+    )
+    verifier.version = "1.0.0"
+    verifier.verify_all(CHECKS)
+    return [(r.name, r.passed, r.message, r.details) for r in verifier.results]
+
+
+def test_replay_serves_recorded_calls_without_tools(tmp_path):
+    release = tmp_path / "release"
+    generate_release(release)
+    cassette_dir = tmp_path / "cassette"
+    empty = tmp_path / "empty"
+    empty.mkdir()
+
+    recorded = _run(release, tmp_path, Cassette(cassette_dir, RECORD), str(FAKE_TOOLS))
+    assert all(passed for _, passed, _, _ in recorded)
+    entries = [json.loads(path.read_text()) for path in cassette_dir.glob("*.json")]
+    cosign = next(entry for entry in entries if entry["argv"][0] == "cosign")
+    assert cosign["argv"][:3] == ["cosign", "verify-blob", f"file:{BINARY_NAME}"]
+    assert cosign["inputs"][BINARY_NAME] and cosign["exit_code"] == 0
+
+    # Copied elsewhere, with no tools on the search path
+    moved = tmp_path / "moved"
+    release.rename(moved)
+    assert _run(moved, tmp_path, Cassette(cassette_dir, REPLAY), str(empty)) == recorded
+
+
+def test_replay_misses_when_inputs_change_and_replays_missing_tools(tmp_path):
+    release = tmp_path / "release"
+    generate_release(release)
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    cassette_dir = tmp_path / "cassette"
+    _run(release, tmp_path, Cassette(cassette_dir, RECORD), str(empty))
+
+    replay = Cassette(cassette_dir, REPLAY)
+    with pytest.raises(FileNotFoundError):
+        replay.replay("osv-scanner", ["--sbom", str(release / "sbom.spdx.json"), "--format", "json"])
+
+    (release / "sbom.spdx.json").write_text("{}")
+    with pytest.raises(CassetteMiss):
+        replay.replay("osv-scanner", ["--sbom", str(release / "sbom.spdx.json"), "--format", "json"])
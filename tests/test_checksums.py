@@ -0,0 +1,229 @@
+"""Tests for checksum manifests (demo_cli.checksums)."""
+import argparse
+import hashlib
+import json
+
+import pytest
+
+from demo_cli.cache import DigestCache, StatCache
+from demo_cli.checksums import (
+    algorithm_hint, check_manifest, checksums_generate_command, generate_manifest, load_manifest, parse_manifest,
+    verify_manifest_command,
+)
+from demo_cli.reporters import Reporter
+from demo_cli.verify import Verifier
+
+SHA256 = "a" * 64
+SHA512 = "b" * 128
+
+
+def test_parses_gnu_bsd_and_single_value_formats():
+    manifest = parse_manifest(
+        "# generated\n"
+        f"{SHA256}  dist/app.pyz\n"
+        f"{SHA256} *app.tar.gz\n"
+        f"{SHA256}  name with spaces.txt\n"
+        f"\\{SHA256}  odd\\nname\n"
+        f"SHA256 (./app.whl) = {SHA256}\n"
+        f"SHA512 (./app.whl) = {SHA512}\n"
+    )
+
+    assert manifest.lookup("dist/app.pyz") == {"sha256": SHA256}
+    assert manifest.lookup("app.pyz") == {"sha256": SHA256}
+    assert manifest.lookup("app.tar.gz") == {"sha256": SHA256}
+    assert "name with spaces.txt" in manifest and "odd\nname" in manifest
+    assert manifest.lookup("app.whl") == {"sha256": SHA256, "sha512": SHA512}
+    assert manifest.lookup("missing.zip") == {}
+
+    single = parse_manifest(f"{SHA512}\n")
+    assert single.lookup("anything") == {"sha512": SHA512}
+    assert parse_manifest(f"{SHA512}  app.pyz\n", hint="sha512").lookup("app.pyz") == {"sha512": SHA512}
+
+
+def test_algorithm_hint_only_reads_suffixes_and_sums_names():
+    assert algorithm_hint("SHA512SUMS") == "sha512"
+    assert algorithm_hint("app.pyz.sha256") == "sha256"
+    assert algorithm_hint("tool-sha1-compat.pyz.sha256") == "sha256"
+    assert algorithm_hint("md5tool.sha512") == "sha512"
+    assert algorithm_hint("checksums-sha1.txt") is None
+    assert algorithm_hint("md5tool") is None
+
+
+def test_manifests_are_cached_by_content(tmp_path):
+    first, second = tmp_path / "a" / "SHA512SUMS", tmp_path / "b" / "SHA512SUMS"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_text(f"{SHA512}  app.pyz\n")
+
+    cache = StatCache()
+    manifest = load_manifest(first, cache)
+    assert load_manifest(first, cache) is manifest and cache.hits == 1
+    assert load_manifest(second) is manifest
+    assert manifest.lookup("app.pyz") == {"sha512": SHA512}
+
+
+def test_verify_checksum_uses_sha512sums(tmp_path):
+    content = b"release-binary"
+    binary = tmp_path / "app.pyz"
+    binary.write_bytes(content)
+    (tmp_path / "SHA512SUMS").write_text(f"{hashlib.sha512(content).hexdigest()} *app.pyz\n")
+
+    result = Verifier(binary, cache=StatCache(), reporter=Reporter()).verify_checksum()
+    assert result.passed and result.message == "SHA512 checksum matches release manifest"
+
+    (tmp_path / "checksums.txt").write_text(f"SHA256 (app.pyz) = {hashlib.sha256(b'other').hexdigest()}\n")
+    result = Verifier(binary, cache=StatCache(), reporter=Reporter()).verify_checksum()
+    assert not result.passed and "SHA256 checksum mismatch" in result.message
+
+
+def test_verify_checksum_skips_manifests_that_do_not_list_the_binary(tmp_path):
+    content = b"release-binary"
+    binary = tmp_path / "app.pyz"
+    binary.write_bytes(content)
+    (tmp_path / "checksums.txt").write_text(f"{hashlib.sha256(b'other').hexdigest()}  other.tar.gz\n")
+    (tmp_path / "SHA256SUMS").write_text(f"{hashlib.sha256(content).hexdigest()}  app.pyz\n")
+
+    result = Verifier(binary, cache=StatCache(), reporter=Reporter()).verify_checksum()
+    assert result.passed and "(manifest: SHA256SUMS)" in result.details
+
+    (tmp_path / "SHA256SUMS").unlink()
+    result = Verifier(binary, cache=StatCache(), reporter=Reporter()).verify_checksum()
+    assert not result.passed and result.message == "Binary missing from checksum manifest"
+
+
+def test_verify_checksum_rejects_md5_and_sha1(tmp_path):
+    content = b"release-binary"
+    binary = tmp_path / "app.pyz"
+    binary.write_bytes(content)
+    (tmp_path / "checksums.txt").write_text(
+        f"MD5 (app.pyz) = {hashlib.md5(content).hexdigest()}\n{hashlib.sha1(content).hexdigest()}  app.pyz\n"
+    )
+
+    result = Verifier(binary, cache=StatCache(), reporter=Reporter()).verify_checksum()
+    assert not result.passed
+    assert result.message == "No SHA-256/384/512 checksum for binary in manifest"
+    assert "MD5, SHA1" in result.details
+
+
+def _mirror(root, count=20):
+    lines = []
+    for index in range(count):
+        path = root / "files" / f"f{index:02d}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(bytes([index]) * (1000 + index))
+        data = path.read_bytes()
+        lines.append(f"SHA256 (files/{path.name}) = {hashlib.sha256(data).hexdigest()}")
+        lines.append(f"SHA512 (files/{path.name}) = {hashlib.sha512(data).hexdigest()}")
+    (root / "checksums.txt").write_text("\n".join(lines) + "\n")
+    (root / "checksums.txt.sigstore").write_text("{}")
+    return root / "checksums.txt"
+
+
+def test_check_manifest_reports_mismatched_missing_and_extra(tmp_path):
+    manifest = _mirror(tmp_path)
+    assert check_manifest(manifest, workers=4).to_dict()["ok"] == 20
+
+    (tmp_path / "files" / "f03.bin").write_bytes(b"tampered")
+    (tmp_path / "files" / "f07.bin").unlink()
+    (tmp_path / "files" / "stray.bin").write_bytes(b"")
+    progress = []
+    report = check_manifest(manifest, workers=4, on_progress=lambda *args: progress.append(args))
+
+    assert not report.passed
+    assert (report.ok, report.mismatched, report.missing) == (18, ["files/f03.bin"], ["files/f07.bin"])
+    assert report.extra == ["files/stray.bin"]
+    assert progress[-1][:2] == (20, 20) and report.bytes_hashed == progress[-1][2]
+
+    stopped = check_manifest(manifest, workers=1, stop_on_first_mismatch=True)
+    assert stopped.stopped_early and len(stopped.mismatched) + len(stopped.missing) == 1
+
+
+def test_check_manifest_never_reads_outside_root(tmp_path, capsys):
+    secret = b"outside the release"
+    (tmp_path / "secret.txt").write_bytes(secret)
+    release = tmp_path / "release"
+    release.mkdir()
+    (release / "app.pyz").write_bytes(b"app")
+    digest = hashlib.sha256(secret).hexdigest()
+    (release / "checksums.txt").write_text(
+        f"{hashlib.sha256(b'app').hexdigest()}  app.pyz\n{digest}  ../secret.txt\n{digest}  {tmp_path / 'secret.txt'}\n"
+    )
+
+    report = check_manifest(release / "checksums.txt")
+    assert not report.passed and report.ok == 1 and report.bytes_hashed == 3
+    assert report.outside == sorted(["../secret.txt", str(tmp_path / "secret.txt")])
+
+    args = dict(manifest=str(release / "checksums.txt"), root=None, jobs=1, stop_on_first_mismatch=False,
+                strict=False, json=False)
+    assert verify_manifest_command(argparse.Namespace(**args)) == 1
+    assert "../secret.txt: FAILED outside" in capsys.readouterr().out
+
+
+def test_single_value_manifest_is_a_usage_error(tmp_path, capsys):
+    (tmp_path / "app.pyz.sha256").write_text(hashlib.sha256(b"app").hexdigest() + "\n")
+
+    with pytest.raises(ValueError):
+        check_manifest(tmp_path / "app.pyz.sha256")
+    args = dict(manifest=str(tmp_path / "app.pyz.sha256"), root=None, jobs=1, stop_on_first_mismatch=False,
+                strict=False, json=False)
+    assert verify_manifest_command(argparse.Namespace(**args)) == 2
+    assert "lists no files" in capsys.readouterr().err
+
+
+def test_verify_manifest_command(tmp_path, capsys):
+    manifest = _mirror(tmp_path, count=3)
+    args = dict(manifest=str(manifest), root=None, jobs=2, stop_on_first_mismatch=False, strict=False, json=False)
+
+    assert verify_manifest_command(argparse.Namespace(**args)) == 0
+    assert "3 OK, 0 mismatched, 0 missing, 0 extra" in capsys.readouterr().out
+
+    (tmp_path / "notes.txt").write_text("unlisted")
+    assert verify_manifest_command(argparse.Namespace(**{**args, "strict": True, "json": True})) == 1
+    assert json.loads(capsys.readouterr().out)["extra"] == ["notes.txt"]
+    assert verify_manifest_command(argparse.Namespace(**{**args, "manifest": str(tmp_path / "nope.txt")})) == 2
+
+
+def test_generate_is_sorted_and_reuses_cached_digests(tmp_path):
+    dist = tmp_path / "dist"
+    for name in ("b.tar.gz", "a.whl", "sub/c.pyz", ".hidden"):
+        (dist / name).parent.mkdir(parents=True, exist_ok=True)
+        (dist / name).write_bytes(name.encode())
+
+    cache = DigestCache(tmp_path / "digests.sqlite")
+    first = generate_manifest(dist, ("sha256",), workers=2, cache=cache)
+    lines = first.text().splitlines()
+    assert [line.split("  ")[1] for line in lines] == ["a.whl", "b.tar.gz", "sub/c.pyz"]
+    assert lines[0] == f"{hashlib.sha256(b'a.whl').hexdigest()}  a.whl"
+    assert (first.hashed, first.cached) == (3, 0)
+
+    (dist / "d.bin").write_bytes(b"new")
+    second = generate_manifest(dist, ("sha256",), workers=2, cache=cache)
+    assert (second.hashed, second.cached) == (1, 3)
+    cache.close()
+
+    reopened = DigestCache(tmp_path / "digests.sqlite")
+    assert generate_manifest(dist, ("sha256",), cache=reopened).hashed == 0
+    reopened.close()
+
+    both = generate_manifest(dist, ("sha256", "sha512")).text()
+    assert both.splitlines()[:2] == [
+        f"SHA256 (a.whl) = {hashlib.sha256(b'a.whl').hexdigest()}",
+        f"SHA512 (a.whl) = {hashlib.sha512(b'a.whl').hexdigest()}",
+    ]
+    assert parse_manifest(both).lookup("c.pyz").keys() == {"sha256", "sha512"}
+
+
+def test_generated_manifest_verifies(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROVENANCE_CACHE_DIR", str(tmp_path / "cache"))
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "app.pyz").write_bytes(b"release-binary")
+    (dist / "app.whl").write_bytes(b"wheel")
+    args = argparse.Namespace(directory=str(dist), algo="sha256", output=str(dist / "checksums.txt"), jobs=None, no_cache=False)
+
+    assert checksums_generate_command(args) == 0
+    assert checksums_generate_command(args) == 0
+    assert "checksums.txt" not in (dist / "checksums.txt").read_text()
+    assert check_manifest(dist / "checksums.txt").passed
+    assert Verifier(dist / "app.pyz", cache=StatCache(), reporter=Reporter()).verify_checksum().passed
+    assert checksums_generate_command(argparse.Namespace(**{**vars(args), "algo": "crc32"})) == 2
@@ -75,3 +75,32 @@ def test_reproducible_build_reads_metadata(tmp_path):
 
     assert result.passed
     assert "1700000000" in result.details
+
+
+def test_ndjson_streams_each_check_then_summary(tmp_path, capsys):
+    from argparse import Namespace
+    from src.demo_cli.verify import verify_command
+
+    content = b"release-binary"
+    binary = _write_binary(tmp_path, content)
+    (tmp_path / "checksums.txt").write_text(f"{hashlib.sha256(content).hexdigest()}  {binary.name}\n")
+    (tmp_path / "build-metadata.json").write_text(json.dumps({"SOURCE_DATE_EPOCH": "1700000000"}))
+
+    args = Namespace(file=str(binary), checks="checksum,reproducible,sbom", format="ndjson", json=False, output=None)
+    status = verify_command(args)
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert status == 1
+    assert [line["type"] for line in lines] == ["check", "check", "check", "summary"]
+    assert [line["passed"] for line in lines[:3]] == [True, False, True]
+    assert lines[3]["summary"] == {"total": 3, "passed": 2, "failed": 1}
+    assert "checks" not in lines[3]
+
+
+def test_on_result_sees_results_as_they_finish(tmp_path):
+    verifier = Verifier(_write_binary(tmp_path), quiet=True)
+    seen = []
+
+    verifier.verify_all(["checksum", "sbom"], on_result=lambda result: seen.append(len(verifier.results)))
+
+    assert seen == [1, 2]
@@ -0,0 +1,97 @@
+"""Tests for provenance-demo diff-pyz."""
+import argparse
+import json
+import warnings
+import zipfile
+from pathlib import Path
+
+from demo_cli.pyz import diff_archives, diff_pyz_command
+
+
+def _archive(path: Path, members, shebang=b"#!/usr/bin/env python3\n", date_time=(2023, 11, 14, 22, 13, 20)):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.external_attr = 0o644 << 16
+            zf.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED)
+    path.write_bytes(shebang + path.read_bytes())
+    return path
+
+
+MEMBERS = [
+    ("__main__.py", b"from demo_cli.cli import main\nmain()\n"),
+    ("demo_cli/cli.py", b"".join(b"line %d\n" % i for i in range(100000))),
+    ("demo_cli/data.bin", bytes(range(256)) * 100),
+]
+
+
+def test_identical_archives(tmp_path):
+    a = _archive(tmp_path / "a.pyz", MEMBERS)
+    b = _archive(tmp_path / "b.pyz", MEMBERS)
+
+    assert diff_archives(a, b) == []
+
+
+def test_reports_first_content_divergence(tmp_path):
+    changed = MEMBERS[1][1].replace(b"line 54321\n", b"line 5432X\n")
+    a = _archive(tmp_path / "a.pyz", MEMBERS)
+    b = _archive(tmp_path / "b.pyz", [MEMBERS[0], ("demo_cli/cli.py", changed), MEMBERS[2]])
+
+    differences = diff_archives(a, b)
+
+    content = [d for d in differences if d.kind == "content"]
+    assert len(content) == 1 and content[0].name == "demo_cli/cli.py"
+    assert content[0].line == 54322
+    assert changed[content[0].offset] != MEMBERS[1][1][content[0].offset]
+    assert changed[:content[0].offset] == MEMBERS[1][1][:content[0].offset]
+
+
+def test_reports_metadata_prefix_and_membership(tmp_path):
+    a = _archive(tmp_path / "a.pyz", MEMBERS)
+    b = _archive(
+        tmp_path / "b.pyz", MEMBERS[:2] + [("demo_cli/extra.py", b"")],
+        shebang=b"#!/usr/bin/python3\n", date_time=(2024, 1, 1, 0, 0, 0),
+    )
+
+    kinds = {(d.kind, d.name) for d in diff_archives(a, b)}
+
+    assert ("prefix", None) in kinds
+    assert ("metadata", "__main__.py") in kinds
+    assert ("only-in-a", "demo_cli/data.bin") in kinds
+    assert ("only-in-b", "demo_cli/extra.py") in kinds
+    assert len(diff_archives(a, b, first_only=True)) == 1
+
+
+def test_reports_duplicate_member_names(tmp_path, capsys):
+    x, y = MEMBERS[0], MEMBERS[2]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # zipfile warns about the duplicate name
+        a = _archive(tmp_path / "a.pyz", [x, y, y])
+    b = _archive(tmp_path / "b.pyz", [x, y])
+
+    differences = diff_archives(a, b)
+
+    assert ("duplicate", y[0]) == (differences[0].kind, differences[0].name)
+    assert "stored 2 times in a.pyz" in differences[0].message
+    assert any(d.kind == "order" and "(end)" in d.message for d in differences)
+    args = argparse.Namespace(a=str(a), b=str(b), first=True, json=False)
+    assert diff_pyz_command(args) == 1
+    assert "stored 2 times" in capsys.readouterr().out
+
+
+def test_command_exit_status_and_json(tmp_path, capsys):
+    a = _archive(tmp_path / "a.pyz", MEMBERS)
+    b = _archive(tmp_path / "b.pyz", MEMBERS[:2])
+
+    assert diff_pyz_command(argparse.Namespace(a=str(a), b=str(a), json=False, first=False)) == 0
+    capsys.readouterr()
+
+    assert diff_pyz_command(argparse.Namespace(a=str(a), b=str(b), json=True, first=False)) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert not report["identical"]
+    assert report["differences"][0] == {
+        "kind": "only-in-a", "member": "demo_cli/data.bin", "message": "only in a.pyz", "offset": None, "line": None,
+    }
+
+    missing = argparse.Namespace(a=str(a), b=str(tmp_path / "missing.pyz"), json=False, first=False)
+    assert diff_pyz_command(missing) == 2
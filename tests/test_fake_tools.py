@@ -0,0 +1,72 @@
+"""Tests for the fake cosign/gh/osv-scanner shims in benchmarks/fake_tools."""
+import json
+import subprocess
+import sys
+
+from benchmarks.generate import BINARY_NAME, generate_release
+from benchmarks.run import FAKE_TOOLS
+from demo_cli.cache import StatCache
+from demo_cli.reporters import Reporter
+from demo_cli.tools import ToolRegistry
+from demo_cli.verify import Verifier
+
+
+def _fake(tool, *args, env=None):
+    return subprocess.run(
+        [sys.executable, str(FAKE_TOOLS / tool), *args], capture_output=True, text=True, env=env
+    )
+
+
+def _verifier(release, tmp_path):
+    verifier = Verifier(
+        release / BINARY_NAME,
+        quiet=True,
+        cache=StatCache(),
+        tools=ToolRegistry(cache_file=tmp_path / "tools.json"),
+        reporter=Reporter(),
+    )
+    verifier.version = "1.0.0"
+    return verifier
+
+
+def test_tool_dir_env_resolves_fakes_and_checks_pass(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROVENANCE_TOOL_DIR", str(FAKE_TOOLS))
+    monkeypatch.setenv("PROVENANCE_GITHUB_API", "0")
+    registry = ToolRegistry(cache_file=tmp_path / "tools.json")
+    assert registry.path("cosign") == str(FAKE_TOOLS / "cosign")
+    assert registry.version("osv-scanner") == "1.9.1"
+
+    release = tmp_path / "release"
+    generate_release(release)
+    verifier = _verifier(release, tmp_path)
+    for check in (verifier.verify_sigstore_signature, verifier.verify_github_attestation, verifier.verify_osv_scan):
+        result = check()
+        assert result.passed, result.message
+
+
+def test_injected_failures_fail_the_check(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROVENANCE_TOOL_DIR", str(FAKE_TOOLS))
+    monkeypatch.setenv("PROVENANCE_FAKE_COSIGN_FAILURE_RATE", "1")
+    release = tmp_path / "release"
+    generate_release(release)
+    verifier = _verifier(release, tmp_path)
+
+    assert not verifier.verify_sigstore_signature().passed
+    assert verifier.verify_osv_scan().passed
+
+
+def test_latency_and_failures_are_seeded(tmp_path):
+    log = tmp_path / "calls.jsonl"
+    env = {"PROVENANCE_FAKE_LATENCY_MS": "5", "PROVENANCE_FAKE_JITTER_MS": "4",
+           "PROVENANCE_FAKE_FAILURE_RATE": "0.5", "PROVENANCE_FAKE_LOG": str(log)}
+    for seed in ("1", "1", "2"):
+        _fake("gh", "release", "list", env={**env, "PROVENANCE_FAKE_SEED": seed})
+    first, repeat, other = [json.loads(line) for line in log.read_text().splitlines()]
+    assert (first["delay_ms"], first["failed"]) == (repeat["delay_ms"], repeat["failed"])
+    assert first["delay_ms"] != other["delay_ms"]
+    assert 1 <= first["delay_ms"] <= 9
+
+    listed = _fake("gh", "release", "list", env={})
+    assert listed.returncode == 0 and json.loads(listed.stdout) == [{"tagName": "v1.0.0"}]
+    unknown = _fake("cosign", "attest", env={})
+    assert unknown.returncode == 1 and "unsupported arguments" in unknown.stderr
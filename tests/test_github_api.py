@@ -0,0 +1,151 @@
+"""Tests for the pooled GitHub API client against a local HTTP server."""
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from demo_cli.github_api import GitHubAPIError, GitHubClient
+from demo_cli.verify import Verifier
+
+REPO = "octo/demo"
+
+
+class _FakeGitHub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers), self.client_address[1]))
+
+        if self.path.startswith(f"/repos/{REPO}/releases?"):
+            status, body = 200, server.releases
+        elif self.path == f"/repos/{REPO}/releases/latest":
+            status, body = 200, server.releases[0]
+        elif self.path.startswith(f"/repos/{REPO}/attestations/"):
+            status, body = server.attestations
+        else:
+            status, body = 404, {"message": "Not Found"}
+
+        payload = json.dumps(body).encode()
+        etag = f'"{len(payload)}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def fake_github():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGitHub)
+    server.requests = []
+    server.releases = [
+        {"tag_name": "v1.0.0", "name": "v1.0.0", "body": "notes",
+         "assets": [{"name": "demo.bin"}, {"name": "sbom.spdx.json"}]},
+    ]
+    server.attestations = (404, {"message": "Not Found"})
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server) -> GitHubClient:
+    return GitHubClient(token="test-token", base_url=f"http://127.0.0.1:{server.server_port}")
+
+
+def test_requests_reuse_one_connection_and_send_token(fake_github):
+    client = _client(fake_github)
+
+    for _ in range(3):
+        assert client.list_releases(REPO)[0]["tag_name"] == "v1.0.0"
+
+    ports = {port for _, _, port in fake_github.requests}
+    assert len(ports) == 1
+    assert fake_github.requests[0][1]["Authorization"] == "Bearer test-token"
+
+
+def test_etag_revalidation_returns_cached_body(fake_github):
+    client = _client(fake_github)
+
+    first = client.get_release(REPO)
+    second = client.get_release(REPO)
+
+    assert first == second
+    assert "If-None-Match" not in fake_github.requests[0][1]
+    assert fake_github.requests[1][1]["If-None-Match"]
+
+
+def test_error_status_raises(fake_github):
+    client = _client(fake_github)
+
+    with pytest.raises(GitHubAPIError) as excinfo:
+        client.get_json("/repos/missing/repo")
+    assert excinfo.value.status == 404
+
+
+def test_from_env_requires_token(monkeypatch):
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    assert GitHubClient.from_env() is None
+
+    monkeypatch.setenv("GITHUB_TOKEN", "abc")
+    assert GitHubClient.from_env() is not None
+
+    monkeypatch.setenv("PROVENANCE_GITHUB_API", "0")
+    assert GitHubClient.from_env() is None
+
+
+def test_artifact_metadata_uses_api_client(fake_github, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("GITHUB_REPOSITORY", REPO)
+    binary = tmp_path / "demo.bin"
+    binary.write_bytes(b"binary")
+
+    verifier = Verifier(binary, github_client=_client(fake_github))
+    verifier.version = "1.0.0"
+    result = verifier.verify_artifact_metadata()
+
+    assert result.passed, result.details
+    assert "Tag: v1.0.0" in result.details
+    assert len(fake_github.requests) == 1
+
+
+def test_attestation_checks_fail_fast_without_attestations(fake_github, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("GITHUB_REPOSITORY", REPO)
+    binary = tmp_path / "demo.bin"
+    binary.write_bytes(b"binary")
+
+    verifier = Verifier(binary, github_client=_client(fake_github))
+
+    assert not verifier.verify_github_attestation().passed
+    assert not verifier.verify_sbom_attestation().passed
+    assert len(fake_github.requests) == 1
+
+
+def test_sbom_attestation_lookup_reads_predicate_type(fake_github, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("GITHUB_REPOSITORY", REPO)
+    statement = {"predicateType": "https://slsa.dev/provenance/v1"}
+    payload = base64.b64encode(json.dumps(statement).encode()).decode()
+    fake_github.attestations = (200, {"attestations": [{"bundle": {"dsseEnvelope": {"payload": payload}}}]})
+    binary = tmp_path / "demo.bin"
+    binary.write_bytes(b"binary")
+
+    verifier = Verifier(binary, github_client=_client(fake_github))
+
+    assert verifier._lookup_attestation_types() == ["https://slsa.dev/provenance/v1"]
+    assert not verifier.verify_sbom_attestation().passed
@@ -0,0 +1,262 @@
+"""Tests for the HTTP verification service (provenance-demo serve --http)."""
+import hashlib
+import http.client
+import json
+import threading
+import time
+
+import pytest
+
+from demo_cli.cache import StatCache
+from demo_cli.http_server import HTTPVerificationServer, PoolSaturated, WorkerPool, parse_address
+from demo_cli.server import VerificationService
+from demo_cli.tools import ToolRegistry
+
+
+@pytest.fixture
+def http_service(tmp_path):
+    service = VerificationService(
+        github_repo="octo/demo",
+        cache=StatCache(),
+        tools=ToolRegistry(tmp_path / "tools.json", search_path=str(tmp_path / "bin")),
+    )
+    server = HTTPVerificationServer(("127.0.0.1", 0), service, workers=2, max_queue=2)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _call(server, method, path, body=b"", headers=None):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, response.read()
+    finally:
+        conn.close()
+
+
+def _release(directory):
+    directory.mkdir(exist_ok=True)
+    binary = directory / "app.pyz"
+    binary.write_bytes(b"release-binary")
+    checksum = hashlib.sha256(b"release-binary").hexdigest()
+    (directory / "checksums.txt").write_text(f"{checksum}  app.pyz\n", encoding="utf-8")
+    return binary
+
+
+def test_verify_by_path(http_service, tmp_path):
+    binary = _release(tmp_path / "release")
+    body = json.dumps({"file": str(binary), "checks": ["checksum"]}).encode()
+
+    status, data = _call(http_service, "POST", "/verify", body, {"Content-Type": "application/json"})
+
+    assert status == 200
+    report = json.loads(data)["result"]
+    assert report["passed"] and report["checks"][0]["check"] == "Checksum Verification"
+
+
+def test_verify_upload_against_evidence_dir(http_service, tmp_path):
+    evidence = tmp_path / "release"
+    _release(evidence)
+
+    status, data = _call(
+        http_service, "POST", f"/verify?name=app.pyz&checks=checksum&evidence={evidence}",
+        b"release-binary", {"Content-Type": "application/octet-stream"},
+    )
+
+    assert status == 200
+    report = json.loads(data)["result"]
+    assert report["passed"] and report["binary"] == "app.pyz"
+
+    status, data = _call(
+        http_service, "POST", f"/verify?name=app.pyz&checks=checksum&evidence={evidence}",
+        b"tampered-binary", {"Content-Type": "application/octet-stream"},
+    )
+    assert status == 200 and not json.loads(data)["result"]["passed"]
+
+
+def test_coalescing_key_includes_artifact_name(http_service, tmp_path, monkeypatch):
+    evidence = tmp_path / "release"
+    binary = _release(evidence)
+    (evidence / "copy.pyz").write_bytes(binary.read_bytes())
+    keys = []
+    submit = http_service.pool.submit
+    monkeypatch.setattr(http_service.pool, "submit", lambda key, func, **kw: keys.append(key) or submit(key, func, **kw))
+
+    for name in ("app.pyz", "copy.pyz"):
+        _call(http_service, "POST", f"/verify?name={name}&checks=checksum&evidence={evidence}",
+              b"release-binary", {"Content-Type": "application/octet-stream"})
+        body = json.dumps({"file": str(evidence / name), "checks": ["checksum"]}).encode()
+        _call(http_service, "POST", "/verify", body, {"Content-Type": "application/json"})
+
+    assert len(set(keys)) == 4
+
+
+def test_bad_requests(http_service, tmp_path):
+    json_headers = {"Content-Type": "application/json"}
+    assert _call(http_service, "POST", "/verify", b'{"file": "relative"}', json_headers)[0] == 400
+    missing = json.dumps({"file": str(tmp_path / "missing.pyz")}).encode()
+    assert _call(http_service, "POST", "/verify", missing, json_headers)[0] == 404
+    assert _call(http_service, "POST", "/verify?name=../x", b"x")[0] == 400
+    assert _call(http_service, "GET", "/nope")[0] == 404
+
+
+def test_healthz_and_metrics(http_service, tmp_path):
+    binary = _release(tmp_path / "release")
+    body = json.dumps({"file": str(binary), "checks": ["checksum"]}).encode()
+    _call(http_service, "POST", "/verify", body, {"Content-Type": "application/json"})
+
+    status, data = _call(http_service, "GET", "/healthz")
+    assert status == 200 and json.loads(data)["workers"] == 2
+
+    status, data = _call(http_service, "GET", "/metrics")
+    text = data.decode()
+    assert status == 200
+    assert 'provenance_verifications_total{result="passed"} 1' in text
+    assert 'provenance_http_requests_total{path="/verify",code="200"} 1' in text
+
+
+def test_pool_coalesces_same_key():
+    pool = WorkerPool(workers=2, max_queue=0)
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(2)
+        return {"passed": True}
+
+    first, coalesced_first = pool.submit("digest", work)
+    second, coalesced_second = pool.submit("digest", work)
+    release.set()
+
+    assert first is second and (coalesced_first, coalesced_second) == (False, True)
+    assert first.result(2) == {"passed": True} and calls == [1]
+    pool.shutdown()
+
+
+def test_pool_rejects_when_queue_full():
+    pool = WorkerPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    pool.submit("a", lambda: release.wait(2))
+    pool.submit("b", lambda: release.wait(2))
+    with pytest.raises(PoolSaturated):
+        pool.submit("c", lambda: None)
+    assert pool.stats["rejected"] == 1 and pool.retry_after() >= 1
+
+    release.set()
+    deadline = time.monotonic() + 2
+    while pool.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_saturated_pool_rejects_upload_before_reading_body(http_service):
+    for _ in range(4):
+        http_service.pool.reserve()
+    try:
+        conn = http.client.HTTPConnection(*http_service.server_address[:2], timeout=10)
+        # Announce a large body but send none: the 429 must not wait for it
+        conn.putrequest("POST", "/verify?name=app.pyz")
+        conn.putheader("Content-Type", "application/octet-stream")
+        conn.putheader("Content-Length", str(100 * 1024 * 1024))
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 429 and response.getheader("Retry-After")
+        conn.close()
+    finally:
+        for _ in range(4):
+            http_service.pool.release()
+    assert http_service.pool.reserved == 0
+
+
+def test_saturated_pool_rejects_path_request_before_hashing(http_service, tmp_path, monkeypatch):
+    binary = _release(tmp_path / "release")
+    hashed = []
+    monkeypatch.setattr("demo_cli.http_server.file_digest", lambda path, **kw: hashed.append(path))
+    for _ in range(4):
+        http_service.pool.reserve()
+    try:
+        body = json.dumps({"file": str(binary)}).encode()
+        status, _ = _call(http_service, "POST", "/verify", body, {"Content-Type": "application/json"})
+    finally:
+        for _ in range(4):
+            http_service.pool.release()
+    assert status == 429 and hashed == []
+    assert http_service.pool.reserved == 0
+
+
+def _slow_upload(server, pause, chunks):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    conn.putrequest("POST", "/verify?name=app.pyz")
+    conn.putheader("Content-Type", "application/octet-stream")
+    conn.putheader("Content-Length", str(1024))
+    conn.endheaders()
+    try:
+        for _ in range(chunks):
+            conn.send(b"x")
+            time.sleep(pause)
+    except OSError:
+        pass
+    try:
+        return conn.getresponse().status
+    finally:
+        conn.close()
+
+
+def test_slow_uploads_time_out_and_release_their_slot():
+    service = VerificationService(github_repo="octo/demo", cache=StatCache())
+    server = HTTPVerificationServer(
+        ("127.0.0.1", 0), service, workers=1, max_queue=0, request_timeout=0.2, upload_timeout=0.5
+    )
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        # A client that stops sending, and one that keeps trickling bytes
+        assert _slow_upload(server, pause=0, chunks=1) == 408
+        assert _slow_upload(server, pause=0.1, chunks=10) == 408
+        deadline = time.monotonic() + 2
+        while server.pool.reserved and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server.pool.reserved == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_path_requests_need_loopback_or_opt_in(tmp_path):
+    binary = _release(tmp_path / "release")
+    service = VerificationService(github_repo="octo/demo", cache=StatCache())
+    server = HTTPVerificationServer(("127.0.0.1", 0), service, allow_paths=False)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        body = json.dumps({"file": str(binary), "checks": ["checksum"]}).encode()
+        status, data = _call(server, "POST", "/verify", body, {"Content-Type": "application/json"})
+        assert status == 403 and "--allow-paths" in json.loads(data)["error"]
+
+        # An evidence directory is a server-side path too
+        upload = {"Content-Type": "application/octet-stream"}
+        status, data = _call(server, "POST", "/verify?name=app.pyz&evidence=/etc", b"release-binary", upload)
+        assert status == 403 and "--allow-paths" in json.loads(data)["error"]
+        status, _ = _call(server, "POST", "/verify?name=app.pyz&evidence=/nonexistent", b"release-binary", upload)
+        assert status == 403
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    wildcard = HTTPVerificationServer(("0.0.0.0", 0), service)
+    assert not wildcard.allow_paths
+    wildcard.server_close()
+
+
+def test_parse_address():
+    assert parse_address("0.0.0.0:8080") == ("0.0.0.0", 8080)
+    assert parse_address(":9000") == ("127.0.0.1", 9000)
+    with pytest.raises(ValueError):
+        parse_address("localhost")
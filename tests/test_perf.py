@@ -0,0 +1,34 @@
+"""
+Performance regression tests (opt-in: pytest --run-perf).
+
+Runs benchmarks.perf against a synthetic release and fails when hashing
+throughput, SBOM parsing, attestation indexing or CLI start-up is slower than
+benchmarks/baseline.json by more than the tolerance. The diff table is printed
+at the end of the run. Re-record the baseline with
+``python -m benchmarks.perf --update-baseline``; scale tolerances with
+PROVENANCE_PERF_TOLERANCE_SCALE on slow machines.
+"""
+import pytest
+
+from benchmarks.generate import generate_release
+from benchmarks.perf import (
+    BENCHMARKS, PERF_RELEASE, compare, format_table, load_baseline, regressions, run_perf, tolerance_scale,
+)
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture(scope="module")
+def perf_results(tmp_path_factory):
+    release = tmp_path_factory.mktemp("perf-release")
+    generate_release(release, **PERF_RELEASE)
+    return run_perf(release)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_no_regression_against_baseline(name, perf_results, perf_rows):
+    rows = compare(load_baseline(), {name: perf_results[name]}, tolerance_scale())
+    perf_rows.extend(rows)
+
+    assert all(row["baseline"] is not None for row in rows), f"{name} has no baseline; run --update-baseline"
+    assert not regressions(rows), "\n" + format_table(rows)
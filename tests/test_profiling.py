@@ -0,0 +1,36 @@
+"""Tests for verify --profile."""
+import hashlib
+import json
+import pstats
+
+from demo_cli.cache import StatCache
+from demo_cli.verify import Verifier
+
+
+def test_profile_writes_pstats_and_memory_peaks(tmp_path):
+    content = b"x" * 4096
+    binary = tmp_path / "demo.pyz"
+    binary.write_bytes(content)
+    (tmp_path / "checksums.txt").write_text(f"{hashlib.sha256(content).hexdigest()}  {binary.name}\n")
+    profile_dir = tmp_path / "profile"
+
+    verifier = Verifier(binary, quiet=True, cache=StatCache(), profile_dir=profile_dir)
+    verifier.version = "1.0.0"
+    verifier.verify_all(["checksum", "sbom"])
+    report = verifier.to_report(True)
+
+    profile = report["profile"]
+    assert set(profile["checks"]) == {"checksum", "sbom"}
+    checksum = profile["checks"]["checksum"]
+    assert pstats.Stats(checksum["pstats"]).total_calls > 0
+    assert checksum["peak_memory_bytes"] > 0
+    assert any("hash_file" in row["function"] for row in profile["heaviest_functions"])
+    assert (profile_dir / "run.pstats").exists()
+    assert json.loads((profile_dir / "profile.json").read_text()) == profile
+
+
+def test_no_profiler_by_default(tmp_path):
+    verifier = Verifier(tmp_path / "demo.pyz", quiet=True)
+
+    assert verifier.profiler is None
+    assert "profile" not in verifier.to_summary(True)
@@ -0,0 +1,66 @@
+"""Tests for read-only .pyz inspection."""
+import subprocess
+import zipfile
+from pathlib import Path
+
+from demo_cli.pyz import read_version
+from demo_cli.verify import Verifier
+
+VERSION_MODULE = """\
+# file generated by setuptools-scm
+# don't change, don't track in version control
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    VERSION_TUPLE = tuple
+__version__: str
+__version__ = version = '1.4.2'
+__version_tuple__ = version_tuple = (1, 4, 2)
+"""
+
+
+def _pyz(path: Path, members: dict) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("__main__.py", f"open({str(path.parent / 'executed')!r}, 'w').close()\n")
+        for name, content in members.items():
+            zf.writestr(name, content)
+    path.write_bytes(b"#!/usr/bin/env python3\n" + path.read_bytes())
+    path.chmod(0o755)
+    return path
+
+
+def test_reads_version_module_without_executing(tmp_path):
+    pyz = _pyz(tmp_path / "app.pyz", {"demo_cli/_version.py": VERSION_MODULE})
+
+    assert read_version(pyz) == "1.4.2"
+    assert not (tmp_path / "executed").exists()
+
+
+def test_falls_back_to_dist_info_metadata(tmp_path):
+    metadata = "Metadata-Version: 2.1\nName: provenance-demo\nVersion: 2.0.0rc1\n\nVersion: wrong\n"
+    pyz = _pyz(tmp_path / "app.pyz", {"provenance_demo-2.0.0rc1.dist-info/METADATA": metadata})
+
+    assert read_version(pyz) == "2.0.0rc1"
+
+
+def test_unreadable_archives_have_no_version(tmp_path):
+    not_zip = tmp_path / "app.pyz"
+    not_zip.write_bytes(b"not a zip")
+
+    assert read_version(not_zip) is None
+    assert read_version(_pyz(tmp_path / "empty.pyz", {})) is None
+    assert read_version(_pyz(tmp_path / "code.pyz", {"demo_cli/_version.py": "__version__ = compute()"})) is None
+
+
+def test_verifier_reads_version_lazily_without_subprocess(tmp_path, monkeypatch):
+    pyz = _pyz(tmp_path / "app.pyz", {"demo_cli/_version.py": VERSION_MODULE})
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("the target binary must not be executed")
+
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+    verifier = Verifier(pyz)
+
+    assert verifier._version is None
+    assert verifier.version == "1.4.2"
+    verifier.version = "9.9.9"
+    assert verifier.version == "9.9.9"
@@ -0,0 +1,133 @@
+"""Tests for the rate-limit-aware scheduler shared by GitHub-bound checks."""
+import subprocess
+import threading
+import time
+
+import pytest
+
+from demo_cli.ratelimit import RateLimitExhausted, RateLimitScheduler
+from demo_cli.tools import ToolRegistry
+from demo_cli.verify import Verifier
+
+
+def _exhaust(scheduler: RateLimitScheduler, reset_in: float = 3600):
+    scheduler.update_from_headers({
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    })
+
+
+def test_concurrent_lookups_for_same_key_are_coalesced():
+    scheduler = RateLimitScheduler()
+    calls = []
+    release = threading.Event()
+
+    def lookup():
+        calls.append(1)
+        release.wait(1)
+        return "v1.0.0"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(scheduler.fetch(("release-view", "v1"), lookup)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [("v1.0.0", False)] * 5
+
+
+def test_exhausted_budget_serves_cached_result_without_waiting():
+    scheduler = RateLimitScheduler(fresh_ttl=0)
+    scheduler.fetch("tag", lambda: "cached-release")
+    _exhaust(scheduler)
+
+    started = time.monotonic()
+    result, stale = scheduler.fetch("tag", lambda: pytest.fail("should not be called"))
+
+    assert (result, stale) == ("cached-release", True)
+    assert time.monotonic() - started < 1
+    assert scheduler.stats["served_stale"] == 1
+
+
+def test_exhausted_budget_without_cache_raises_immediately():
+    scheduler = RateLimitScheduler()
+    _exhaust(scheduler)
+
+    with pytest.raises(RateLimitExhausted):
+        scheduler.fetch("tag", lambda: "never")
+
+
+def test_token_bucket_paces_calls():
+    scheduler = RateLimitScheduler(rate=50, burst=1)
+
+    started = time.monotonic()
+    for _ in range(6):
+        scheduler.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_low_budget_spreads_calls_until_reset():
+    scheduler = RateLimitScheduler(rate=100, low_watermark=10)
+    scheduler.update_from_headers({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(int(time.time() + 50))})
+
+    assert scheduler._current_rate(time.time()) == pytest.approx(0.1, rel=0.1)
+
+
+def test_gh_failures_are_not_reused(tmp_path, monkeypatch):
+    binary = tmp_path / "demo.bin"
+    binary.write_bytes(b"binary")
+    gh = tmp_path / "gh"
+    gh.write_text("")
+    gh.chmod(0o755)
+    outputs = iter([
+        subprocess.CompletedProcess([], 1, "", "HTTP 403: API rate limit exceeded"),
+        subprocess.CompletedProcess([], 0, "ok", ""),
+    ])
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: next(outputs))
+
+    scheduler = RateLimitScheduler(max_wait=0)
+    tools = ToolRegistry(tmp_path / "tools.json", search_path=str(tmp_path))
+    verifier = Verifier(binary, scheduler=scheduler, tools=tools)
+
+    assert verifier._run_gh(["release", "view"], timeout=1, key="k").returncode == 1
+    # The rate-limit error marked the budget exhausted and nothing is cached
+    with pytest.raises(RateLimitExhausted):
+        verifier._run_gh(["release", "view"], timeout=1, key="k")
+
+
+def test_attestation_results_are_keyed_by_path_and_digest(tmp_path, monkeypatch):
+    gh = tmp_path / "gh"
+    gh.write_text("")
+    gh.chmod(0o755)
+    calls = []
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: calls.append(args) or
+                        subprocess.CompletedProcess(args, 0, "ok", ""))
+    monkeypatch.setenv("PROVENANCE_GITHUB_API", "0")
+    scheduler = RateLimitScheduler()
+    tools = ToolRegistry(tmp_path / "tools.json", search_path=str(tmp_path))
+
+    def verify(binary, digest_known=True):
+        verifier = Verifier(binary, scheduler=scheduler, tools=tools)
+        if not digest_known:
+            monkeypatch.setattr(verifier, "_calculate_binary_sha256", lambda: None)
+        return verifier.verify_github_attestation()
+
+    first, second = tmp_path / "a.pyz", tmp_path / "b.pyz"
+    for binary in (first, second):
+        binary.write_bytes(b"same bytes")
+        assert verify(binary).passed
+    assert verify(first).passed
+    assert len(calls) == 2
+
+    # Without a digest the result is never reused
+    verify(first, digest_known=False)
+    verify(first, digest_known=False)
+    assert len(calls) == 4
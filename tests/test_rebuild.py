@@ -0,0 +1,119 @@
+"""Tests for verify --rebuild (rebuild from source and compare digests)."""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import demo_cli
+from demo_cli.build_pyz import build
+from demo_cli.rebuild import VERSION_TEMPLATE, version_module
+from demo_cli.verify import Verifier
+
+SRC_DIR = Path(demo_cli.__file__).resolve().parent.parent
+EPOCH = 1700000000
+VERSION_MODULE = version_module("1.2.0")
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def release(tmp_path, monkeypatch):
+    """A git checkout and a release built from it, laid out like a GitHub release download."""
+    monkeypatch.setenv("PROVENANCE_CACHE_DIR", str(tmp_path / "cache"))
+
+    repo = tmp_path / "repo"
+    package = repo / "src" / "demo_cli"
+    package.mkdir(parents=True)
+    for source in (SRC_DIR / "demo_cli").glob("*.py"):
+        if source.name != "_version.py":
+            shutil.copy(source, package / source.name)
+    _git(repo, "init", "-q")
+    _git(repo, "add", "src")
+    _git(repo, "commit", "-q", "-m", "release")
+    commit = _git(repo, "rev-parse", "HEAD")
+
+    # Build the release the way scripts/build_pyz.sh does
+    build_tree = tmp_path / "build-src"
+    shutil.copytree(repo / "src", build_tree)
+    (build_tree / "demo_cli" / "_version.py").write_bytes(VERSION_MODULE)
+    release_dir = tmp_path / "release"
+    binary = build(build_tree, release_dir / "provenance-demo.pyz", EPOCH).output
+    (release_dir / "build-metadata.json").write_text(json.dumps({
+        "SOURCE_DATE_EPOCH": str(EPOCH),
+        "git_commit": commit,
+        "git_tag": "v1.2.0",
+    }))
+    return repo, binary
+
+
+def test_rebuild_matches_release_and_is_cached(release):
+    repo, binary = release
+
+    result = Verifier(binary, rebuild_source=repo).verify_reproducible_build()
+    assert result.passed, result.details
+    assert "digests match" in result.message and "fresh" in result.details
+
+    result = Verifier(binary, rebuild_source=repo).verify_reproducible_build()
+    assert result.passed and "cached" in result.details
+
+
+def test_rebuild_detects_modified_release(release):
+    repo, binary = release
+    _git(repo, "rm", "-q", "src/demo_cli/digests.py")
+    # The checkout moved on; the recorded commit is still what gets rebuilt
+    _git(repo, "commit", "-q", "-m", "later")
+    binary.write_bytes(binary.read_bytes().replace(b"#!/usr/bin/env python3", b"#!/usr/bin/python3    "))
+
+    result = Verifier(binary, rebuild_source=repo).verify_reproducible_build()
+    assert not result.passed
+    assert result.message == "Rebuilt binary does not match the release"
+
+
+def test_rebuild_reports_missing_commit(release, tmp_path):
+    _, binary = release
+    other = tmp_path / "other"
+    other.mkdir()
+    _git(other, "init", "-q")
+
+    result = Verifier(binary, rebuild_source=other).verify_reproducible_build()
+    assert not result.passed
+    assert "not found" in result.details
+
+
+def test_rebuild_rejects_modified_version_module(release, tmp_path):
+    repo, binary = release
+    build_tree = tmp_path / "tampered-src"
+    shutil.copytree(repo / "src", build_tree)
+    (build_tree / "demo_cli" / "_version.py").write_bytes(VERSION_MODULE + b"import os\n")
+    build(build_tree, binary, EPOCH)
+
+    result = Verifier(binary, rebuild_source=repo).verify_reproducible_build()
+    assert not result.passed
+    assert "not the file hatch-vcs generates for 1.2.0" in result.details
+
+
+def test_version_template_matches_pyproject():
+    pyproject = (SRC_DIR.parent / "pyproject.toml").read_text(encoding="utf-8")
+    assert f"template = \'\'\'{VERSION_TEMPLATE}\'\'\'" in pyproject
+
+
+def test_untagged_commits_get_the_setuptools_scm_version(release):
+    from demo_cli.rebuild import _commit_version
+
+    repo, _ = release
+    head = _git(repo, "rev-parse", "HEAD")
+    assert _commit_version(repo, head) == f"0.1.dev1+g{_git(repo, 'rev-parse', '--short', 'HEAD')}"
+
+    _git(repo, "tag", "v1.2.0")
+    assert _commit_version(repo, head) == "1.2.0"
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "next")
+    assert _commit_version(repo, "HEAD").startswith("1.2.1.dev1+g")
@@ -0,0 +1,97 @@
+"""Tests for the verify output reporters."""
+import argparse
+import hashlib
+import io
+import json
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from demo_cli.reporters import JSONReporter, PlainReporter, Reporter, get_reporter
+from demo_cli.verify import Verifier, verify_command
+
+
+@pytest.fixture
+def binary(tmp_path):
+    content = b"release-binary"
+    path = tmp_path / "demo.pyz"
+    path.write_bytes(content)
+    (tmp_path / "checksums.txt").write_text(f"{hashlib.sha256(content).hexdigest()}  {path.name}\n")
+    return path
+
+
+def _run(binary, output_format, checks=("checksum", "sbom")):
+    stream = io.StringIO()
+    verifier = Verifier(binary, reporter=get_reporter(output_format, stream))
+    verifier.version = "1.0.0"
+    success = verifier.verify_all(list(checks))
+    return verifier, success, stream.getvalue()
+
+
+def test_streamed_json_matches_report(binary):
+    verifier, success, output = _run(binary, "json")
+
+    assert json.loads(output) == verifier.to_report(success)
+
+
+def test_junit_has_one_testcase_per_check(binary):
+    _, _, output = _run(binary, "junit")
+
+    suite = ET.fromstring(output).find("testsuite")
+    cases = suite.findall("testcase")
+    assert [case.get("name") for case in cases] == ["checksum", "sbom"]
+    assert cases[0].find("failure") is None
+    assert cases[1].find("failure").get("message") == "No valid SBOM files found"
+
+
+def test_sarif_rules_and_results(binary):
+    _, _, output = _run(binary, "sarif")
+
+    run = json.loads(output)["runs"][0]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["checksum", "sbom"]
+    assert [(r["ruleId"], r["kind"], r["level"]) for r in run["results"]] == [
+        ("checksum", "pass", "none"),
+        ("sbom", "fail", "error"),
+    ]
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "junit", "sarif"])
+def test_documents_are_complete_without_valid_checks(binary, output_format, capsys):
+    _, success, output = _run(binary, output_format, checks=["nope"])
+
+    assert not success
+    if output_format == "junit":
+        ET.fromstring(output)
+    else:
+        for line in output.splitlines() if output_format == "ndjson" else [output]:
+            json.loads(line)
+    assert "No valid checks found in: nope" in capsys.readouterr().err
+
+
+def test_non_tty_and_quiet_runs_use_no_rich(binary):
+    assert type(get_reporter("text", io.StringIO())) is PlainReporter
+    assert type(Verifier(binary, quiet=True).reporter) is Reporter
+    assert isinstance(get_reporter("json", io.StringIO()), JSONReporter)
+    with pytest.raises(ValueError):
+        get_reporter("yaml")
+
+
+def test_only_report_failures_are_reported_as_saving_errors(binary, tmp_path, monkeypatch, capsys):
+    def args(output):
+        return argparse.Namespace(file=str(binary), checks="checksum", format="json", json=False, output=output)
+
+    assert verify_command(args(str(tmp_path / "missing" / "report.json"))) == 1
+    assert "Error saving report" in capsys.readouterr().err
+
+    if os.path.exists("/dev/full"):
+        assert verify_command(args("/dev/full")) == 1
+        assert "Error saving report" in capsys.readouterr().err
+
+    def cassette_failure(self, **kwargs):
+        raise OSError("cassette directory is read-only")
+
+    monkeypatch.setattr(Verifier, "verify_all", cassette_failure)
+    assert verify_command(args(str(tmp_path / "report.json"))) == 1
+    err = capsys.readouterr().err
+    assert "Error during verification: cassette directory is read-only" in err and "saving report" not in err
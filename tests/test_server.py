@@ -0,0 +1,105 @@
+"""Tests for the Unix socket verification service (provenance-demo serve)."""
+import hashlib
+import logging
+import socket
+import struct
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from demo_cli.cache import StatCache
+from demo_cli.server import UnixVerificationServer, VerificationService, _UnixRequestHandler, request, send_message
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32" or UnixVerificationServer is None,
+    reason="Unix domain sockets not available"
+)
+
+
+@pytest.fixture
+def service_socket():
+    # Keep the socket path short: AF_UNIX paths are limited to ~100 bytes
+    with tempfile.TemporaryDirectory(prefix="pd-") as tmp:
+        socket_path = str(Path(tmp) / "s.sock")
+        service = VerificationService(github_repo="octo/demo", cache=StatCache())
+        server = UnixVerificationServer(socket_path, service)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        yield socket_path, service
+        server.shutdown()
+        server.server_close()
+
+
+def _release(tmp_path: Path) -> Path:
+    binary = tmp_path / "app.pyz"
+    binary.write_bytes(b"release-binary")
+    checksum = hashlib.sha256(b"release-binary").hexdigest()
+    (tmp_path / "checksums.txt").write_text(f"{checksum}  app.pyz\n", encoding="utf-8")
+    return binary
+
+
+def test_verify_request_returns_report(service_socket, tmp_path):
+    socket_path, _ = service_socket
+    binary = _release(tmp_path)
+
+    response = request(socket_path, {"op": "verify", "file": str(binary), "checks": ["checksum"]})
+
+    assert response["ok"]
+    report = response["result"]
+    assert report["passed"] and report["repository"] == "octo/demo"
+    assert report["checks"][0]["check"] == "Checksum Verification"
+
+
+def test_repeated_requests_reuse_warm_cache(service_socket, tmp_path):
+    socket_path, service = service_socket
+    binary = _release(tmp_path)
+
+    for _ in range(3):
+        assert request(socket_path, {"file": str(binary), "checks": ["checksum"]})["ok"]
+
+    # The binary digest and the parsed checksum manifest are each loaded once
+    assert service.cache.misses == 2
+    assert service.cache.hits == 4
+
+
+def test_invalid_requests_return_errors(service_socket):
+    socket_path, _ = service_socket
+
+    assert request(socket_path, {"op": "ping"}) == {"ok": True, "pong": True}
+    assert not request(socket_path, {"op": "verify", "file": "relative.pyz"})["ok"]
+    assert not request(socket_path, {"op": "bogus"})["ok"]
+
+
+def test_oversized_message_is_rejected(service_socket):
+    socket_path, _ = service_socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(struct.pack(">I", 1 << 30))
+        size = struct.unpack(">I", sock.recv(4))[0]
+        assert b"too large" in sock.recv(size)
+
+
+def test_refuses_to_replace_live_socket(service_socket):
+    socket_path, service = service_socket
+
+    with pytest.raises(FileExistsError):
+        UnixVerificationServer(socket_path, service)
+
+
+def test_client_disconnecting_before_the_reply_is_logged(caplog):
+    server_end, client_end = socket.socketpair()
+    send_message(client_end, {"op": "ping"})
+    client_end.close()
+
+    handler = _UnixRequestHandler.__new__(_UnixRequestHandler)
+    handler.request = server_end
+    handler.server = type("Server", (), {"service": VerificationService(cache=StatCache())})()
+    with caplog.at_level(logging.DEBUG, logger="demo_cli.server"):
+        handler.handle()
+    server_end.close()
+
+    assert "disconnected client" in caplog.text
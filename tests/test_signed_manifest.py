@@ -0,0 +1,131 @@
+"""Tests for amortized verification through a signed SHA256SUMS manifest."""
+import hashlib
+import json
+import threading
+
+from benchmarks.run import FAKE_TOOLS
+from demo_cli.cache import StatCache
+from demo_cli.reporters import Reporter
+from demo_cli.signed_manifest import ManifestSignatureCache, workflow_identity_regexp
+from demo_cli.tools import ToolRegistry
+from demo_cli.verify import Verifier
+
+
+def _release(directory, count=5):
+    directory.mkdir()
+    lines = []
+    for i in range(count):
+        data = f"artifact-{i}".encode()
+        (directory / f"app-{i}.pyz").write_bytes(data)
+        lines.append(f"{hashlib.sha256(data).hexdigest()}  app-{i}.pyz")
+    (directory / "SHA256SUMS").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (directory / "SHA256SUMS.bundle").write_text('{"mediaType": "sigstore"}\n', encoding="utf-8")
+    return directory
+
+
+def _verifier(binary, tmp_path, signatures):
+    verifier = Verifier(
+        binary,
+        quiet=True,
+        cache=StatCache(),
+        tools=ToolRegistry(cache_file=tmp_path / "tools.json"),
+        reporter=Reporter(),
+        manifest_signatures=signatures,
+    )
+    verifier.github_repo = "octo/demo"
+    return verifier
+
+
+def _cosign_calls(log):
+    if not log.exists():
+        return []
+    calls = [json.loads(line) for line in log.read_text().splitlines()]
+    return [call["args"] for call in calls if call["tool"] == "cosign" and call["args"][0] == "verify-blob"]
+
+
+def test_one_cosign_call_covers_every_artifact(tmp_path, monkeypatch):
+    log = tmp_path / "calls.jsonl"
+    monkeypatch.setenv("PROVENANCE_TOOL_DIR", str(FAKE_TOOLS))
+    monkeypatch.setenv("PROVENANCE_FAKE_LOG", str(log))
+    release = _release(tmp_path / "release")
+    signatures = ManifestSignatureCache()
+
+    results = []
+    for binary in sorted(release.glob("*.pyz")):
+        verifier = _verifier(binary, tmp_path, signatures)
+        results += [verifier.verify_sigstore_signature(), verifier.verify_certificate_identity()]
+
+    assert all(result.passed for result in results), [r.message for r in results]
+    assert "signed SHA256SUMS" in results[0].message and "(cached)" in results[1].message
+    (args,) = _cosign_calls(log)
+    assert args[1].endswith("SHA256SUMS") and args[args.index("--bundle") + 1].endswith("SHA256SUMS.bundle")
+    assert workflow_identity_regexp("octo/demo") in args
+
+
+def test_tampered_artifact_fails_without_unlisted_fallback(tmp_path, monkeypatch):
+    log = tmp_path / "calls.jsonl"
+    monkeypatch.setenv("PROVENANCE_TOOL_DIR", str(FAKE_TOOLS))
+    monkeypatch.setenv("PROVENANCE_FAKE_LOG", str(log))
+    release = _release(tmp_path / "release", count=1)
+    signatures = ManifestSignatureCache()
+
+    (release / "app-0.pyz").write_bytes(b"tampered")
+    tampered = _verifier(release / "app-0.pyz", tmp_path, signatures).verify_sigstore_signature()
+    assert not tampered.passed and "does not match the signed SHA256SUMS" in tampered.details
+
+    # Artifacts the manifest does not list still need their own bundle
+    (release / "extra.pyz").write_bytes(b"extra")
+    unlisted = _verifier(release / "extra.pyz", tmp_path, signatures).verify_sigstore_signature()
+    assert not unlisted.passed and unlisted.message == "No signature bundle found"
+    assert _cosign_calls(log) == []
+
+
+def test_failed_manifest_signature_is_not_cached(tmp_path, monkeypatch):
+    log = tmp_path / "calls.jsonl"
+    monkeypatch.setenv("PROVENANCE_TOOL_DIR", str(FAKE_TOOLS))
+    monkeypatch.setenv("PROVENANCE_FAKE_LOG", str(log))
+    monkeypatch.setenv("PROVENANCE_FAKE_COSIGN_FAILURE_RATE", "1")
+    release = _release(tmp_path / "release", count=2)
+    signatures = ManifestSignatureCache()
+
+    for binary in sorted(release.glob("*.pyz")):
+        result = _verifier(binary, tmp_path, signatures).verify_sigstore_signature()
+        assert not result.passed and "failed verification" in result.details
+    assert len(_cosign_calls(log)) == 2
+
+
+def test_concurrent_callers_share_one_verification():
+    signatures = ManifestSignatureCache()
+    gate = threading.Event()
+    calls = []
+
+    def run():
+        calls.append(1)
+        gate.wait(5)
+        return True, "verified"
+
+    outcomes = []
+    threads = [threading.Thread(target=lambda: outcomes.append(signatures.verify(("m", "b"), run))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1 and signatures.verifications == 1
+    assert sorted(cached for _, _, cached in outcomes) == [False] + [True] * 7
+
+
+def test_failing_run_does_not_leave_an_inflight_entry():
+    signatures = ManifestSignatureCache()
+
+    def missing_cosign():
+        raise FileNotFoundError("cosign")
+
+    for _ in range(2):
+        try:
+            signatures.verify(("m", "b"), missing_cosign)
+        except FileNotFoundError:
+            pass
+    assert signatures._inflight == {}
+    assert signatures.verify(("m", "b"), lambda: (True, "verified")) == (True, "verified", False)
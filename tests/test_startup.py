@@ -0,0 +1,129 @@
+"""
+Start-up time budget for the CLI.
+
+Shell integrations call ``provenance-demo --version`` and ``hello`` many
+times a minute, so these commands must not import the verification stack or
+rich. Each run is measured with ``python -X importtime`` and checked against
+per-module budgets. The timing budgets depend on machine load, so they run
+only with --run-perf (``make perf``); scale them on slow machines with
+PROVENANCE_STARTUP_BUDGET_SCALE (e.g. 3). The forbidden-module checks are
+deterministic and always run.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+import demo_cli
+from demo_cli.build_pyz import build
+
+SRC_DIR = Path(demo_cli.__file__).resolve().parent.parent
+
+# Modules that must not be imported when starting the CLI for these commands
+FORBIDDEN_MODULES = {
+    "rich",
+    "demo_cli.verify",
+    "demo_cli.server",
+    "demo_cli.http_server",
+    "demo_cli.github_api",
+    "http.client",
+    "ssl",
+}
+
+# Cumulative import time budgets in milliseconds
+MODULE_BUDGETS_MS = {
+    "demo_cli": 10,
+    "demo_cli.cli": 60,
+}
+TOTAL_BUDGET_MS = 150
+
+
+def _budget_scale() -> float:
+    try:
+        return float(os.getenv("PROVENANCE_STARTUP_BUDGET_SCALE", "1"))
+    except ValueError:
+        return 1.0
+
+
+def _parse_importtime(stderr: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Parse -X importtime output into (self, cumulative) microseconds per module."""
+    self_times: Dict[str, int] = {}
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        self_times[name.strip()] = int(self_us)
+        cumulative[name.strip()] = int(cumulative_us)
+    return self_times, cumulative
+
+
+def _import_times(*argv: str) -> Tuple[Dict[str, int], int]:
+    """
+    Run the CLI under -X importtime.
+
+    Returns:
+        Tuple of (cumulative microseconds per module, total self microseconds).
+    """
+    code = (
+        "import sys; from demo_cli.cli import main; "
+        f"sys.argv = ['provenance-demo'] + {list(argv)!r}; sys.exit(main())"
+    )
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    # First run warms the bytecode cache so the measured run is a normal cold start
+    subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, check=True)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+    self_times, cumulative = _parse_importtime(result.stderr)
+    return cumulative, sum(self_times.values())
+
+
+@pytest.mark.parametrize("argv", [("--version",), ("hello", "world")])
+def test_startup_does_not_import_heavy_modules(argv):
+    cumulative, _ = _import_times(*argv)
+
+    imported = {name for name in cumulative if name in FORBIDDEN_MODULES or name.split(".")[0] == "rich"}
+    assert not imported, f"provenance-demo {' '.join(argv)} imported {sorted(imported)}"
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("argv", [("--version",), ("hello", "world")])
+def test_startup_import_time_budget(argv):
+    scale = _budget_scale()
+    cumulative, total_self = _import_times(*argv)
+
+    over_budget = {
+        module: f"{cumulative[module] / 1000:.1f}ms > {budget * scale:.0f}ms"
+        for module, budget in MODULE_BUDGETS_MS.items()
+        if cumulative.get(module, 0) > budget * scale * 1000
+    }
+    assert not over_budget, f"Import time budget exceeded: {over_budget}"
+    assert total_self <= TOTAL_BUDGET_MS * scale * 1000, (
+        f"Total import time {total_self / 1000:.1f}ms exceeds {TOTAL_BUDGET_MS * scale:.0f}ms"
+    )
+
+
+def test_precompiled_bytecode_speeds_up_zipapp_imports(tmp_path):
+    """zipimport cannot cache bytecode, so a .pyz without .pyc compiles on every start."""
+    def package_self_time(pyz: Path) -> int:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import demo_cli.verify"],
+            env=dict(os.environ, PYTHONPATH=str(pyz)), capture_output=True, text=True, check=True,
+        )
+        self_times, _ = _parse_importtime(result.stderr)
+        return sum(us for name, us in self_times.items() if name.startswith("demo_cli"))
+
+    source_pyz = build(SRC_DIR, tmp_path / "src" / "app.pyz", 1700000000, bytecode=False).output
+    bytecode_pyz = build(SRC_DIR, tmp_path / "pyc" / "app.pyz", 1700000000, bytecode=True).output
+    source_only = min(package_self_time(source_pyz) for _ in range(3))
+    precompiled = min(package_self_time(bytecode_pyz) for _ in range(3))
+
+    assert precompiled < source_only / 2, (
+        f"precompiled {precompiled / 1000:.1f}ms vs source-only {source_only / 1000:.1f}ms"
+    )
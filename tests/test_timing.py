@@ -0,0 +1,50 @@
+"""Tests for per-phase check timings."""
+import hashlib
+import time
+
+from demo_cli.cache import StatCache
+from demo_cli.timing import add_bytes, combine, measure, phase
+from demo_cli.verify import Verifier
+
+
+def test_nested_phases_are_exclusive():
+    with measure() as timer:
+        with phase("parse"):
+            time.sleep(0.01)
+            with phase("subprocess:gh"):
+                time.sleep(0.02)
+        add_bytes(10)
+        add_bytes(5)
+
+    assert 10_000_000 <= timer.phases["parse"] < 20_000_000
+    assert timer.phases["subprocess:gh"] >= 20_000_000
+    assert sum(timer.phases.values()) <= timer.total_ns
+    assert timer.to_dict()["bytes_read"] == 15
+
+
+def test_helpers_are_noops_outside_measure():
+    with phase("hash"):
+        add_bytes(100)
+
+    with measure() as timer:
+        pass
+    assert timer.phases == {} and timer.bytes_read == 0
+
+
+def test_report_includes_timings(tmp_path):
+    content = b"x" * 4096
+    binary = tmp_path / "demo.pyz"
+    binary.write_bytes(content)
+    (tmp_path / "checksums.txt").write_text(f"{hashlib.sha256(content).hexdigest()}  {binary.name}\n")
+    (tmp_path / "build-metadata.json").write_text('{"SOURCE_DATE_EPOCH": "1700000000"}')
+
+    verifier = Verifier(binary, quiet=True, cache=StatCache())
+    verifier.version = "1.0.0"
+    verifier.verify_all(["checksum", "reproducible"])
+    report = verifier.to_report(True)
+
+    checksum = report["checks"][0]["timings"]
+    assert "hash" in checksum["phases"]
+    assert checksum["bytes_read"] >= len(content)
+    assert "parse" in report["checks"][1]["timings"]["phases"]
+    assert report["timings"] == combine(check["timings"] for check in report["checks"])
@@ -0,0 +1,75 @@
+"""Tests for external tool discovery and the on-disk capability cache."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from demo_cli.tools import ToolRegistry
+from demo_cli.verify import Verifier
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell scripts as fake tools")
+
+
+def _fake_tool(bin_dir: Path, name: str, version: str) -> Path:
+    tool = bin_dir / name
+    tool.write_text(f"#!/bin/sh\necho 'tool' >> \"$0.calls\"\necho '{name} version {version}'\n")
+    tool.chmod(0o755)
+    return tool
+
+
+def _calls(tool: Path) -> int:
+    calls = Path(f"{tool}.calls")
+    return len(calls.read_text().splitlines()) if calls.exists() else 0
+
+
+def test_version_probe_is_cached_on_disk(tmp_path):
+    tool = _fake_tool(tmp_path, "gh", "2.40.1")
+    cache_file = tmp_path / "tools.json"
+
+    assert ToolRegistry(cache_file, search_path=str(tmp_path)).version("gh") == "2.40.1"
+    assert ToolRegistry(cache_file, search_path=str(tmp_path)).version("gh") == "2.40.1"
+
+    assert _calls(tool) == 1
+
+
+def test_version_cache_invalidated_when_binary_changes(tmp_path):
+    tool = _fake_tool(tmp_path, "cosign", "2.2.0")
+    cache_file = tmp_path / "tools.json"
+    ToolRegistry(cache_file, search_path=str(tmp_path)).version("cosign")
+
+    _fake_tool(tmp_path, "cosign", "2.4.1")
+    stat = tool.stat()
+    os.utime(tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert ToolRegistry(cache_file, search_path=str(tmp_path)).version("cosign") == "2.4.1"
+
+
+def test_missing_tool_fails_check_without_spawning(tmp_path, monkeypatch):
+    binary = tmp_path / "demo.bin"
+    binary.write_bytes(b"binary")
+    (tmp_path / "demo.bin.sigstore").write_text("{}")
+
+    def no_spawn(*args, **kwargs):
+        raise AssertionError("subprocess spawned for a missing tool")
+
+    monkeypatch.setattr(subprocess, "run", no_spawn)
+    empty_dir = tmp_path / "empty"
+    empty_dir.mkdir()
+    verifier = Verifier(binary, tools=ToolRegistry(tmp_path / "tools.json", search_path=str(empty_dir)))
+
+    result = verifier.verify_sigstore_signature()
+
+    assert not result.passed
+    assert "cosign not installed" in result.message
+
+
+def test_capabilities_cover_known_tools(tmp_path):
+    _fake_tool(tmp_path, "osv-scanner", "1.4.3")
+
+    matrix = {info.name: info.to_dict() for info in ToolRegistry(tmp_path / "tools.json", search_path=str(tmp_path)).capabilities()}
+
+    assert set(matrix) == {"cosign", "gh", "osv-scanner"}
+    assert matrix["osv-scanner"]["available"] and matrix["osv-scanner"]["version"] == "1.4.3"
+    assert not matrix["cosign"]["available"] and matrix["cosign"]["install"]
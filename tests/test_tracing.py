@@ -0,0 +1,89 @@
+"""Tests for OTLP-JSON trace export (verify --trace)."""
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from demo_cli.cache import StatCache
+from demo_cli.tools import ToolRegistry
+from demo_cli.tracing import Tracer
+from demo_cli.verify import Verifier
+
+
+def _attributes(span):
+    return {a["key"]: next(iter(a["value"].values())) for a in span["attributes"]}
+
+
+def _traced_run(tmp_path, tracer):
+    content = b"release-binary"
+    binary = tmp_path / "demo.pyz"
+    binary.write_bytes(content)
+    (tmp_path / "checksums.txt").write_text(f"{hashlib.sha256(content).hexdigest()}  {binary.name}\n")
+    (tmp_path / "demo.pyz.sigstore").write_text("{}")
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir(exist_ok=True)
+    cosign = bin_dir / "cosign"
+    cosign.write_text("#!/bin/sh\necho 'error: invalid bundle' >&2\nexit 1\n")
+    cosign.chmod(0o755)
+
+    verifier = Verifier(
+        binary,
+        quiet=True,
+        cache=StatCache(),
+        tools=ToolRegistry(cache_file=tmp_path / "tools.json", search_path=str(bin_dir)),
+        tracer=tracer,
+    )
+    verifier.version = "1.0.0"
+    verifier.verify_all(["checksum", "signature"])
+
+
+def test_spans_form_run_check_phase_tree(tmp_path):
+    tracer = Tracer()
+    _traced_run(tmp_path, tracer)
+    spans = {span["name"]: span for span in tracer.to_otlp()["resourceSpans"][0]["scopeSpans"][0]["spans"]}
+
+    root = spans["verify demo.pyz"]
+    assert "parentSpanId" not in root
+    checksum, signature = spans["check checksum"], spans["check signature"]
+    assert checksum["parentSpanId"] == signature["parentSpanId"] == root["spanId"]
+    assert _attributes(checksum)["verify.check.passed"] is True
+    assert signature["status"]["code"] == 2
+
+    assert spans["hash"]["parentSpanId"] == checksum["spanId"]
+    assert _attributes(spans["hash"])["io.bytes_read"] == str(len(b"release-binary"))
+    cosign = spans["subprocess:cosign"]
+    assert cosign["parentSpanId"] == signature["spanId"]
+    assert _attributes(cosign)["process.exit_code"] == "1"
+    assert {span["traceId"] for span in spans.values()} == {root["traceId"]}
+
+
+def test_export_appends_to_file_and_posts_to_collector(tmp_path):
+    received = []
+
+    class Collector(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append((self.path, json.loads(self.rfile.read(int(self.headers["Content-Length"])))))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Collector)
+    threading.Thread(target=server.handle_request, daemon=True).start()
+
+    tracer = Tracer()
+    _traced_run(tmp_path, tracer)
+    tracer.export(f"http://127.0.0.1:{server.server_address[1]}/v1/traces")
+    server.server_close()
+    assert received[0][0] == "/v1/traces"
+    assert received[0][1]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+    trace_file = tmp_path / "traces" / "verify.jsonl"
+    for _ in range(2):
+        _traced_run(tmp_path, tracer)
+        tracer.export(str(trace_file))
+    lines = trace_file.read_text().splitlines()
+    assert len(lines) == 2 and all(json.loads(line)["resourceSpans"] for line in lines)
+    assert tracer.spans == []